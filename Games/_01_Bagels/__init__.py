@@ -0,0 +1,6 @@
+GAME = {
+    "id": "bagels",
+    "emoji": "🎲",
+    "name": "Bagels",
+    "desc": "Guess the secret number",
+}
@@ -1,5 +1,6 @@
 import random
 import streamlit as st
+from Games.common.state import game_state
 
 
 def generate_secret_number(num_digits):
@@ -98,34 +99,35 @@ def run():
         num_digits, max_guesses, points = 5, 20, 3
 
     # ---------------- SESSION STATE ----------------
-    if "current_level" not in st.session_state:
-        st.session_state.current_level = level
-
-    if st.session_state.current_level != level:
-        st.session_state.current_level = level
-        st.session_state.secret = generate_secret_number(num_digits)
-        st.session_state.guesses = []
-        st.session_state.over = False
-        st.session_state.input_key = 0
-        st.session_state.score = 0
-        st.session_state.moves_used = 0
+    state = game_state("bagels")
+    if "current_level" not in state:
+        state["current_level"] = level
+
+    if state["current_level"] != level:
+        state["current_level"] = level
+        state["secret"] = generate_secret_number(num_digits)
+        state["guesses"] = []
+        state["over"] = False
+        state["input_key"] = 0
+        state["score"] = 0
+        state["moves_used"] = 0
         st.rerun()
 
-    if "secret" not in st.session_state:
-        st.session_state.secret = generate_secret_number(num_digits)
-        st.session_state.guesses = []
-        st.session_state.score = 0
-        st.session_state.over = False
-        st.session_state.input_key = 0
-        st.session_state.moves_used = 0
+    if "secret" not in state:
+        state["secret"] = generate_secret_number(num_digits)
+        state["guesses"] = []
+        state["score"] = 0
+        state["over"] = False
+        state["input_key"] = 0
+        state["moves_used"] = 0
 
     # ---------------- INFO BAR ----------------
-    remaining = max_guesses - st.session_state.moves_used
+    remaining = max_guesses - state["moves_used"]
     
     st.markdown(
         f"""
         <div class="info-bar">
-            <div class="info-chip">🧮 <b>Score</b><br>{st.session_state.score}</div>
+            <div class="info-chip">🧮 <b>Score</b><br>{state["score"]}</div>
             <div class="info-chip">⏳ <b>Remaining</b><br>{remaining}</div>
         </div>
         """,
@@ -136,41 +138,41 @@ def run():
     guess = st.text_input(
         f"Enter {num_digits}-digit guess",
         max_chars=num_digits,
-        key=f"guess_input_{st.session_state.input_key}"
+        key=f"guess_input_{state['input_key']}"
     )
 
-    if st.button("▶ Submit Guess", disabled=st.session_state.over):
+    if st.button("▶ Submit Guess", disabled=state["over"]):
      if len(guess) == num_digits and guess.isdigit():
-        clue = get_clues(guess, st.session_state.secret)
-        st.session_state.guesses.append((guess, clue))
-        st.session_state.moves_used += 1  # one move per submit
+        clue = get_clues(guess, state["secret"])
+        state["guesses"].append((guess, clue))
+        state["moves_used"] += 1  # one move per submit
 
         if clue == "🎉 You got it!":
-            st.success(f"🎯 Correct! The number was **{st.session_state.secret}**")
-            st.session_state.score += points
-            st.session_state.over = True
+            st.success(f"🎯 Correct! The number was **{state['secret']}**")
+            state["score"] += points
+            state["over"] = True
 
-        elif st.session_state.moves_used >= max_guesses:
-            st.error(f"❌ Out of guesses! The number was **{st.session_state.secret}**")
-            st.session_state.over = True
+        elif state["moves_used"] >= max_guesses:
+            st.error(f"❌ Out of guesses! The number was **{state['secret']}**")
+            state["over"] = True
 
         st.rerun()  # 🔑 force UI to update immediately
 
 
     # ---------------- GUESS HISTORY ----------------
-    if st.session_state.guesses:
+    if state["guesses"]:
         st.markdown("### 🧾 Your Guesses")
-        for g, c in st.session_state.guesses[::-1]:
+        for g, c in state["guesses"][::-1]:
             st.markdown(f"**{g}** → {c}")
 
     # ---------------- PLAY AGAIN ----------------
-    if st.session_state.over:
+    if state["over"]:
         if st.button("🔁 Play Again"):
-            st.session_state.secret = generate_secret_number(num_digits)
-            st.session_state.guesses = []
-            st.session_state.moves_used = 0
-            st.session_state.over = False
-            st.session_state.input_key += 1
+            state["secret"] = generate_secret_number(num_digits)
+            state["guesses"] = []
+            state["moves_used"] = 0
+            state["over"] = False
+            state["input_key"] += 1
             st.rerun()
 
     st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,6 @@
+GAME = {
+    "id": "birthday",
+    "emoji": "🎂",
+    "name": "Birthday Paradox",
+    "desc": "Probability simulation",
+}
@@ -0,0 +1,116 @@
+"""Bucket distributions for the collision simulator ("calendars").
+
+A calendar is a plain dict:
+
+    {"name": "365 days", "buckets": 365, "weights": None, "alias": None, "labels": [...]}
+
+``weights`` (normalised probabilities) and ``alias`` are ``None`` for a
+uniform calendar, which is sampled with one ``integers`` call. Non-uniform
+calendars carry an ``AliasTable`` so drawing stays O(1) per value however
+many buckets there are. ``labels`` is a list of ``(month, day)`` for real
+calendars and ``None`` for hash buckets.
+"""
+
+import calendar as _calendar
+import csv
+
+import numpy as np
+
+DAYS = 365
+LEAP_DAY_WEIGHT = 0.25  # Feb 29 comes round once every four years
+
+
+# ------------------ Alias sampling ------------------
+class AliasTable:
+    """Walker/Vose alias table: draws from ``weights`` with one uniform index + one coin."""
+
+    def __init__(self, weights):
+        p = np.asarray(weights, dtype=float)
+        if p.ndim != 1 or not len(p) or (p < 0).any() or not p.sum() > 0:
+            raise ValueError("weights must be a non-empty list of non-negative numbers")
+        n = len(p)
+        scaled = p * (n / p.sum())
+        self.prob = np.ones(n)
+        self.alias = np.arange(n)
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+        while small and large:
+            s, g = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = g
+            scaled[g] -= 1.0 - scaled[s]
+            (small if scaled[g] < 1.0 else large).append(g)
+        # Leftovers are 1 up to rounding error.
+        self.n = n
+
+    def sample(self, rng, size, dtype=np.int64):
+        column = rng.integers(0, self.n, size)
+        coin = rng.random(size)
+        return np.where(coin < self.prob[column], column, self.alias[column]).astype(dtype, copy=False)
+
+
+# ------------------ Calendars ------------------
+def _month_days(year):
+    return [(m, d) for m in range(1, 13) for d in range(1, _calendar.monthrange(year, m)[1] + 1)]
+
+
+def uniform(buckets=DAYS):
+    labels = _month_days(2001) if buckets == DAYS else None
+    name = "365 days" if buckets == DAYS else f"{buckets:,} buckets"
+    return {"name": name, "buckets": int(buckets), "weights": None, "alias": None, "labels": labels}
+
+
+def weighted(name, weights, labels=None):
+    weights = np.asarray(weights, dtype=float)
+    return {"name": name, "buckets": len(weights), "weights": weights / weights.sum(),
+            "alias": AliasTable(weights), "labels": labels}
+
+
+def leap_weighted():
+    """366 days with Feb 29 at a quarter of the weight of any other day."""
+    labels = _month_days(2000)
+    return weighted("366 days (leap-day weighted)",
+                    [LEAP_DAY_WEIGHT if day == (2, 29) else 1.0 for day in labels], labels)
+
+
+def hash_buckets(bits):
+    return uniform(2 ** bits) | {"name": f"2^{bits} hash buckets"}
+
+
+def empirical(lines, name="Empirical births"):
+    """Calendar from a births CSV (any iterable of text lines).
+
+    Needs a count column (``births`` or ``count``) and either ``month`` plus
+    ``day``/``date_of_month``, or a ``date`` column (``YYYY-MM-DD`` or
+    ``MM-DD``). Rows for the same day are summed, so a multi-year table works.
+    """
+    reader = csv.DictReader(lines)
+    fields = {f.strip().lower(): f for f in reader.fieldnames or ()}
+    count = fields.get("births") or fields.get("count")
+    day = fields.get("day") or fields.get("date_of_month")
+    if not count or not (fields.get("date") or (fields.get("month") and day)):
+        raise ValueError("CSV needs a births/count column and month+day or date columns")
+
+    totals = {}
+    for row in reader:
+        try:
+            if fields.get("month") and day:
+                key = (int(row[fields["month"]]), int(row[day]))
+            else:
+                key = tuple(int(part) for part in row[fields["date"]].split("-")[-2:])
+            totals[key] = totals.get(key, 0.0) + float(row[count])
+        except (TypeError, ValueError):
+            raise ValueError(f"bad CSV row: {row}") from None
+    valid = {k: v for k, v in totals.items() if k in set(_month_days(2000)) and v > 0}
+    if not valid:
+        raise ValueError("CSV has no usable (month, day, count) rows")
+    labels = sorted(valid)
+    return weighted(name, [valid[k] for k in labels], labels)
+
+
+def dtype_for(buckets):
+    """Smallest int dtype that holds every bucket index."""
+    for dtype in (np.int16, np.int32):
+        if buckets <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
@@ -0,0 +1,293 @@
+"""Birthday Paradox Monte Carlo, free of Streamlit.
+
+Trials are simulated as a ``(trials x group_size)`` matrix of bucket
+(day-of-year) ints drawn in one call, sorted in place along each row; a
+group has a ``k``-way collision iff some sorted row holds the same value
+at positions ``i`` and ``i + k - 1``. Trials are processed in chunks of at
+most ``CHUNK_CELLS`` values, so memory stays flat however many trials are
+asked for. Each value is still drawn independently from the calendar, i.e.
+the same distribution as filling one ``set`` per group.
+
+Calendars (``calendars.py``) can be the uniform 365-day year, a
+leap-day-weighted 366-day year, an empirical births table or ``2^bits``
+hash buckets; non-uniform ones are sampled through an alias table. From
+``ANALYTIC_BUCKETS`` buckets up nothing is simulated:
+``analytic_probabilities`` gives the exact product (uniform, pairs) or a
+Poisson approximation.
+
+``calculate_probabilities`` builds the whole probability-by-group-size
+curve from shared batches, with Wilson intervals and the analytic curve
+alongside.
+
+The ``simulate``/``probability_curve`` entry points run in the job pool
+(``Games.common.jobs``) with their own seed.
+"""
+
+import math
+
+import numpy as np
+
+from Games.common.profiling import profiled
+from Games.common.results import ResultSink
+from Games.common.rng import Rng
+from Games.common.state import limit
+
+from . import calendars
+
+DAYS = calendars.DAYS
+CHUNK_CELLS = limit("birthday.chunk_cells", 4_000_000)
+MAX_TRIALS = limit("birthday.trials", 10_000_000)
+MAX_ITEMS = limit("birthday.items", 1_000_000)  # largest group simulated
+
+# Probability curve: sample each group size until its 95% CI is this wide.
+Z = 1.96
+CI_WIDTH = 0.02
+CURVE_BATCH = 4096
+CURVE_MAX_TRIALS = limit("birthday.curve_trials", 200_000)
+
+# Analytic path: bucket counts this large are never simulated, and the
+# exact pair product is summed term by term only up to EXACT_MAX people.
+ANALYTIC_BUCKETS = 2 ** 32
+EXACT_MAX = 1_000_000
+
+
+# ------------------ Vectorized core ------------------
+def draw_days(rng, trials, group_size, cal=None):
+    """``(trials, group_size)`` matrix of buckets drawn from ``cal`` (default: 365 days)."""
+    cal = cal or calendars.uniform()
+    dtype = calendars.dtype_for(cal["buckets"])
+    if cal["alias"] is not None:
+        return cal["alias"].sample(rng.np, (trials, group_size), dtype)
+    return rng.np.integers(0, cal["buckets"], (trials, group_size), dtype=dtype)
+
+
+def duplicate_flags(days, k=2):
+    """Per-row ``(matched, distinct)`` for ``k``-way collisions; sorts ``days`` in place."""
+    days.sort(axis=1)
+    same = days[:, 1:] == days[:, :-1]
+    matched = (days[:, k - 1:] == days[:, :1 - k]).any(axis=1) if k > 2 else same.any(axis=1)
+    return matched, days.shape[1] - same.sum(axis=1)
+
+
+def chunk_rows(group_size):
+    return max(1, CHUNK_CELLS // max(1, group_size))
+
+
+def needs_analytic(cal):
+    return cal["buckets"] >= ANALYTIC_BUCKETS
+
+
+@profiled("birthday.count_matches")
+def count_matches(group_size, trials, rng, sink=None, progress=None, k=2, cal=None,
+                  on_chunk=None):
+    """How many of ``trials`` random groups hold ``k`` people on one bucket.
+
+    With a ``ResultSink("birthday.trials")`` every trial is also recorded;
+    ``progress`` (a ``tqdm``-like bar) is advanced and ``on_chunk(trials_done,
+    matches)`` called once per chunk.
+    """
+    if cal is not None and needs_analytic(cal):
+        raise ValueError(f"{cal['name']}: too many buckets to simulate; use analytic_probabilities")
+    if group_size < k:
+        if progress is not None:
+            progress.update(trials)
+        return 0  # too few people to collide (and nothing to record but misses)
+
+    matches = 0
+    step = chunk_rows(group_size)
+    for done in range(0, trials, step):
+        rows = min(step, trials - done)
+        matched, distinct = duplicate_flags(draw_days(rng, rows, group_size, cal), k)
+        matches += int(matched.sum())
+        if sink is not None:
+            sink.write(group_size=group_size, trial=np.arange(done, done + rows),
+                       matched=matched, distinct_days=distinct)
+        if on_chunk is not None:
+            on_chunk(done + rows, matches)
+        if progress is not None:
+            progress.update(rows)
+    return matches
+
+
+# ------------------ Analytic ------------------
+def _poisson_tails(means, k):
+    """P(Poisson(m) >= k) for each mean ``m``."""
+    m = np.asarray(means, dtype=float)[:, None]
+    j = np.arange(k + 40)
+    log_fact = np.array([math.lgamma(x + 1) for x in j])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pmf = np.exp(-m + j * np.log(m) - log_fact)
+    pmf = np.nan_to_num(pmf)  # mean 0: all mass at 0, nothing in the tail
+    # Large means: 1 - cdf. Small means: sum the tail directly, 1 - cdf would round to zero.
+    tail = np.where(m[:, 0] > 1, 1.0 - pmf[:, :k].sum(axis=1), pmf[:, k:].sum(axis=1))
+    return np.clip(tail, 0.0, 1.0)
+
+
+def _no_collision_log(g, k, buckets, weights):
+    """log P(no bucket holds ``k`` of ``g``), bucket loads taken as independent Poissons."""
+    if weights is None:
+        tail = _poisson_tails([g / buckets], k)[0]
+        return -math.inf if tail >= 1 else buckets * math.log1p(-tail)
+    tails = _poisson_tails(g * weights, k)
+    return -math.inf if (tails >= 1).any() else float(np.log1p(-tails).sum())
+
+
+def _weighted_distinct(sizes, weights):
+    """P(all ``g`` draws distinct) = ``g! * e_g(p)``, ``e_g`` the elementary symmetric polynomial."""
+    top = int(max(sizes))
+    scaled = weights * len(weights)  # mean 1, keeps e_g in float range
+    e = np.zeros(top + 1)
+    e[0] = 1.0
+    for q in scaled:
+        e[1:] = e[1:] + q * e[:-1]
+    out = []
+    for g in sizes:
+        g = int(g)
+        log_terms = math.lgamma(g + 1) - g * math.log(len(weights))
+        out.append(math.exp(log_terms + math.log(e[g])) if e[g] > 0 else 0.0)
+    return np.array(out)
+
+
+def is_exact(sizes, k=2, cal=None):
+    """Whether ``analytic_probabilities`` is exact (not an approximation) for these inputs."""
+    cal = cal or calendars.uniform()
+    if k != 2:
+        return False
+    if cal["weights"] is None:
+        return max(sizes) <= EXACT_MAX
+    return cal["buckets"] * max(sizes) <= EXACT_MAX * 10
+
+
+def analytic_probabilities(sizes, k=2, cal=None):
+    """P(some ``k``-way collision) for each group size in ``sizes``, without sampling.
+
+    Pairs are exact: ``1 - prod_{i<g} (1 - i/N)`` when uniform, the
+    elementary symmetric polynomial of the weights when not (small tables
+    only). Otherwise each bucket's load is taken as an independent
+    Poisson(``g * p_i``) and the result is ``1 - prod_i P(load_i < k)``.
+    """
+    cal = cal or calendars.uniform()
+    sizes = np.asarray(sizes)
+    buckets = float(cal["buckets"])
+    if is_exact(sizes, k, cal) and cal["weights"] is not None:
+        return 1.0 - _weighted_distinct(sizes, cal["weights"])
+    if is_exact(sizes, k, cal):
+        top = int(sizes.max())
+        # Clamped at -1: from i == buckets on the log is -inf, so P = 1 past the pigeonhole.
+        with np.errstate(divide="ignore"):
+            log_distinct = np.r_[0.0, np.cumsum(np.log1p(-np.minimum(np.arange(top) / buckets, 1.0)))]
+        return 1.0 - np.exp(log_distinct[sizes.astype(np.int64)])
+    return np.array([-math.expm1(_no_collision_log(g, k, buckets, cal["weights"])) if g >= k
+                     else 0.0 for g in sizes.tolist()])
+
+
+def analytic_curve(k=2, cal=None, points=60):
+    """Analytic-only curve from ``k`` people to where a collision is all but certain."""
+    top = float(k)
+    while analytic_probabilities([top], k, cal)[0] < 0.999 and top < 1e30:
+        top *= 2
+    sizes = np.unique(np.geomspace(k, top, points).round())
+    values = analytic_probabilities(sizes, k, cal)
+    return {"sizes": sizes.tolist(), "exact": values.tolist(),
+            "reference": "Exact" if is_exact(sizes, k, cal) else "Approximation"}
+
+
+# ------------------ Probability curve ------------------
+def wilson(k, n, z=Z):
+    """Wilson score interval ``(low, high)`` for ``k`` successes in ``n`` trials."""
+    k, n = np.asarray(k, dtype=float), np.asarray(n, dtype=float)
+    p = k / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return centre - half, centre + half
+
+
+def first_collisions(days, k=2):
+    """Smallest group size (prefix of each row) with a ``k``-way collision; ``width + 1`` if none.
+
+    A stable argsort keeps equal days in draw order, so wherever sorted
+    positions ``i`` and ``i + k - 1`` hold the same day, the original index
+    at ``i + k - 1`` is where that day is drawn for the ``k``-th time; the
+    row's first collision is the minimum over such positions.
+    """
+    order = np.argsort(days, axis=1, kind="stable")
+    ranked = np.take_along_axis(days, order, axis=1)
+    same = ranked[:, k - 1:] == ranked[:, :1 - k]
+    width = days.shape[1]
+    return np.where(same, order[:, k - 1:], width).min(axis=1, initial=width) + 1
+
+
+@profiled("birthday.calculate_probabilities")
+def calculate_probabilities(a, b, rng, width=CI_WIDTH, max_trials=CURVE_MAX_TRIALS,
+                            batch=CURVE_BATCH, k=2, cal=None, progress=None):
+    """Simulated P(match) for group sizes ``a..b-1`` with Wilson CIs and the analytic curve.
+
+    Every row of a batch is one draw of ``b - 1`` people; its first-collision
+    size answers "matched?" for every group size at once (group ``g`` is the
+    first ``g`` people). A size stops counting once its CI is narrower than
+    ``width`` (or after ``max_trials``), and batches only draw as many people
+    as the largest size still sampling.
+    """
+    sizes = np.arange(a, b)
+    n = np.zeros(len(sizes), dtype=np.int64)
+    hits = np.zeros(len(sizes), dtype=np.int64)
+    active = np.ones(len(sizes), dtype=bool)
+    draws = 0
+    if progress is not None:
+        progress.total = len(sizes)
+    while active.any():
+        top = int(sizes[active].max())
+        first = first_collisions(draw_days(rng, batch, top, cal), k)
+        draws += batch * top
+        # Matches per size: rows whose first collision is at or below it.
+        counts = np.searchsorted(np.sort(first), sizes[active], side="right")
+        n[active] += batch
+        hits[active] += counts
+        low, high = wilson(hits, n)
+        done = active & ((high - low <= width) | (n >= max_trials))
+        if progress is not None and done.any():
+            progress.update(int(done.sum()))
+        active &= ~done
+    low, high = wilson(hits, n)
+    return {
+        "sizes": sizes.tolist(),
+        "values": (hits / n).tolist(),
+        "low": low.tolist(),
+        "high": high.tolist(),
+        "exact": analytic_probabilities(sizes, k, cal).tolist(),
+        "reference": "Exact" if is_exact(sizes, k, cal) else "Approximation",
+        "trials": n.tolist(),
+        "draws": draws,
+    }
+
+
+# ------------------ Background jobs ------------------
+# Each gets its own seed drawn from the session's Rng, so a session still
+# replays from its seed.
+def simulate(group_size, trials, seed, record=False, k=2, cal=None, progress=None):
+    """``(matches, parquet_path_or_None)`` for ``trials`` groups of ``group_size``.
+
+    Under the job pool the running ``trials``/``matches`` (and the Parquet
+    ``path``) are published after every chunk, so the page can show the
+    estimate converge and keep it if the run is stopped.
+    """
+    rng = Rng(seed)
+    publish = getattr(progress, "publish", None)
+    on_chunk = (lambda done, matches: publish(trials=done, matches=matches)) if publish else None
+    if progress is not None:
+        progress.total = trials
+    if not record:
+        return count_matches(group_size, trials, rng, progress=progress, k=k, cal=cal,
+                             on_chunk=on_chunk), None
+    # Trials stream to disk chunk by chunk; only the path comes back.
+    with ResultSink("birthday.trials") as sink:
+        if publish:
+            publish(path=sink.path)
+        matches = count_matches(group_size, trials, rng, sink=sink, progress=progress,
+                                k=k, cal=cal, on_chunk=on_chunk)
+    return matches, sink.path
+
+
+def probability_curve(a, b, seed, width=CI_WIDTH, k=2, cal=None, progress=None):
+    return calculate_probabilities(a, b, Rng(seed), width=width, k=k, cal=cal, progress=progress)
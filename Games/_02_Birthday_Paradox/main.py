@@ -1,7 +1,18 @@
 import streamlit as st
 import datetime
-import random
-import matplotlib.pyplot as plt
+import io
+from pathlib import Path
+
+from Games.common import charts, jobs
+from Games.common.rng import session_rng
+from Games.common.series import downsample
+from Games.common.state import limit, trim
+
+from . import calendars
+from .engine import (
+    CI_WIDTH, MAX_ITEMS, MAX_TRIALS, analytic_curve, analytic_probabilities, draw_days,
+    is_exact, needs_analytic, probability_curve, simulate, wilson,
+)
 
 def run():
 
@@ -43,29 +54,96 @@ def run():
     **Birthday Paradox** shows how fast probability rises — even with small groups 🎉
     """)
 
-    numBDays = st.number_input(
-        "👥 Number of people (1–100)",
-        1, 100, 23
-    )
+    cal, k = collision_model()
+    hashing = cal["labels"] is None
+
+    if hashing:
+        numBDays = st.number_input("🔑 Items hashed", 2, 10 ** 15, 2 ** 16)
+    else:
+        numBDays = st.number_input(
+            "👥 Number of people (1–100)",
+            1, 100, 23
+        )
 
     simulations = st.number_input(
         "🔁 Simulations to run",
-        100, 100000, 10000, step=100
+        100, MAX_TRIALS, 10000, step=100
     )
 
-    if st.button("▶ Run Simulation"):
-        birthdays = getBirthdays(numBDays)
-        match = getMatch(birthdays)
-
-        st.session_state["birthdays"] = birthdays
-        st.session_state["match"] = match
-        st.session_state["numBDays"] = numBDays
-        st.session_state["simulations"] = simulations
-        st.session_state["simMatch"] = sum(
-            1 for _ in range(simulations)
-            if getMatch(getBirthdays(numBDays))
+    # Past 2^32 buckets (or MAX_ITEMS items) the answer comes from the formula.
+    analytic = needs_analytic(cal) or numBDays > MAX_ITEMS
+    if analytic:
+        st.caption("Too large to simulate: the probability is computed analytically.")
+
+    record = st.checkbox("💾 Record every trial (Parquet)", value=False, disabled=analytic)
+
+    rng = session_rng("birthday")
+
+    # Fold a job that just ended into the run first, so the buttons below
+    # see the run as it now stands.
+    run = st.session_state.get("simRun")
+    status, value = jobs.collect(st.session_state, "simJob")
+    if status == "done":
+        matches, path = value
+        fold(run, st.session_state.pop("simAdding"), matches, path)
+    elif status == "cancelled":
+        st.session_state.pop("simAdding", None)
+        info = value.progress()
+        fold(run, info.get("trials", 0), info.get("matches", 0), info.get("path"))
+        st.info(f"Stopped at {run['trials']:,} trials. ➕ Add more to resume from here.")
+    elif status == "error":
+        st.session_state.pop("simAdding", None)
+        st.error(f"Simulation failed: {value}")
+
+    # A finished or stopped run can be extended with the same model.
+    resumable = (
+        run is not None and "simJob" not in st.session_state and not analytic
+        and st.session_state.get("simModel") == (cal["name"], k)
+        and st.session_state.get("numBDays") == numBDays
+    )
+
+    col_run, col_more = st.columns(2)
+    start = col_run.button("▶ Run Simulation")
+    more = col_more.button(
+        f"➕ Add {simulations:,} trials", disabled=not resumable,
+        help="Keep the trials already run and simulate more with the same settings.",
+    )
+
+    if start:
+        birthdays = None if hashing else getBirthdays(numBDays, rng, cal)
+        jobs.cancel(st.session_state, "simJob")
+        st.session_state.update({
+            "birthdays": birthdays,
+            "match": getMatch(birthdays, k) if birthdays else None,
+            "numBDays": numBDays,
+            "simModel": (cal["name"], k),
+            "simExact": analytic_probabilities([numBDays], k, cal)[0],
+            "simReference": "Exact" if is_exact([numBDays], k, cal) else "Approximation",
+            "simRun": None if analytic else new_run(),
+        })
+        run = st.session_state["simRun"]
+
+    if run is not None and (start or (more and resumable)):
+        # The trials run in the job pool; partial counts stream back through
+        # the job's progress and are folded into ``run`` when it ends.
+        st.session_state["simAdding"] = simulations
+        st.session_state["simJob"] = jobs.submit(
+            simulate, numBDays, simulations, rng.getrandbits(63), record, k, cal,
+            label=f"Simulating {simulations:,} groups",
         )
 
+    exact = st.session_state.get("simExact")
+    reference = st.session_state.get("simReference", "Exact")
+
+    def live(info):
+        if info.get("trials"):
+            add_point(run, run["trials"] + info["trials"], run["matches"] + info["matches"])
+        show_estimate(run, exact, reference, native=True)
+
+    if "simJob" in st.session_state:
+        jobs.progress_panel(st.session_state["simJob"], key="birthday_sim", extra=live,
+                            cancel_label="⏹ Stop here")
+
     st.markdown('</div>', unsafe_allow_html=True)
 
     # ---------------- RESULTS ----------------
@@ -76,81 +154,235 @@ def run():
         birthdays = st.session_state["birthdays"]
         match = st.session_state["match"]
         numBDays = st.session_state["numBDays"]
-        simulations = st.session_state["simulations"]
-        simMatch = st.session_state["simMatch"]
+        model, shared = st.session_state.get("simModel", ("365 days", 2))
+
+        if birthdays:
+            st.subheader("🎈 Generated Birthdays")
+            st.write(", ".join([f"{b.day} {b.strftime('%b')}" for b in birthdays]))
+
+            if match:
+                st.success(f"🎉 Match found on **{match.day} {match.strftime('%b')}**!")
+            else:
+                st.info("No matching birthdays in this simulation.")
+
+        lines = [f"- Model: **{model}**, collision = **{shared}** on one bucket",
+                 f"- People per group: **{numBDays:,}**"]
+        if run is not None and run["trials"]:
+            probability = round(run["matches"] / run["trials"] * 100, 2)
+            lines += [f"- Simulations run: **{run['trials']}**",
+                      f"- Matches found: **{run['matches']}**",
+                      f"- Probability: **{probability}%**"]
+        if exact is not None:
+            lines.append(f"- {reference} probability: **{exact * 100:.4g}%**")
+        st.markdown("**Results**\n" + "\n".join(lines))
+
+        # While a job runs, its progress panel shows the live estimate instead.
+        if run is not None and run["history"] and "simJob" not in st.session_state:
+            show_estimate(run, exact, reference, native=charts.NATIVE)
+
+        for part, trials_file in enumerate(run["files"] if run else [], 1):
+            if Path(trials_file).exists():
+                st.download_button(
+                    f"📥 Download trials, part {part} (Parquet)",
+                    data=Path(trials_file).read_bytes,
+                    file_name=Path(trials_file).name,
+                    mime="application/vnd.apache.parquet",
+                    key=f"birthday_trials_{part}",
+                )
 
-        st.subheader("🎈 Generated Birthdays")
-        st.write(", ".join([f"{b.day} {b.strftime('%b')}" for b in birthdays]))
+        st.markdown('</div>', unsafe_allow_html=True)
 
-        if match:
-            st.success(f"🎉 Match found on **{match.day} {match.strftime('%b')}**!")
+        # ---------------- GRAPH CARD ----------------
+        st.markdown('<div class="bp-card">', unsafe_allow_html=True)
+        st.subheader("📊 Probability by Group Size")
+
+        if hashing:
+            # Group sizes that matter for hashing span orders of magnitude.
+            st.session_state["probabilities"] = analytic_curve(k, cal)
         else:
-            st.info("No matching birthdays in this simulation.")
+            a, b = st.slider(
+                "Group size range",
+                2, 100, (5, 70)
+            )
+
+            if st.session_state.get("last_range") != (a, b, cal["name"], k):
+                st.session_state["last_range"] = (a, b, cal["name"], k)
+                jobs.cancel(st.session_state, "curveJob")
+                st.session_state["curveJob"] = jobs.submit(
+                    probability_curve, a, b, rng.getrandbits(63), k=k, cal=cal,
+                    label="Sampling group sizes",
+                )
+
+            status, value = jobs.collect(st.session_state, "curveJob")
+            if status == "running":
+                jobs.progress_panel(value, key="birthday_curve")
+            elif status == "done":
+                st.session_state["probabilities"] = value
+            elif status == "error":
+                st.error(f"Sampling failed: {value}")
+
+        if "probabilities" in st.session_state:
+            native = st.checkbox("Interactive chart", value=charts.NATIVE)
+            show_curve(st.session_state["probabilities"], native, log_x=hashing)
 
-        probability = round(simMatch / simulations * 100, 2)
+        st.markdown('</div>', unsafe_allow_html=True)
 
-        st.markdown(f"""
-        **Results**
-        - Simulations run: **{simulations}**
-        - People per group: **{numBDays}**
-        - Matches found: **{simMatch}**
-        - Probability: **{probability}%**
-        """)
+    st.markdown('</div>', unsafe_allow_html=True)
 
-        st.markdown('</div>', unsafe_allow_html=True)
 
-        # ---------------- GRAPH CARD ----------------
-        st.markdown('<div class="bp-card">', unsafe_allow_html=True)
-        st.subheader("📊 Probability by Group Size")
+# ---------------- RUNNING ESTIMATE ----------------
+# A run accumulates over jobs: "Add trials" submits more with a fresh seed
+# and the counts are summed, so nothing already simulated is redone.
+HISTORY = limit("birthday.history", 2000)
+STABLE = 0.005  # 95% CI half-width at which the estimate is called stable
 
-        a, b = st.slider(
-            "Group size range",
-            2, 100, (5, 70)
-        )
 
-        if "probabilities" not in st.session_state or st.session_state.get("last_range") != (a, b):
-            st.session_state["last_range"] = (a, b)
-            st.session_state["probabilities"] = calculate_probabilities(a, b)
+def new_run():
+    return {"trials": 0, "matches": 0, "history": [], "files": []}
 
-        fig, ax = plt.subplots(figsize=(6, 4))
-        ax.plot(
-            st.session_state["probabilities"]["sizes"],
-            st.session_state["probabilities"]["values"]
-        )
-        ax.set_xlabel("Group Size")
-        ax.set_ylabel("Probability of a Match")
-        ax.set_title("Birthday Paradox Simulation")
 
-        st.pyplot(fig, use_container_width=True)
+def add_point(run, trials, matches):
+    """Record ``(trials, matches)`` on the convergence history (cumulative counts)."""
+    if trials and (not run["history"] or trials > run["history"][-1][0]):
+        run["history"].append((trials, matches))
+        trim(run["history"], HISTORY)
 
-        st.markdown('</div>', unsafe_allow_html=True)
 
-    st.markdown('</div>', unsafe_allow_html=True)
+def fold(run, trials, matches, path=None):
+    """Add a finished (or stopped) job's counts to the run."""
+    run["trials"] += trials
+    run["matches"] += matches
+    add_point(run, run["trials"], run["matches"])
+    if path:
+        run["files"].append(path)
+
 
+def show_estimate(run, exact=None, reference="Exact", native=False):
+    """Current estimate with its 95% interval, and how it converged."""
+    if not run["history"]:
+        return
+    trials, matches = run["history"][-1]
+    (low,), (high,) = wilson([matches], [trials])
+    half = (high - low) / 2
+    st.metric(
+        "Estimated probability", f"{matches / trials:.2%}",
+        delta=f"±{half:.2%} (95%)", delta_color="off",
+        help=f"After {trials:,} trials.",
+    )
+    if half <= STABLE:
+        st.caption(f"✅ Stable: the 95% interval is within ±{STABLE:.1%}.")
+    if len(run["history"]) < 2:
+        return  # a run that finished in one chunk has nothing to converge
+
+    ns, ps = downsample([m / n for n, m in run["history"]],
+                        x=[n for n, _ in run["history"]])
+    lows, highs = wilson([p * n for n, p in zip(ns, ps)], ns)
+    if native:
+        data = {"Trials": ns, "Estimate": ps}
+        if exact is not None:
+            data[reference] = [exact] * len(ns)
+        st.line_chart(data, x="Trials")
+        return
+
+    def draw(fig):
+        ax = fig.subplots()
+        ax.fill_between(ns, lows, highs, alpha=0.3, label="95% CI")
+        ax.plot(ns, ps, marker=".", label="Estimate")
+        if exact is not None:
+            ax.axhline(exact, color="k", linestyle="--", linewidth=1, label=reference)
+        ax.set_xscale("log")
+        ax.set_title("Convergence")
+        ax.set_xlabel("Trials")
+        ax.set_ylabel("Probability of a Match")
+        ax.legend(loc="best")
+
+    charts.show_chart(("birthday.convergence", ns, ps, exact), draw, figsize=(6, 3),
+                      use_container_width=True)
+
+
+# ---------------- COLLISION MODEL ----------------
+MODELS = ["365 days", "Leap-day weighted (366)", "Empirical CSV", "Hash buckets"]
+
+
+def collision_model():
+    """Calendar and collision size ``k`` picked in the "Collision model" expander."""
+    with st.expander("🧮 Collision model"):
+        kind = st.radio("Buckets", MODELS, horizontal=True)
+        k = st.number_input("People sharing one bucket (k)", 2, 10, 2)
+        if kind == MODELS[1]:
+            return calendars.leap_weighted(), k
+        if kind == MODELS[2]:
+            upload = st.file_uploader(
+                "Births CSV (month, day or date_of_month, births)", type="csv",
+            )
+            if upload is None:
+                st.caption("No file yet: using 365 uniform days.")
+                return calendars.uniform(), k
+            try:
+                return calendars.empirical(io.StringIO(upload.getvalue().decode("utf-8")),
+                                           name=upload.name), k
+            except ValueError as exc:
+                st.error(f"Could not read {upload.name}: {exc}")
+                return calendars.uniform(), k
+        if kind == MODELS[3]:
+            bits = st.slider("Buckets (2^bits)", 8, 128, 32)
+            return calendars.hash_buckets(bits), k
+    return calendars.uniform(), k
+
+
+# ---------------- CURVE ----------------
+def show_curve(curve, native=False, log_x=False):
+    """Simulated curve with its 95% band, the exact probability on top.
+
+    Analytic-only curves (no ``values``) draw just the reference line.
+    """
+    sizes, values, exact = curve["sizes"], curve.get("values"), curve["exact"]
+    reference = curve.get("reference", "Exact")
+    if values is not None:
+        st.caption(
+            f"{sum(curve['trials']):,} group samples from {curve['draws']:,} drawn birthdays; "
+            f"each size sampled until its 95% interval is under {CI_WIDTH:.0%} wide."
+        )
+    else:
+        st.caption(f"{reference} probability; nothing is simulated at this size.")
+    if native:
+        data = {"Group Size": sizes, reference: exact}
+        if values is not None:
+            data.update({"Simulated": values, "95% low": curve["low"], "95% high": curve["high"]})
+        st.line_chart(data, x="Group Size")
+        return
+
+    def draw(fig):
+        ax = fig.subplots()
+        if values is not None:
+            ax.fill_between(sizes, curve["low"], curve["high"], alpha=0.3, label="95% CI")
+            ax.plot(sizes, values, marker=".", label="Simulated")
+        ax.plot(sizes, exact, "k--", linewidth=1, label=reference)
+        if log_x:
+            ax.set_xscale("log")
+        ax.set_title("Birthday Paradox Simulation")
+        ax.set_xlabel("Group Size")
+        ax.set_ylabel("Probability of a Match")
+        ax.legend(loc="lower right")
 
-# ---------------- LOGIC (UNCHANGED) ----------------
-def calculate_probabilities(a, b):
-    group_sizes = list(range(a, b))
-    probabilities = []
-    for group_size in group_sizes:
-        match_count = 0
-        for _ in range(1000):
-            if getMatch(getBirthdays(group_size)):
-                match_count += 1
-        probabilities.append(match_count / 1000)
-    return {"sizes": group_sizes, "values": probabilities}
+    # Keyed by the plotted values, so reruns that don't resample reuse the PNG.
+    charts.show_chart(("birthday.curve", sizes, values, exact, curve.get("low"), log_x),
+                      draw, use_container_width=True)
 
 
-def getBirthdays(num):
-    start = datetime.date(2001, 1, 1)
-    birthdays = [start + datetime.timedelta(random.randint(0, 364)) for _ in range(num)]
-    return birthdays
+# ---------------- DISPLAYED GROUP ----------------
+# One sample group for the "Generated Birthdays" card; the trials themselves
+# are simulated by engine.count_matches.
+def getBirthdays(num, rng, cal):
+    # 2000 is a leap year, so Feb 29 has a date too.
+    days = draw_days(rng, 1, num, cal)[0].tolist()
+    return [datetime.date(2000, *cal["labels"][day]) for day in days]
 
 
-def getMatch(birthdays):
-    seen = set()
+def getMatch(birthdays, k=2):
+    seen = {}
     for b in birthdays:
-        if b in seen:
+        seen[b] = seen.get(b, 0) + 1
+        if seen[b] == k:
             return b
-        seen.add(b)
     return None
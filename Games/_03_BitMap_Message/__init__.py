@@ -0,0 +1,6 @@
+GAME = {
+    "id": "bitmap",
+    "emoji": "🗺️",
+    "name": "Bitmap Message",
+    "desc": "Text art generator",
+}
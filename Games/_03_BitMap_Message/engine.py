@@ -0,0 +1,246 @@
+"""Bitmap Message rendering, free of Streamlit.
+
+A bitmap is a multiline string where ``*`` marks a cell to fill with the
+next character of the message; anything else is blank. ``compile_bitmap``
+turns it once into a template of ``(gap, fill)`` run lengths per line (and
+a boolean fill mask), cached per bitmap. ``render`` then emits the HTML in
+one pass of joins: one ``<span>`` per run of fill cells, gaps as plain
+spaces (the output div is ``white-space: pre``), and one shade of the base
+colour per run, all drawn in a single batch from ``rng`` (a
+``Games.common.rng.Rng``), writing the plain-text copy to a file in the
+same pass if given one. ``text_lines`` yields just the text, line by line.
+
+For large outputs ``rasterize`` draws the same message straight into one
+RGB image instead: each distinct character is rendered once into a cached
+glyph atlas and the fill cells are stamped from it with NumPy into a
+paletted image (a random shade per cell), which keeps the PNG small. Masks can also come from an uploaded image (``mask_from_image``)
+or from text drawn in a big font (``mask_from_text``); ``bitmap_from_mask``
+turns any mask back into a bitmap string for the HTML renderer.
+"""
+
+import functools
+import html
+import re
+
+import numpy as np
+
+from Games.common.images import load_font
+from Games.common.state import limit
+
+FILL = "*"
+SPREAD = 40  # +- per RGB channel around the base colour
+
+FONT = "DejaVuSansMono.ttf"
+FONT_SIZE = 14
+MIN_FONT_SIZE = 6  # below this glyphs are unreadable; cells become solid pixels
+MAX_PIXELS = limit("bitmap.max_pixels", 16_000_000)
+STAMP_BATCH = 65536  # cells composited per NumPy batch
+SHADES = 32  # raster palette: shades of the base colour ...
+ALPHA_LEVELS = 8  # ... times glyph coverage steps (32 * 8 = 256 entries)
+
+_RUNS = re.compile(re.escape(FILL) + "+")
+
+
+# ------------------ Template ------------------
+@functools.lru_cache(maxsize=32)
+def compile_bitmap(bitmap):
+    """``{"rows", "mask", "fills", "runs"}`` for ``bitmap``.
+
+    ``rows`` holds, per line, ``((gap, fill), ...)`` run lengths and the
+    trailing gap; ``mask`` is a read-only ``(lines, width)`` bool array of
+    fill cells.
+    """
+    lines = bitmap.splitlines()
+    rows = []
+    for line in lines:
+        runs, pos = [], 0
+        for match in _RUNS.finditer(line):
+            runs.append((match.start() - pos, match.end() - match.start()))
+            pos = match.end()
+        rows.append((tuple(runs), len(line) - pos))
+
+    mask = np.zeros((len(lines), max(map(len, lines), default=0)), dtype=bool)
+    for y, line in enumerate(lines):
+        mask[y, :len(line)] = [c == FILL for c in line]
+    mask.setflags(write=False)
+    return {
+        "rows": tuple(rows),
+        "mask": mask,
+        "fills": int(mask.sum()),
+        "runs": sum(len(runs) for runs, _ in rows),
+    }
+
+
+# ------------------ Colour ------------------
+def parse_hex(color):
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def vary_colors(base, n, rng, spread=SPREAD):
+    """``(n, 3)`` uint8 shades of hex colour ``base``, drawn in one batch."""
+    offsets = rng.integers(-spread, spread + 1, (n, 3))
+    return np.clip(np.array(parse_hex(base)) + offsets, 0, 255).astype(np.uint8)
+
+
+# ------------------ Rendering ------------------
+def _filled_rows(message, bitmap):
+    """Per bitmap line: ``([(gap, chars), ...], tail)`` with the message cycled over the runs.
+
+    Only one run's worth of repeated message is ever held, not the whole fill.
+    """
+    template = compile_bitmap(bitmap)
+    widest = max((length for runs, _ in template["rows"] for _, length in runs), default=0)
+    cycle = message * (-(-widest // len(message)) + 1)
+    pos = 0
+    for runs, tail in template["rows"]:
+        row = []
+        for gap, length in runs:
+            start = pos % len(message)
+            row.append((gap, cycle[start:start + length]))
+            pos += length
+        yield row, tail
+
+
+def text_lines(message, bitmap):
+    """The plain-text copy, one ``\n``-terminated line at a time (for streaming to a file)."""
+    for row, tail in _filled_rows(message, bitmap):
+        yield "".join(" " * gap + chars for gap, chars in row) + " " * tail + "\n"
+
+
+def render(message, bitmap, base_color, rng, text=None):
+    """Coloured HTML lines for ``message`` laid over ``bitmap`` (join them with ``<br>``).
+
+    With ``text`` (a file open for writing) the plain-text copy is written
+    line by line in the same pass.
+    """
+    template = compile_bitmap(bitmap)
+    colors = iter([f"rgb({r},{g},{b})" for r, g, b in
+                   vary_colors(base_color, template["runs"], rng).tolist()])
+    html_lines = []
+    for row, tail in _filled_rows(message, bitmap):
+        markup, plain = [], []
+        for gap, chars in row:
+            pad = " " * gap
+            markup += (pad, f"<span style='color:{next(colors)}'>{html.escape(chars)}</span>")
+            plain += (pad, chars)
+        markup.append(" " * tail)
+        html_lines.append("".join(markup))
+        if text is not None:
+            text.write("".join(plain) + " " * tail + "\n")
+    return html_lines
+
+
+# ------------------ Masks ------------------
+def bitmap_from_mask(mask):
+    """Bitmap string (``*`` = fill) for a boolean ``(rows, columns)`` mask."""
+    return "\n".join("".join(FILL if v else " " for v in row) for row in mask.tolist())
+
+
+def mask_from_image(img, columns, invert=False, threshold=128, aspect=0.5):
+    """Fill mask from a PIL image: dark pixels fill (light ones with ``invert``).
+
+    ``aspect`` is cell width over height, so the shape is not stretched by
+    tall character cells.
+    """
+    from PIL import Image
+
+    gray = img.convert("L")
+    rows = max(1, round(gray.height / gray.width * columns * aspect))
+    pixels = np.asarray(gray.resize((columns, rows), Image.Resampling.LANCZOS))
+    return pixels >= threshold if invert else pixels < threshold
+
+
+def mask_from_text(text, rows=12):
+    """Fill mask of ``text`` drawn ``rows`` cells tall (cells are twice as tall as wide)."""
+    from PIL import Image, ImageDraw
+
+    font = load_font(FONT, rows * 4)
+    left, top, right, bottom = font.getbbox(text)
+    img = Image.new("L", (max(1, right - left), max(1, bottom - top)), 0)
+    ImageDraw.Draw(img).text((-left, -top), text, fill=255, font=font)
+    return mask_from_image(img, max(1, round(img.width / img.height * rows * 2)),
+                           invert=True)
+
+
+# ------------------ Raster ------------------
+@functools.lru_cache(maxsize=64)
+def glyph_atlas(chars, size):
+    """``(alpha, cell)`` for the characters in ``chars`` at font ``size``.
+
+    ``alpha`` is a ``(len(chars), height, width)`` uint8 array of coverage
+    masks, one per character in order; ``cell`` is ``(width, height)``.
+    """
+    from PIL import Image, ImageDraw
+
+    font = load_font(FONT, size)
+    ascent, descent = font.getmetrics()
+    cell = (max(1, round(font.getlength("M"))), ascent + descent)
+    alpha = np.zeros((len(chars), cell[1], cell[0]), dtype=np.uint8)
+    tile = Image.new("L", cell, 0)
+    draw = ImageDraw.Draw(tile)
+    for i, ch in enumerate(chars):
+        draw.rectangle((0, 0, *cell), fill=0)
+        draw.text((0, 0), ch, fill=255, font=font)
+        alpha[i] = np.asarray(tile)
+    alpha.setflags(write=False)
+    return alpha, cell
+
+
+def fit_font(mask, size=FONT_SIZE):
+    """Largest font size (at most ``size``) whose canvas fits ``MAX_PIXELS``; ``None`` if none."""
+    rows, columns = mask.shape
+    while size >= MIN_FONT_SIZE:
+        _, (w, h) = glyph_atlas(FILL, size)
+        if rows * h * columns * w <= MAX_PIXELS:
+            return size
+        size -= 2
+    return None
+
+
+def palette(base_color, rng, shades=SHADES, levels=ALPHA_LEVELS):
+    """``(shades * levels, 3)`` palette: each shade of ``base_color`` faded over black."""
+    colors = vary_colors(base_color, shades, rng).astype(np.uint16)
+    fade = np.arange(levels, dtype=np.uint16) * 255 // (levels - 1)
+    return (colors[:, None, :] * fade[None, :, None] // 255).astype(np.uint8).reshape(-1, 3)
+
+
+def rasterize(message, mask, base_color, rng, size=FONT_SIZE):
+    """Paletted ``PIL.Image`` of ``message`` filling ``mask`` on black, a random shade per cell.
+
+    Pixels index ``shade * ALPHA_LEVELS + coverage`` into a palette of
+    ``SHADES`` shades at ``ALPHA_LEVELS`` coverage steps, so the PNG stays
+    small however many cells there are. The font shrinks until the image
+    fits ``ARCADE_LIMIT_BITMAP_MAX_PIXELS``; masks too large even for the
+    smallest font are drawn one pixel per cell.
+    """
+    from PIL import Image
+
+    rows, columns = mask.shape
+    ys, xs = np.nonzero(mask)  # row-major, the order the text fills cells in
+    colors = palette(base_color, rng)
+    shade = rng.integers(0, SHADES, len(ys)).astype(np.uint8) * ALPHA_LEVELS
+    size = fit_font(mask, size)
+    if size is None:
+        canvas = np.zeros((rows, columns), dtype=np.uint8)
+        canvas[ys, xs] = shade + ALPHA_LEVELS - 1
+    else:
+        chars = "".join(sorted(set(message)))
+        alpha, (w, h) = glyph_atlas(chars, size)
+        coverage = ((alpha.astype(np.uint16) * (ALPHA_LEVELS - 1) + 127) // 255).astype(np.uint8)
+        # Glyph index of every fill cell, without building the repeated string.
+        glyph = np.searchsorted(np.frombuffer(chars.encode("utf-32-le"), dtype=np.uint32),
+                                np.frombuffer(message.encode("utf-32-le"), dtype=np.uint32))
+        glyph = glyph[np.arange(len(ys)) % len(message)]
+
+        canvas = np.zeros((rows, h, columns, w), dtype=np.uint8)
+        for start in range(0, len(ys), STAMP_BATCH):
+            batch = slice(start, start + STAMP_BATCH)
+            # Blank pixels stay at index 0 (black) rather than shade * levels.
+            stamps = coverage[glyph[batch]]
+            canvas[ys[batch], :, xs[batch]] = np.where(
+                stamps > 0, stamps + shade[batch, None, None], 0)
+        canvas = canvas.reshape(rows * h, columns * w)
+    img = Image.fromarray(canvas, "P")
+    img.putpalette(colors.tobytes())
+    return img
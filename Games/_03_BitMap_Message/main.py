@@ -1,7 +1,19 @@
 import streamlit as st
 import time
-import os
-import random
+from pathlib import Path
+
+from Games.common import outputs
+from Games.common.images import COMPRESSION
+from Games.common.rng import Rng, derive_seed, session_rng, session_seed
+
+from .engine import (
+    bitmap_from_mask, compile_bitmap, mask_from_image, mask_from_text, rasterize, render,
+    text_lines,
+)
+
+SHAPES = ["🗺️ Built-in bitmap", "📁 Upload a mask", "🔤 Text as the shape"]
+OUTPUTS = ["🖍️ Coloured text", "🖼️ PNG image"]
+HTML_MAX_CELLS = 20_000  # beyond this the span markup gets heavy for the browser
 
 bitmap = """
 ....................................................................
@@ -18,20 +30,6 @@ bitmap = """
 ....................................................................
 """
 
-def vary_color(hex_color):
-    """Create slight RGB variations for colorful effect"""
-    hex_color = hex_color.lstrip("#")
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
-
-    r = min(255, max(0, r + random.randint(-40, 40)))
-    g = min(255, max(0, g + random.randint(-40, 40)))
-    b = min(255, max(0, b + random.randint(-40, 40)))
-
-    return f"rgb({r},{g},{b})"
-
-
 def run():
     st.set_page_config(
     page_title="Responsive App",
@@ -73,14 +71,23 @@ def run():
     st.markdown("""
     Turn plain text into **ASCII-style pixel art** using a bitmap pattern!
 
-    ✨ Each character is rendered with **real color styling**, not a flat block.
+    ✨ Every stroke gets its own shade of your colour, not a flat block.
     """)
     st.divider()
 
     # ---------- Inputs ----------
     message = st.text_input("Enter your message:")
     base_color = st.color_picker("Pick your base color:", "#00FFAA")
-    speed_choice = st.radio(
+    shape = choose_shape(message)
+    if shape is None:
+        return
+    cells = compile_bitmap(shape)["mask"].size
+    output = st.radio(
+        "Output:", OUTPUTS, index=int(cells > HTML_MAX_CELLS), horizontal=True,
+        help="A PNG is one compressed image instead of a styled span per stroke.",
+    )
+    raster = output == OUTPUTS[1]
+    speed_choice = "⚡ Instant" if raster else st.radio(
         "Select printing speed:",
         ["🐢 Slow", "🐇 Fast", "⚡ Instant"],
         horizontal=True
@@ -92,61 +99,95 @@ def run():
 
         delay = 0.1 if speed_choice == "🐢 Slow" else 0.03 if speed_choice == "🐇 Fast" else 0
 
-        message_index = 0
-        final_html = ""
-
-        for line in bitmap.splitlines():
-            line_html = ""
-            for c in line:
-                if c == "*":
-                    ch = message[message_index % len(message)]
-                    message_index += 1
-                    color = vary_color(base_color)
-                    line_html += f"<span style='color:{color}'>{ch}</span>"
-                else:
-                    line_html += "&nbsp;"
-            final_html += line_html + "<br>"
+        if raster:
+            # Seeded by the content, so the same request reuses the same file.
+            seed = session_seed()
+
+            def write_png(f):
+                rng = Rng(derive_seed(seed, "bitmap.png", message, shape, base_color))
+                img = rasterize(message, compile_bitmap(shape)["mask"], base_color, rng)
+                img.save(f, format="PNG", **COMPRESSION["fast"])
+
+            png_path = outputs.artifact("bitmap_output.png",
+                                        ("bitmap.png", message, shape, base_color, seed),
+                                        write_png, binary=True)
+            output_placeholder.image(png_path, use_container_width=True)
+            # Streamed into this session's own file; read back only if downloaded.
+            text_path = outputs.artifact("bitmap_output.txt", ("bitmap.text", message, shape),
+                                         lambda f: f.writelines(text_lines(message, shape)))
+        else:
+            # One pass: the coloured lines, with the plain text streamed to its file.
+            rng = session_rng("bitmap")
+            html_lines = None
+
+            def write_text(f):
+                nonlocal html_lines
+                html_lines = render(message, shape, base_color, rng, text=f)
+
+            text_path = outputs.artifact("bitmap_output.txt", ("bitmap.text", message, shape),
+                                         write_text)
+            if html_lines is None:  # the text file was already there
+                html_lines = render(message, shape, base_color, rng)
 
             if delay > 0:
-                output_placeholder.markdown(
-                    f"<div class='bitmap-output'>{final_html}</div>",
-                    unsafe_allow_html=True
-                )
-                time.sleep(delay)
-
-        # Final render
-        output_placeholder.markdown(
-            f"<div class='bitmap-output'>{final_html}</div>",
-            unsafe_allow_html=True
-        )
-
-        # ---------- Save output (plain text version) ----------
-        os.makedirs("outputs", exist_ok=True)
-        file_path = os.path.join("outputs", "bitmap_output.txt")
-
-        text_only = ""
-        idx = 0
-        for line in bitmap.splitlines():
-            out = ""
-            for c in line:
-                if c == "*":
-                    out += message[idx % len(message)]
-                    idx += 1
-                else:
-                    out += " "
-            text_only += out + "\n"
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(text_only)
+                for i in range(1, len(html_lines) + 1):
+                    output_placeholder.markdown(
+                        f"<div class='bitmap-output'>{'<br>'.join(html_lines[:i])}</div>",
+                        unsafe_allow_html=True
+                    )
+                    time.sleep(delay)
+
+            # Final render
+            output_placeholder.markdown(
+                f"<div class='bitmap-output'>{'<br>'.join(html_lines)}</div>",
+                unsafe_allow_html=True
+            )
 
         st.success("✅ Output saved successfully")
         st.download_button(
             "⬇️ Download Output",
-            text_only,
+            Path(text_path).read_bytes,
             "bitmap_output.txt",
             "text/plain",
             use_container_width=True
         )
+        if raster:
+            st.download_button(
+                "⬇️ Download PNG",
+                Path(png_path).read_bytes,
+                "bitmap_output.png",
+                "image/png",
+                use_container_width=True
+            )
+
+
+def choose_shape(message):
+    """The bitmap string to fill: built in, from an uploaded mask, or from text."""
+    source = st.radio("Shape:", SHAPES, horizontal=True)
+    if source == SHAPES[1]:
+        upload = st.file_uploader(
+            "Mask: a .txt bitmap (* = fill) or an image (dark = fill)",
+            type=["txt", "png", "jpg", "jpeg", "gif", "bmp"],
+        )
+        if upload is None:
+            return None
+        if upload.name.lower().endswith(".txt"):
+            return upload.getvalue().decode("utf-8", errors="replace")
+        from PIL import Image, UnidentifiedImageError
+
+        columns = st.slider("Width (characters)", 20, 400, 100)
+        invert = st.checkbox("Fill the light parts instead")
+        try:
+            mask = mask_from_image(Image.open(upload), columns, invert=invert)
+        except (UnidentifiedImageError, OSError) as exc:
+            st.error(f"Could not read {upload.name}: {exc}")
+            return None
+        return bitmap_from_mask(mask)
+    if source == SHAPES[2]:
+        text = st.text_input("Shape text:", message or "HELLO")
+        rows = st.slider("Height (characters)", 6, 60, 16)
+        return bitmap_from_mask(mask_from_text(text, rows)) if text else None
+    return bitmap
 
 if __name__ == "__main__":
     run()
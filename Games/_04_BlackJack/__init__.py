@@ -0,0 +1,6 @@
+GAME = {
+    "id": "blackjack",
+    "emoji": "🃏",
+    "name": "BlackJack",
+    "desc": "Classic 21 card game",
+}
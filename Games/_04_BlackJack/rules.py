@@ -0,0 +1,136 @@
+"""Blackjack rules, free of Streamlit.
+
+The game page and the headless simulator (``simulator.py``) share these, so
+a difficulty measured offline is the difficulty people play. A card is one
+byte, ``suit << 4 | rank`` with ``rank`` 1 (ace) to 13 (king), and a deck is
+an ``array('B')`` of them; ``card_label`` gives the ``(rank, suit)`` strings
+to draw. A ``Hand`` keeps its hard total and ace count up to date as cards
+are added, so its value is known without rescanning the cards. A round is
+dealt from a fresh 52-card deck.
+
+House rules as the page plays them: even money on every win (no 3:2
+blackjack bonus), no splits or insurance, double down on the first two
+cards only, and the dealer draws to a threshold set by the difficulty
+(``DEALER_STOP``), counting a soft hand at its best total. A lone busted
+player loses without the dealer drawing. With several seats the dealer
+still draws while any hand is alive, and ``settle`` checks the dealer's
+bust first, so a busted player is paid when the dealer busts too.
+"""
+
+import random
+from array import array
+
+HEARTS   = chr(9829)
+DIAMONDS = chr(9830)
+SPADES   = chr(9824)
+CLUBS    = chr(9827)
+SUITS = (HEARTS, DIAMONDS, SPADES, CLUBS)
+RANKS = ('', 'A') + tuple(str(rank) for rank in range(2, 11)) + ('J', 'Q', 'K')
+ACE = 1
+
+# Points per card byte (ace = 1), so valuing a card is one index.
+POINTS = bytes(min(code & 15, 10) for code in range(256))
+DECK = array('B', (suit << 4 | rank for suit in range(len(SUITS)) for rank in range(1, 14)))
+
+# Dealer stops drawing at this total; "hard" picks one per round.
+DEALER_STOP = {"easy": (15, 15), "normal": (17, 17), "hard": (18, 19)}
+DIFFICULTIES = ("easy", "normal", "hard")
+
+
+# ------------------ Cards ------------------
+def getDeck(rng=random):
+    deck = array('B', DECK)
+    rng.shuffle(deck)
+    return deck
+
+
+def draw(deck, rng=random):
+    """Remove and return a random card of ``deck`` (which need not be shuffled).
+
+    Same odds as popping a freshly shuffled deck, without shuffling all 52
+    cards for the handful a round uses.
+    """
+    i = int(rng.random() * len(deck))
+    deck[i], deck[-1] = deck[-1], deck[i]
+    return deck.pop()
+
+
+def card_label(card):
+    """``(rank, suit)`` strings for drawing ``card``."""
+    return RANKS[card & 15], SUITS[card >> 4]
+
+
+def card_value(card):
+    """Blackjack value of one card, an ace counted as 11 (e.g. the dealer's up card)."""
+    return 11 if card & 15 == ACE else POINTS[card]
+
+
+class Hand:
+    """Cards held plus a running hard total and ace count.
+
+    ``value`` counts one ace as 11 when that doesn't bust (two never can),
+    so it matches a full rescan of the cards at O(1) per card added.
+    """
+
+    __slots__ = ("cards", "hard", "aces")
+
+    def __init__(self, cards=()):
+        self.cards = []
+        self.hard = self.aces = 0
+        for card in cards:
+            self.add(card)
+
+    def add(self, card):
+        self.cards.append(card)
+        self.hard += POINTS[card]
+        if card & 15 == ACE:
+            self.aces += 1
+        return self
+
+    @property
+    def value(self):
+        return self.hard + 10 if self.aces and self.hard <= 11 else self.hard
+
+    @property
+    def soft(self):
+        """True if an ace counts as 11 (another card can't bust the hand)."""
+        return bool(self.aces) and self.hard <= 11
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __iter__(self):
+        return iter(self.cards)
+
+
+# ------------------ Dealer ------------------
+def dealer_threshold(difficulty, rng=random):
+    low, high = DEALER_STOP.get(difficulty, DEALER_STOP["normal"])
+    return low if low == high else rng.randint(low, high)
+
+
+def top(deck, rng=random):
+    """Remove and return the top card of a shuffled ``deck`` (the page's deal)."""
+    return deck.pop()
+
+
+def dealer_ai_play(deck, dealerHand, difficulty, rng=random, draw=top):
+    """Dealer draws to the difficulty's threshold; ``draw(deck, rng)`` deals each card.
+
+    The page deals off the top of its shuffled deck; the simulator passes
+    ``draw`` to deal from an unshuffled one.
+    """
+    stop_threshold = dealer_threshold(difficulty, rng)
+    while dealerHand.value < stop_threshold:
+        dealerHand.add(draw(deck, rng))
+    return dealerHand
+
+
+# ------------------ Settlement ------------------
+def settle(playerValue, dealerValue):
+    """Units won per unit bet: ``1``, ``-1`` or ``0`` (a push), in the page's order of checks."""
+    if dealerValue > 21:
+        return 1
+    if playerValue > 21 or playerValue < dealerValue:
+        return -1
+    return 1 if playerValue > dealerValue else 0
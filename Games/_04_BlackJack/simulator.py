@@ -0,0 +1,282 @@
+"""Headless Blackjack Monte Carlo: house edge per difficulty and player strategy.
+
+Plays one seat against the dealer under the page's rules (``rules.py``):
+a fresh 52-card deck per round, dealer cards dealt first, the player acts
+on the dealer's up card (the second one), a bust loses at once, otherwise
+the dealer draws to the difficulty's threshold. Each hand's result is the
+units won on a 1-unit bet (``-2``..``2`` with doubling).
+
+Strategies decide ``"hit"``, ``"stand"`` or ``"double"`` from the hand and
+the up card (``STRATEGIES``, or ``"hit<N"`` to hit below any total N).
+Work is split into tasks of ``TASK_HANDS`` hands, each with its own seed
+derived from the run seed, and fanned out over a process pool, so a
+result depends only on the seed, never on the number of workers.
+
+``play`` accepts a ``progress`` bar, so it can also run as a job
+(``Games.common.jobs``). From the command line:
+
+    python -m Games._04_BlackJack.simulator --hands 1000000
+    python -m Games._04_BlackJack.simulator --hands 5000000 --difficulty hard \\
+        --strategy basic --strategy "hit<15" --workers 8 --json blackjack.json
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from Games.common.jobs import mp_context
+from Games.common.profiling import profiled
+from Games.common.rng import Rng, derive_seed
+from Games.common.state import limit
+
+from . import rules
+
+TASK_HANDS = 50_000  # hands per worker task (and per progress tick)
+MAX_HANDS = limit("blackjack.hands", 100_000_000)
+Z = 1.96
+
+COUNTS = ("hands", "wins", "losses", "ties", "player_busts", "dealer_busts", "doubles",
+          "dealer_plays")
+RATES = ("wins", "losses", "ties", "player_busts", "dealer_busts", "doubles")
+# Rates are per hand dealt, except dealer busts: per hand the dealer actually drew to.
+RATE_OF = {"dealer_busts": "dealer_plays"}
+
+
+# ------------------ Strategies ------------------
+def hit_below(total):
+    """Hit while the hand is under ``total``; never double."""
+    def decide(value, soft, up, can_double):
+        return "hit" if value < total else "stand"
+    return decide
+
+
+def basic(value, soft, up, can_double):
+    """Textbook hit/stand/double chart for a dealer standing on soft 17, without splits."""
+    if soft:
+        if value >= 19:
+            return "stand"
+        if value == 18:
+            if 3 <= up <= 6:
+                return "double" if can_double else "stand"
+            return "stand" if up <= 8 else "hit"
+        low = {17: 3, 16: 4, 15: 4, 14: 5, 13: 5}.get(value, 7)
+        return "double" if can_double and low <= up <= 6 else "hit"
+    if value >= 17:
+        return "stand"
+    if value >= 13:
+        return "stand" if up <= 6 else "hit"
+    if value == 12:
+        return "stand" if 4 <= up <= 6 else "hit"
+    double = {11: (2, 10), 10: (2, 9), 9: (3, 6)}.get(value)
+    if can_double and double and double[0] <= up <= double[1]:
+        return "double"
+    return "hit"
+
+
+STRATEGIES = {
+    "basic": basic,
+    "mimic_dealer": hit_below(17),
+    "never_bust": hit_below(12),
+}
+
+
+def strategy(name):
+    """Strategy function for ``name``: a key of ``STRATEGIES`` or ``"hit<N"``."""
+    if name in STRATEGIES:
+        return STRATEGIES[name]
+    if name.startswith("hit<") and name[4:].isdigit():
+        return hit_below(int(name[4:]))
+    raise ValueError(f"unknown strategy {name!r}; use one of {sorted(STRATEGIES)} or 'hit<N'")
+
+
+# ------------------ Simulation ------------------
+def play_hand(rng, difficulty, decide, counts):
+    """Play one round; adds to ``counts`` and returns the units won."""
+    deck = rules.DECK[:]
+    draw = rules.draw
+    dealer = rules.Hand((draw(deck, rng), draw(deck, rng)))
+    hand = rules.Hand((draw(deck, rng), draw(deck, rng)))
+    up = rules.card_value(dealer.cards[1])
+    bet = 1
+    while hand.value < 21:
+        action = decide(hand.value, hand.soft, up, len(hand.cards) == 2)
+        if action == "stand":
+            break
+        hand.add(draw(deck, rng))
+        if action == "double":
+            bet = 2
+            counts["doubles"] += 1
+            break
+
+    value = hand.value
+    counts["hands"] += 1
+    if value > 21:
+        counts["player_busts"] += 1
+        counts["losses"] += 1
+        return -bet
+
+    dealer_value = rules.dealer_ai_play(deck, dealer, difficulty, rng, draw).value
+    counts["dealer_plays"] += 1
+    counts["dealer_busts"] += dealer_value > 21
+    outcome = rules.settle(value, dealer_value)
+    counts["wins" if outcome > 0 else "losses" if outcome < 0 else "ties"] += 1
+    return outcome * bet
+
+
+@profiled("blackjack.play")
+def play(hands, difficulty, strategy_name, seed, progress=None):
+    """Totals for ``hands`` rounds: the ``COUNTS`` plus ``net`` and ``net_sq`` (sum of squares)."""
+    rng = Rng(seed)
+    decide = strategy(strategy_name)
+    counts = dict.fromkeys(COUNTS, 0)
+    net = net_sq = 0
+    if progress is not None:
+        progress.total = hands
+    for start in range(0, hands, TASK_HANDS):
+        block = min(TASK_HANDS, hands - start)
+        for _ in range(block):
+            won = play_hand(rng, difficulty, decide, counts)
+            net += won
+            net_sq += won * won
+        if progress is not None:
+            progress.update(block)
+    return dict(counts, net=net, net_sq=net_sq)
+
+
+def merge(totals):
+    merged = {}
+    for t in totals:
+        for name, value in t.items():
+            merged[name] = merged.get(name, 0) + value
+    return merged
+
+
+# ------------------ Statistics ------------------
+def wilson(k, n, z=Z):
+    """95% Wilson score interval for ``k`` successes in ``n`` trials."""
+    if n == 0:
+        return 0.0, 1.0
+    p = k / n
+    centre = (p + z * z / (2 * n)) / (1 + z * z / n)
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def summarize(totals, z=Z):
+    """House edge (units lost per unit bet, +-CI), per-hand variance and rates with intervals.
+
+    Each rate is over the hands in its ``of``: all hands, or for dealer
+    busts the hands where the player stood and the dealer drew.
+    """
+    n = totals["hands"]
+    mean = totals["net"] / n
+    variance = max(0.0, totals["net_sq"] / n - mean * mean) * n / max(1, n - 1)
+    half = z * math.sqrt(variance / n)
+    rates = {}
+    for name in RATES:
+        of = totals[RATE_OF.get(name, "hands")]
+        rates[name] = {"rate": totals[name] / of if of else 0.0, "ci": wilson(totals[name], of, z),
+                       "of": of}
+    return {
+        "hands": n,
+        "house_edge": -mean,
+        "house_edge_ci": (-mean - half, -mean + half),
+        "variance": variance,
+        "std": math.sqrt(variance),
+        **rates,
+    }
+
+
+# ------------------ Fan-out ------------------
+def tasks(hands, difficulty, strategy_name, seed):
+    """``(hands, difficulty, strategy, seed)`` per task; fixed by the inputs, not the workers."""
+    return [(min(TASK_HANDS, hands - start), difficulty, strategy_name,
+             derive_seed(seed, "blackjack", difficulty, strategy_name, start))
+            for start in range(0, hands, TASK_HANDS)]
+
+
+def run(hands, difficulties=rules.DIFFICULTIES, strategies=("basic",), seed=0, workers=None,
+        on_task=None):
+    """Simulate every (difficulty, strategy) pair -> ``{(difficulty, strategy): summary}``.
+
+    ``workers`` defaults to the CPU count; ``1`` runs in this process.
+    ``on_task(hands)`` is called as each task finishes.
+    """
+    hands = min(hands, MAX_HANDS)
+    for name in strategies:
+        strategy(name)  # fail fast, before any worker starts
+    jobs = {(d, s): tasks(hands, d, s, seed) for d in difficulties for s in strategies}
+    results = {pair: [] for pair in jobs}
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for pair, work in jobs.items():
+            for task in work:
+                results[pair].append(play(*task))
+                if on_task:
+                    on_task(task[0])
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context()) as pool:
+            futures = {pool.submit(play, *task): (pair, task[0])
+                       for pair, work in jobs.items() for task in work}
+            for future in as_completed(futures):
+                pair, done = futures[future]
+                results[pair].append(future.result())
+                if on_task:
+                    on_task(done)
+    return {pair: summarize(merge(totals)) for pair, totals in results.items()}
+
+
+# ------------------ CLI ------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Blackjack house edge by difficulty and strategy.")
+    parser.add_argument("--hands", type=int, default=1_000_000, help="hands per difficulty and strategy")
+    parser.add_argument("--difficulty", action="append", choices=rules.DIFFICULTIES)
+    parser.add_argument("--strategy", action="append",
+                        help=f"{', '.join(STRATEGIES)} or hit<N (repeatable; default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    if args.hands < 1:
+        parser.error("--hands must be at least 1")
+    difficulties = args.difficulty or rules.DIFFICULTIES
+    strategies = args.strategy or tuple(STRATEGIES)
+    try:
+        for name in strategies:
+            strategy(name)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    from tqdm import tqdm
+
+    total = min(args.hands, MAX_HANDS) * len(difficulties) * len(strategies)
+    t0 = time.perf_counter()
+    with tqdm(total=total, unit="hand", unit_scale=True, file=sys.stderr, leave=False) as bar:
+        results = run(args.hands, difficulties, strategies, args.seed, args.workers, bar.update)
+    elapsed = time.perf_counter() - t0
+
+    print(f"{'difficulty':<10} {'strategy':<13} {'house edge (95% CI)':>26} {'sd':>6} "
+          f"{'win':>6} {'tie':>6} {'loss':>6} {'bust':>6} {'dealer bust':>11}")
+    for (difficulty, name), r in results.items():
+        low, high = r["house_edge_ci"]
+        print(f"{difficulty:<10} {name:<13} {r['house_edge']:>+8.2%} [{low:+.2%}, {high:+.2%}] "
+              f"{r['std']:>6.3f} {r['wins']['rate']:>6.1%} {r['ties']['rate']:>6.1%} "
+              f"{r['losses']['rate']:>6.1%} {r['player_busts']['rate']:>6.1%} "
+              f"{r['dealer_busts']['rate']:>11.1%}")
+    print("dealer bust: share of the hands where the player stood and the dealer drew")
+    print(f"{total:,} hands in {elapsed:.1f}s ({total / elapsed:,.0f} hands/s)")
+
+    if args.json:
+        rows = [{"difficulty": d, "strategy": s, **r} for (d, s), r in results.items()]
+        with open(args.json, "w") as f:
+            json.dump({"seed": args.seed, "results": rows}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+GAME = {
+    "id": "dvd",
+    "emoji": "💿",
+    "name": "Bouncing DVD Logo",
+    "desc": "Retro animation",
+}
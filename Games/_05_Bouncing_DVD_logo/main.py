@@ -1,7 +1,10 @@
 import streamlit as st
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 import random, time
 
+from Games.common.images import encode_png, load_font, reuse_canvas
+from Games.common.state import game_state
+
 def run():
     st.title("💿 Bouncing DVD Logo — Retro Animation")
 
@@ -80,26 +83,27 @@ def run():
         return logos
 
     # ---------- Session State ----------
-    if "trail_img" not in st.session_state or st.session_state.trail_img.size != (WIDTH, HEIGHT):
-        st.session_state.trail_img = Image.new("RGBA", (WIDTH, HEIGHT), (0, 0, 0, 255))
-
-    if "corner_hits" not in st.session_state:
-        st.session_state.corner_hits = 0
+    # Only the counter persists; the frame canvas is a full RGBA image and
+    # lives in the animation loop, so it is freed when the loop ends.
+    state = game_state("dvd", corner_hits=0)
 
     logos = init_logos()
 
     # ---------- Animation Loop ----------
     if start:
+        # One canvas for the whole run: faded in place for the trail, cleared otherwise.
+        img = Image.new("RGBA", (WIDTH, HEIGHT), (0, 0, 0, 255))
+        fade = Image.new("RGBA", (WIDTH, HEIGHT), (0, 0, 0, 40))
+        font = load_font()
+        bbox = ImageDraw.Draw(img).textbbox((0, 0), logo_text, font=font)
+        w, h = bbox[2] - bbox[0], bbox[3] - bbox[1]
         while True:
             if trail:
-                img = st.session_state.trail_img.copy()
-                fade = Image.new("RGBA", (WIDTH, HEIGHT), (0, 0, 0, 40))
-                img = Image.alpha_composite(img, fade)
+                img.alpha_composite(fade)
             else:
-                img = Image.new("RGBA", (WIDTH, HEIGHT), (0, 0, 0, 255))
+                img = reuse_canvas(img, (WIDTH, HEIGHT), "RGBA", (0, 0, 0, 255))
 
             draw = ImageDraw.Draw(img)
-            font = ImageFont.load_default()
             corner_hit = False
 
             for logo in logos:
@@ -128,8 +132,6 @@ def run():
                     fill=logo["color"]
                 )
 
-                bbox = draw.textbbox((0, 0), logo_text, font=font)
-                w, h = bbox[2] - bbox[0], bbox[3] - bbox[1]
                 draw.text(
                     (logo["x"] + (LOGO_SIZE - w) // 2,
                      logo["y"] + (LOGO_SIZE - h) // 2),
@@ -139,17 +141,15 @@ def run():
                 )
 
             if corner_hit:
-                st.session_state.corner_hits += 1
+                state["corner_hits"] += 1
 
             draw.text(
                 (10, 10),
-                f"💥 Corner Hits: {st.session_state.corner_hits}",
+                f"💥 Corner Hits: {state['corner_hits']}",
                 fill=(255, 255, 255),
                 font=font
             )
 
-            if trail:
-                st.session_state.trail_img = img
-
-            frame_placeholder.image(img.convert("RGB"), use_container_width=True)
+            # Encoded once here with fast settings; Streamlit passes the bytes through.
+            frame_placeholder.image(encode_png(img.convert("RGB"), "fast"), use_container_width=True)
             time.sleep(1 / FPS)
@@ -0,0 +1,6 @@
+GAME = {
+    "id": "caesar",
+    "emoji": "🔑",
+    "name": "Caesar Cipher",
+    "desc": "Encrypt and decrypt messages",
+}
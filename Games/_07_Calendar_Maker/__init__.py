@@ -0,0 +1,6 @@
+GAME = {
+    "id": "calendar",
+    "emoji": "📅",
+    "name": "Calendar Maker",
+    "desc": "Build calendars & notes",
+}
@@ -3,12 +3,16 @@ import datetime
 import json
 import os
 
+from Games.common.memo import memoize
+from Games.common.paths import cache_path
+
 # --- CONSTANTS ---
 DAYS = ('Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday')
 MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
           'August', 'September', 'October', 'November', 'December')
 
-NOTES_FILE = "calendar_notes.json"
+# Runtime data, not source: kept in the cache dir, not the working directory.
+NOTES_FILE = cache_path("calendar", "notes.json")
 
 # --- Load or create notes storage ---
 if os.path.exists(NOTES_FILE):
@@ -18,12 +22,13 @@ else:
     notes_data = {}
 
 
-def CalendarMaker(year, month, notes_data):
-    today = datetime.date.today()
-    calText = f"### {MONTHS[month - 1]} {year}\n\n"
-    calText += '| Sun | Mon | Tue | Wed | Thu | Fri | Sat |\n'
-    calText += '|-----|-----|-----|-----|-----|-----|-----|\n'
+@memoize("calendar.month", maxsize=256)
+def month_cells(year, month, today):
+    """The grid of ``month`` without notes: weeks of ``(date_key, day_str, in_month)``.
 
+    Pure in its arguments (``today`` only decides the highlight), so one
+    month is laid out once per day for every session.
+    """
     # Start from Sunday before or on the 1st of the month
     currentDate = datetime.date(year, month, 1)
     while currentDate.weekday() != 6:  # 6 = Sunday
@@ -35,32 +40,43 @@ def CalendarMaker(year, month, notes_data):
     end_of_month = datetime.date(next_month_year, next_month, 1) - datetime.timedelta(days=1)
     last_display_date = end_of_month + datetime.timedelta(days=(5 - end_of_month.weekday()) % 7 + 1)
 
+    weeks = []
     while currentDate <= last_display_date:
-        week_row = []
+        week = []
         for _ in range(7):
             cell_date = currentDate
-            date_key = str(cell_date)
 
             # Out-of-month days in gray
             if cell_date.month != month:
                 day_str = f"<span style='color:#aaa'>{cell_date.day}</span>"
-                note_display = ""
+            # Highlight today
+            elif cell_date == today:
+                day_str = (
+                    f"<span style='background:#2563eb;color:white;"
+                    f"padding:2px 6px;border-radius:6px;font-weight:bold;'>"
+                    f"[{cell_date.day}]</span>"
+                )
             else:
-                # Highlight today
-                if cell_date == today:
-                    day_str = (
-                        f"<span style='background:#2563eb;color:white;"
-                        f"padding:2px 6px;border-radius:6px;font-weight:bold;'>"
-                        f"[{cell_date.day}]</span>"
-                    )
-                else:
-                    day_str = f"**{cell_date.day}**"
-
-                # Add note if exists
-                note_display = f"<br><sub>{notes_data.get(date_key, '')}</sub>" if date_key in notes_data else ""
+                day_str = f"**{cell_date.day}**"
 
-            week_row.append(f"{day_str}{note_display}")
+            week.append((str(cell_date), day_str, cell_date.month == month))
             currentDate += datetime.timedelta(days=1)
+        weeks.append(tuple(week))
+
+    return tuple(weeks)
+
+
+def CalendarMaker(year, month, notes_data):
+    calText = f"### {MONTHS[month - 1]} {year}\n\n"
+    calText += '| Sun | Mon | Tue | Wed | Thu | Fri | Sat |\n'
+    calText += '|-----|-----|-----|-----|-----|-----|-----|\n'
+
+    for week in month_cells(year, month, datetime.date.today()):
+        week_row = []
+        for date_key, day_str, in_month in week:
+            # Add note if exists
+            note_display = f"<br><sub>{notes_data.get(date_key, '')}</sub>" if in_month and date_key in notes_data else ""
+            week_row.append(f"{day_str}{note_display}")
 
         calText += '| ' + ' | '.join(week_row) + ' |\n'
 
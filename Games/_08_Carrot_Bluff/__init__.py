@@ -0,0 +1,6 @@
+GAME = {
+    "id": "carrot",
+    "emoji": "🥕",
+    "name": "Carrot Bluff",
+    "desc": "Funny bluffing game",
+}
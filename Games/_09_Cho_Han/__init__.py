@@ -0,0 +1,6 @@
+GAME = {
+    "id": "chohan",
+    "emoji": "🎲",
+    "name": "Cho Han",
+    "desc": "Dice gambling game",
+}
@@ -0,0 +1,6 @@
+GAME = {
+    "id": "clickbait",
+    "emoji": "📢",
+    "name": "Clickbait Headlines",
+    "desc": "Generate viral headlines",
+}
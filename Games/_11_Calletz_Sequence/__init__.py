@@ -0,0 +1,6 @@
+GAME = {
+    "id": "collatz",
+    "emoji": "🔢",
+    "name": "Collatz Sequence",
+    "desc": "Explore 3n + 1",
+}
@@ -1,10 +1,18 @@
+import io
 import streamlit as st
 import pandas as pd
 import time
 
+from Games.common import jobs
+from Games.common.memo import memoize
+from Games.common.results import ResultSink, to_parquet_bytes
+from Games.common.series import download_full, downsample, paginate
+from Games.common.state import game_state
+
 # -----------------------------------------
 # Collatz sequence function
 # -----------------------------------------
+@memoize("collatz.sequence", maxsize=1024, disk=True)
 def collatz_sequence(n: int):
     seq = [n]
     while n != 1:
@@ -13,7 +21,56 @@ def collatz_sequence(n: int):
         else:
             n = 3 * n + 1
         seq.append(n)
-    return seq
+    return tuple(seq)  # shared across sessions, so immutable
+
+
+def compare(nums, progress=None):
+    """Length and peak of each sequence, longest first (runs in the job pool)."""
+    if progress is not None:
+        progress.total = len(nums)
+    results = []
+    for num in nums:
+        seq = collatz_sequence(num)
+        results.append({
+            "Start": num,
+            "Length": len(seq),
+            "Max Value": max(seq)
+        })
+        if progress is not None:
+            progress.update(1)
+
+    df_compare = pd.DataFrame(results)
+    return df_compare.sort_values("Length", ascending=False)
+
+
+INT64_LIMIT = 2**63
+
+
+def sequences_parquet(starts):
+    """Every value of every sequence in ``starts`` as Parquet, one sequence at a time."""
+    buffer = io.BytesIO()
+    with ResultSink("collatz.values", path=buffer) as sink:
+        for start in starts:
+            seq = collatz_sequence(start)
+            sink.write(start=start, step=range(len(seq)), value=seq)
+    return buffer.getvalue()
+
+
+def parity_style(df):
+    return df.style.apply(
+        lambda col: ["background-color:#ffd1d1" if v == "Odd"
+                     else "background-color:#d1ffd7"
+                     for v in col]
+        if col.name == "Odd / Even" else [""] * len(col),
+        axis=0
+    )
+
+
+def sequence_frame(sequence):
+    return pd.DataFrame({
+        "Value": sequence,
+        "Odd / Even": ["Odd" if x % 2 else "Even" for x in sequence]
+    })
 
 
 # -----------------------------------------
@@ -52,8 +109,12 @@ def run():
 
         animate = st.checkbox("Animate sequence step-by-step", value=True)
 
+        # The last result is kept so paging the table doesn't lose it.
+        state = game_state("collatz")
+
         if st.button("Generate Sequence"):
             sequence = collatz_sequence(n)
+            state["start"], state["sequence"] = n, sequence
 
             # Animation
             if animate:
@@ -66,23 +127,20 @@ def run():
             else:
                 st.write(sequence)
 
+        if state.get("sequence"):
+            n, sequence = state["start"], state["sequence"]
+
             st.subheader("📊 Statistics")
-            df = pd.DataFrame({
-                "Value": sequence,
-                "Odd / Even": ["Odd" if x % 2 else "Even" for x in sequence]
-            })
-
-            st.write(df.style.apply(
-                lambda col: ["background-color:#ffd1d1" if v == "Odd" 
-                             else "background-color:#d1ffd7" 
-                             for v in col] 
-                if col.name == "Odd / Even" else [""] * len(col),
-                axis=0
-            ))
-
-            # Charts
-            st.line_chart(sequence)
-            st.bar_chart(sequence)
+            df = sequence_frame(sequence)
+            paginate(df, "collatz_table", style=parity_style)
+
+            # Charts: at most MAX_POINTS points each, peaks kept
+            steps, values = downsample(sequence)
+            st.line_chart(pd.DataFrame({"Value": values}, index=steps))
+            steps, values = downsample(sequence, method="minmax")
+            st.bar_chart(pd.DataFrame({"Value": values}, index=steps))
+            if len(steps) < len(sequence):
+                st.caption(f"Charts show {len(steps)} of {len(sequence)} points.")
 
             # Stats
             st.markdown(f"**Length:** {len(sequence)} numbers")
@@ -93,20 +151,28 @@ def run():
             # Download TXT
             st.download_button(
                 "📥 Download as TXT",
-                data=", ".join(map(str, sequence)),
+                data=lambda: ", ".join(map(str, sequence)),
                 file_name=f"collatz_{n}.txt",
                 mime="text/plain"
             )
 
-            # Download CSV
-            csv_data = pd.DataFrame(sequence, columns=["Value"]).to_csv(index=False)
-            st.download_button(
+            # Download CSV (full data, built on click)
+            download_full(
                 "📥 Download as CSV",
-                data=csv_data,
-                file_name=f"collatz_{n}.csv",
-                mime="text/csv"
+                lambda: pd.DataFrame(sequence, columns=["Value"]),
+                f"collatz_{n}.csv",
             )
 
+            # Download Parquet (int64 columns; values past 2**63 only fit the text formats)
+            if max(sequence) < INT64_LIMIT:
+                st.download_button(
+                    "📥 Download as Parquet",
+                    data=lambda: to_parquet_bytes("collatz.values", start=n,
+                                                  step=range(len(sequence)), value=sequence),
+                    file_name=f"collatz_{n}.parquet",
+                    mime="application/vnd.apache.parquet"
+                )
+
     # ================================================================
     # ✅ COMPARISON MODE
     # ================================================================
@@ -115,28 +181,47 @@ def run():
 
         nums = st.text_input("Enter starting numbers separated by commas (e.g., 5, 12, 27):")
 
+        state = game_state("collatz")
+
         if st.button("Compare"):
             try:
                 nums_list = [int(x.strip()) for x in nums.split(",") if x.strip()]
-
-                results = []
-                for num in nums_list:
-                    seq = collatz_sequence(num)
-                    results.append({
-                        "Start": num,
-                        "Length": len(seq),
-                        "Max Value": max(seq)
-                    })
-
-                df_compare = pd.DataFrame(results)
-                df_compare = df_compare.sort_values("Length", ascending=False)
-
-                st.write("### 📊 Comparison Table")
-                st.write(df_compare)
-
-                st.bar_chart(df_compare.set_index("Start")["Length"])
-
-                st.success("Comparison complete!")
-
-            except:
+                if any(num < 1 for num in nums_list):
+                    raise ValueError(nums_list)
+            except ValueError:
                 st.error("Please enter valid integers separated by commas.")
+            else:
+                jobs.cancel(state, "compare_job")
+                state["compare_job"] = jobs.submit(
+                    compare, nums_list, label=f"Comparing {len(nums_list):,} sequences"
+                )
+
+        status, value = jobs.collect(state, "compare_job")
+        if status == "running":
+            jobs.progress_panel(value, key="collatz_compare")
+        elif status == "done":
+            state["compare"] = value
+            st.success("Comparison complete!")
+        elif status == "cancelled":
+            st.warning("Comparison cancelled.")
+        elif status == "error":
+            st.error(f"Comparison failed: {value}")
+
+        df_compare = state.get("compare")
+        if df_compare is not None:
+            st.write("### 📊 Comparison Table")
+            paginate(df_compare, "collatz_compare")
+            download_full("📥 Download comparison as CSV", lambda: df_compare,
+                          "collatz_compare.csv")
+            if df_compare["Max Value"].max() < INT64_LIMIT:
+                st.download_button(
+                    "📥 Download all sequences as Parquet",
+                    data=lambda: sequences_parquet(df_compare["Start"].tolist()),
+                    file_name="collatz_sequences.parquet",
+                    mime="application/vnd.apache.parquet"
+                )
+
+            lengths = df_compare.sort_values("Start")
+            starts, values = downsample(lengths["Length"].tolist(), lengths["Start"].tolist(),
+                                        method="minmax")
+            st.bar_chart(pd.DataFrame({"Length": values}, index=starts))
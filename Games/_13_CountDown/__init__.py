@@ -0,0 +1,6 @@
+GAME = {
+    "id": "countdown",
+    "emoji": "⏱️",
+    "name": "Countdown Timer",
+    "desc": "Track productivity",
+}
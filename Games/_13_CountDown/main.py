@@ -3,11 +3,15 @@ import time
 from . import sevseg
 import pandas as pd
 
+from Games.common.animation import animate, reset_clock
+from Games.common.state import game_state, limit, trim
+
 # ----------------------------------------
 # CONSTANTS
 # ----------------------------------------
 WORK_TIME = 25 * 60     # 25 min
 BREAK_TIME = 5 * 60     # 5 min
+HISTORY_LIMIT = limit("countdown.history", 200)  # dashboard rows kept
 
 
 # ----------------------------------------
@@ -58,8 +62,6 @@ That's it — stay focused!
     # ----------------------------------------
 # LIVE DIGITAL CLOCK (Seven-Segment)
 # ----------------------------------------
-    clock_placeholder = st.empty()
-
     def render_digital_clock():
             now = time.localtime()
             hours = str(now.tm_hour % 12 or 12)
@@ -70,41 +72,32 @@ That's it — stay focused!
             mT, mM, mB = sevseg.getSevSegStr(minutes, 2).splitlines()
             sT, sM, sB = sevseg.getSevSegStr(seconds, 2).splitlines()
 
-            clock_placeholder.code(
+            st.code(
 f"""{hT}   {mT}   {sT}
 {hM} * {mM} * {sM}
 {hB} * {mB} * {sB}"""
             )
         # language="text")
 
-           
-    render_digital_clock()
+    animate("countdown_clock", render_digital_clock, interval=1.0)
 
     # ----------------------------------------
     # STATE INIT
     # ----------------------------------------
-    if "running" not in st.session_state:
-        st.session_state.running = False
-
-    if "paused" not in st.session_state:
-        st.session_state.paused = False
-
-    if "remaining" not in st.session_state:
-        st.session_state.remaining = 0
-
-    if "total_time" not in st.session_state:
-        st.session_state.total_time = 0
-
-    if "pomodoro_mode" not in st.session_state:
-        st.session_state.pomodoro_mode = "work"
-
-    if "stats" not in st.session_state:
-        st.session_state.stats = {
+    state = game_state(
+        "countdown",
+        running=False,
+        paused=False,
+        remaining=0,
+        total_time=0,
+        pomodoro_mode="work",
+        stats=lambda: {
             "work_sessions": 0,
             "break_sessions": 0,
             "total_focus_minutes": 0,
             "history": []
-        }
+        },
+    )
 
     # ----------------------------------------
     # MODE SELECTION
@@ -126,40 +119,43 @@ f"""{hT}   {mT}   {sT}
     # ----------------------------------------
     # BUTTON LOGIC
     # ----------------------------------------
+    if start or resume:
+        reset_clock("countdown")
+
     if start:
-        st.session_state.paused = False
-        st.session_state.running = True
+        state["paused"] = False
+        state["running"] = True
 
         if mode == "Normal Countdown":
-            st.session_state.remaining = int(user_seconds)
-            st.session_state.total_time = int(user_seconds)
+            state["remaining"] = int(user_seconds)
+            state["total_time"] = int(user_seconds)
         else:
-            if st.session_state.pomodoro_mode == "work":
-                st.session_state.remaining = WORK_TIME
-                st.session_state.total_time = WORK_TIME
+            if state["pomodoro_mode"] == "work":
+                state["remaining"] = WORK_TIME
+                state["total_time"] = WORK_TIME
             else:
-                st.session_state.remaining = BREAK_TIME
-                st.session_state.total_time = BREAK_TIME
+                state["remaining"] = BREAK_TIME
+                state["total_time"] = BREAK_TIME
 
     if pause:
-        st.session_state.paused = True
+        state["paused"] = True
 
     if resume:
-        st.session_state.paused = False
-        st.session_state.running = True
+        state["paused"] = False
+        state["running"] = True
 
     if reset:
-        st.session_state.running = False
-        st.session_state.paused = False
-        st.session_state.remaining = 0
-        st.session_state.total_time = 0
+        state["running"] = False
+        state["paused"] = False
+        state["remaining"] = 0
+        state["total_time"] = 0
 
     # ----------------------------------------
-    # ACTIVE TIMER LOOP
+    # ACTIVE TIMER (only this region refreshes, once a second)
     # ----------------------------------------
-    if st.session_state.running and not st.session_state.paused:
-        remaining = st.session_state.remaining
-        total = st.session_state.total_time
+    def render_timer():
+        remaining = state["remaining"]
+        total = state["total_time"]
 
         # ----------- COLOR LOGIC -----------
         pct = remaining / total if total else 1
@@ -191,64 +187,69 @@ f"""{hT}   {mT}   {sT}
         )
         st.markdown("</span>", unsafe_allow_html=True)
 
-        # ----------- END OF TIMER -----------
-        if remaining == 0:
+    def tick():
+        if state["remaining"] > 0:
+            state["remaining"] -= 1
+            return
 
-            if mode == "Normal Countdown":
-                st.success("💥 BOOM! Time's up!")
-                st.session_state.running = False
+        # ----------- END OF TIMER -----------
+        if mode == "Normal Countdown":
+            state["notice"] = "💥 BOOM! Time's up!"
+            state["running"] = False
 
-                if st.session_state.total_time >= 60:
-                    st.session_state.stats["history"].append({
-                        "type": "countdown",
-                        "minutes": st.session_state.total_time // 60,
-                        "seconds": st.session_state.total_time,
-                        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-                    })
+            if state["total_time"] >= 60:
+                state["stats"]["history"].append({
+                    "type": "countdown",
+                    "minutes": state["total_time"] // 60,
+                    "seconds": state["total_time"],
+                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+                })
 
+        else:
+            # Pomodoro logic
+            if state["pomodoro_mode"] == "work":
+                state["stats"]["work_sessions"] += 1
+                state["stats"]["total_focus_minutes"] += WORK_TIME // 60
+                state["stats"]["history"].append({
+                    "type": "work",
+                    "minutes": WORK_TIME // 60,
+                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+                })
+
+                state["notice"] = "✅ Work session done! Break time!"
+                state["pomodoro_mode"] = "break"
+                state["remaining"] = BREAK_TIME
+                state["total_time"] = BREAK_TIME
 
             else:
-                # Pomodoro logic
-                if st.session_state.pomodoro_mode == "work":
-                    st.session_state.stats["work_sessions"] += 1
-                    st.session_state.stats["total_focus_minutes"] += WORK_TIME // 60
-                    st.session_state.stats["history"].append({
-                        "type": "work",
-                        "minutes": WORK_TIME // 60,
-                        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-                    })
-
-                    st.success("✅ Work session done! Break time!")
-                    st.session_state.pomodoro_mode = "break"
-                    st.session_state.remaining = BREAK_TIME
-                    st.session_state.total_time = BREAK_TIME
-
-                else:
-                    st.session_state.stats["break_sessions"] += 1
-                    st.session_state.stats["history"].append({
-                        "type": "break",
-                        "minutes": BREAK_TIME // 60,
-                        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-                    })
-
-                    st.success("✅ Break over! Back to work!")
-                    st.session_state.pomodoro_mode = "work"
-                    st.session_state.remaining = WORK_TIME
-                    st.session_state.total_time = WORK_TIME
-
-            time.sleep(1)
-            st.rerun()
+                state["stats"]["break_sessions"] += 1
+                state["stats"]["history"].append({
+                    "type": "break",
+                    "minutes": BREAK_TIME // 60,
+                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+                })
 
-        else:
-            time.sleep(1)
-            st.session_state.remaining -= 1
-            st.rerun()
+                state["notice"] = "✅ Break over! Back to work!"
+                state["pomodoro_mode"] = "work"
+                state["remaining"] = WORK_TIME
+                state["total_time"] = WORK_TIME
+
+        # Old rows fall off; the counters above stay cumulative.
+        trim(state["stats"]["history"], HISTORY_LIMIT)
+        # Full rerun so the dashboard below picks up the new stats.
+        return False
+
+    if state["running"] and not state["paused"]:
+        animate("countdown", render_timer, step=tick, interval=1.0, max_catchup=60)
+
+    if state.get("notice"):
+        st.success(state.pop("notice"))
 
     # ----------------------------------------
     # PRODUCTIVITY DASHBOARD
     # ----------------------------------------
     st.header("📊 Productivity Dashboard")
-    stats = st.session_state.stats
+    stats = state["stats"]
 
     c1, c2, c3 = st.columns(3)
     c1.metric("✅ Work Sessions", stats["work_sessions"])
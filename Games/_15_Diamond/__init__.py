@@ -0,0 +1,6 @@
+GAME = {
+    "id": "diamond",
+    "emoji": "💎",
+    "name": "Animated Diamonds",
+    "desc": "Rotating diamond art",
+}
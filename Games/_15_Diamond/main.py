@@ -1,24 +1,29 @@
 import streamlit as st
 import time
 
+from Games.common.memo import memoize
+
 # ----------------------------
 # FUNCTIONS
 # ----------------------------
+# Shapes depend only on size and are shared across sessions (hence tuples).
+@memoize("diamond.outline", maxsize=128)
 def display_outline_diamond(size):
     lines = []
     for i in range(size):
         lines.append(' ' * (size - i - 1) + '/' + ' ' * (i * 2) + '\\')
     for i in range(size):
         lines.append(' ' * i + '\\' + ' ' * ((size - i - 1) * 2) + '/')
-    return lines
+    return tuple(lines)
 
+@memoize("diamond.filled", maxsize=128)
 def display_filled_diamond(size):
     lines = []
     for i in range(size):
         lines.append(' ' * (size - i - 1) + '/' * (i + 1) + '\\' * (i + 1))
     for i in range(size):
         lines.append(' ' * i + '\\' * (size - i) + '/' * (size - i))
-    return lines
+    return tuple(lines)
 
 def rotate_lines_90(lines):
     max_len = max(len(line) for line in lines)
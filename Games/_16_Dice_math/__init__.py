@@ -0,0 +1,6 @@
+GAME = {
+    "id": "dice_math",
+    "emoji": "🎲",
+    "name": "Dice Math",
+    "desc": "Dice sum quiz",
+}
@@ -2,6 +2,9 @@ import streamlit as st
 import random
 import time
 
+from Games.common.animation import animate
+from Games.common.state import game_state
+
 # -------------------------
 # ASCII DICE DATA
 # -------------------------
@@ -80,9 +83,10 @@ def run():
         "PENALTY": 1
     }
 
+    state = game_state("dice_math")
     for key, value in defaults.items():
-        if key not in st.session_state:
-            st.session_state[key] = value
+        if key not in state:
+            state[key] = value
 
     # -------------------------
     # UI
@@ -109,10 +113,10 @@ def run():
     )
 
     # Choose difficulty before starting
-    if not st.session_state.game_started:
+    if not state["game_started"]:
 
     # Show difficulty selection ONLY once
-        if st.session_state.difficulty is None:
+        if state["difficulty"] is None:
 
             st.subheader("Select Difficulty")
             difficulty = st.radio(
@@ -123,59 +127,64 @@ def run():
 
             # Apply difficulty based on selection
             if difficulty == "Easy":
-                st.session_state.MIN_DICE = 1
-                st.session_state.MAX_DICE = 3
-                st.session_state.QUIZ_DURATION = 40
-                st.session_state.REWARD = 3
-                st.session_state.PENALTY = 1
+                state["MIN_DICE"] = 1
+                state["MAX_DICE"] = 3
+                state["QUIZ_DURATION"] = 40
+                state["REWARD"] = 3
+                state["PENALTY"] = 1
 
             elif difficulty == "Medium":
-                st.session_state.MIN_DICE = 2
-                st.session_state.MAX_DICE = 6
-                st.session_state.QUIZ_DURATION = 30
-                st.session_state.REWARD = 4
-                st.session_state.PENALTY = 2
+                state["MIN_DICE"] = 2
+                state["MAX_DICE"] = 6
+                state["QUIZ_DURATION"] = 30
+                state["REWARD"] = 4
+                state["PENALTY"] = 2
 
             elif difficulty == "Hard":
-                st.session_state.MIN_DICE = 4
-                st.session_state.MAX_DICE = 8
-                st.session_state.QUIZ_DURATION = 20
-                st.session_state.REWARD = 6
-                st.session_state.PENALTY = 3
+                state["MIN_DICE"] = 4
+                state["MAX_DICE"] = 8
+                state["QUIZ_DURATION"] = 20
+                state["REWARD"] = 6
+                state["PENALTY"] = 3
 
             if st.button("Start Quiz"):
-                st.session_state.difficulty = difficulty  # ✅ lock difficulty
-                st.session_state.game_started = True
-                st.session_state.end_time = time.time() + st.session_state.QUIZ_DURATION
-                st.session_state.question_ready = False
-                st.session_state.score = 0
+                state["difficulty"] = difficulty  # ✅ lock difficulty
+                state["game_started"] = True
+                state["end_time"] = time.time() + state["QUIZ_DURATION"]
+                state["question_ready"] = False
+                state["score"] = 0
                 st.rerun()
 
             st.stop()
 
         else:
             # ✅ Difficulty already chosen, no need to click twice
-            st.session_state.game_started = True
+            state["game_started"] = True
             st.rerun()
 
     # -------------------------
     # TIMER + PROGRESS BAR
     # -------------------------
-    time_left = int(st.session_state.end_time - time.time())
-    time_left = max(time_left, 0)
-
-    st.write(f"⏳ Time Left: **{time_left} sec**")
+    def get_time_left():
+        return max(int(state["end_time"] - time.time()), 0)
 
-    # Progress bar (1.0 → full, 0.0 → empty)
-    progress = time_left / st.session_state.QUIZ_DURATION
-    st.progress(progress)
-
-    if time_left <= 0:
-        st.session_state.game_started = False
+    if get_time_left() <= 0:
+        state["game_started"] = False
         st.error("⏱️ Time’s up!")
-        st.success(f"✅ Final Score: {st.session_state.score}")
+        st.success(f"✅ Final Score: {state['score']}")
         st.stop()
 
+    def render_timer():
+        time_left = get_time_left()
+        st.write(f"⏳ Time Left: **{time_left} sec**")
+
+        # Progress bar (1.0 → full, 0.0 → empty)
+        progress = time_left / state["QUIZ_DURATION"]
+        st.progress(progress)
+
+    # Refreshes every second on its own; a full rerun happens only when time is up.
+    animate("dice_math", render_timer, step=lambda: get_time_left() > 0, interval=1.0)
+
     # -------------------------
     # GENERATE QUESTION
     # -------------------------
@@ -184,7 +193,7 @@ def run():
         used_positions = []
         sum_total = 0
 
-        dice_count = random.randint(st.session_state.MIN_DICE, st.session_state.MAX_DICE)
+        dice_count = random.randint(state["MIN_DICE"], state["MAX_DICE"])
 
         for _ in range(dice_count):
             die = random.choice(ALL_DICE)
@@ -208,31 +217,27 @@ def run():
         return "\n".join("".join(row) for row in canvas), sum_total
 
     # New question
-    if not st.session_state.question_ready:
+    if not state["question_ready"]:
         canvas_str, ans = generate_question()
-        st.session_state.canvas_str = canvas_str
-        st.session_state.sum_answer = ans
-        st.session_state.question_ready = True
+        state["canvas_str"] = canvas_str
+        state["sum_answer"] = ans
+        state["question_ready"] = True
 
     # Show dice
-    st.text(st.session_state.canvas_str)
+    st.text(state["canvas_str"])
 
     # Answer input
     user_answer = st.number_input("Enter total sum:", step=1, key="user_input")
 
     if st.button("Submit Answer", key="submit_button"):
-        if user_answer == st.session_state.sum_answer:
-            st.session_state.score += st.session_state.REWARD
+        if user_answer == state["sum_answer"]:
+            state["score"] += state["REWARD"]
             st.success("✅ Correct!")
         else:
-            st.session_state.score -= st.session_state.PENALTY
-            st.error(f"❌ Wrong! Correct answer: {st.session_state.sum_answer}")
+            state["score"] -= state["PENALTY"]
+            st.error(f"❌ Wrong! Correct answer: {state['sum_answer']}")
 
-        st.session_state.question_ready = False
+        state["question_ready"] = False
         st.rerun()
 
-    st.write(f"📊 **Score:** {st.session_state.score}")
-
-    # Auto-refresh timer every second
-    time.sleep(1)
-    st.rerun()
+    st.write(f"📊 **Score:** {state['score']}")
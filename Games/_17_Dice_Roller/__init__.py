@@ -0,0 +1,6 @@
+GAME = {
+    "id": "dice_roll",
+    "emoji": "🐉",
+    "name": "Dice Roller",
+    "desc": "DnD style roller",
+}
@@ -0,0 +1,6 @@
+GAME = {
+    "id": "matrix",
+    "emoji": "💻",
+    "name": "Matrix Rain",
+    "desc": "Hacker animation",
+}
@@ -0,0 +1,6 @@
+GAME = {
+    "id": "dna",
+    "emoji": "🧬",
+    "name": "DNA Visualization",
+    "desc": "Visualize DNA strands",
+}
@@ -0,0 +1,6 @@
+GAME = {
+    "id": "ducklings",
+    "emoji": "🐥",
+    "name": "Ducklings",
+    "desc": "Cute terminal animation",
+}
@@ -0,0 +1,6 @@
+GAME = {
+    "id": "etching",
+    "emoji": "🖌",
+    "name": "Etching Drawer",
+    "desc": "Sketch with WASD moves",
+}
@@ -1,7 +1,10 @@
 # etching_drawer_streamlit.py
 import streamlit as st
-from PIL import Image, ImageDraw, ImageFont
-import io
+from PIL import Image, ImageDraw
+
+from Games.common.images import cached_png, load_font
+from Games.common.state import game_state, limit, trim
+from Games.common.textgrid import TextGrid
 
 # Unicode characters for drawing
 UP_DOWN_CHAR         = chr(9474)   # │
@@ -19,6 +22,9 @@ CROSS_CHAR           = chr(9532)   # ┼
 CANVAS_WIDTH = 40
 CANVAS_HEIGHT = 20
 
+# Moves older than this are folded into a base canvas and can't be undone.
+MOVES_LIMIT = limit("etching.moves", 500)
+
 
 # ✅ Central classifier — used by both text and PNG renderers
 def classify(d):
@@ -55,27 +61,25 @@ def classify(d):
     return ' '
 
 
-def get_canvas_string(canvas, cx, cy):
-    canvas_str = ''
-    for row in range(CANVAS_HEIGHT):
-        for col in range(CANVAS_WIDTH):
-            if col == cx and row == cy:
-                canvas_str += '#'
-                continue
+# Cells are rendered as a bitmask of their directions; precompute every glyph.
+DIRECTION_BITS = {'W': 1, 'A': 2, 'S': 4, 'D': 8}
+MASK_GLYPHS = tuple(
+    classify({d for d, bit in DIRECTION_BITS.items() if mask & bit}) for mask in range(16)
+)
+
 
-            cell = canvas.get((col, row))
-            if cell is None:
-                canvas_str += ' '
-            else:
-                canvas_str += classify(cell)
-        canvas_str += '\n'
-    return canvas_str
+def get_canvas_string(canvas, cx, cy, view=None):
+    rows = [[0] * CANVAS_WIDTH for _ in range(CANVAS_HEIGHT)]
+    for (x, y), directions in canvas.items():
+        rows[y][x] = sum(DIRECTION_BITS[d] for d in directions)
+    view = view or TextGrid(MASK_GLYPHS)
+    return view.render(rows, {(cx, cy): '#'}) + '\n'
 
 
 def render_image(canvas):
     img = Image.new('RGB', (CANVAS_WIDTH*20, CANVAS_HEIGHT*20), color='white')
     draw = ImageDraw.Draw(img)
-    font = ImageFont.load_default()
+    font = load_font()
 
     for (x, y), directions in canvas.items():
         draw.text((x*20, y*20), classify(directions), fill='black', font=font)
@@ -83,101 +87,113 @@ def render_image(canvas):
     return img
 
 
-def run():
-    st.title("🖌 Etching Drawer")
+def apply_move(canvas, cursorX, cursorY, command):
+    """Draw one WASD move on ``canvas``; returns the new cursor position."""
+    if (cursorX, cursorY) not in canvas:
+        canvas[(cursorX, cursorY)] = set()
 
-    if "canvas" not in st.session_state:
-        st.session_state.canvas = {}
+    if command == 'W' and cursorY > 0:
+        canvas[(cursorX, cursorY)].add('W')
+        cursorY -= 1
+        canvas.setdefault((cursorX, cursorY), set()).add('S')
 
-    if "cursor" not in st.session_state:
-        st.session_state.cursor = [0, 0]
+    elif command == 'S' and cursorY < CANVAS_HEIGHT - 1:
+        canvas[(cursorX, cursorY)].add('S')
+        cursorY += 1
+        canvas.setdefault((cursorX, cursorY), set()).add('W')
 
-    if "moves" not in st.session_state:
-        st.session_state.moves = []
+    elif command == 'A' and cursorX > 0:
+        canvas[(cursorX, cursorY)].add('A')
+        cursorX -= 1
+        canvas.setdefault((cursorX, cursorY), set()).add('D')
 
-    if "redo_stack" not in st.session_state:
-        st.session_state.redo_stack = []
+    elif command == 'D' and cursorX < CANVAS_WIDTH - 1:
+        canvas[(cursorX, cursorY)].add('D')
+        cursorX += 1
+        canvas.setdefault((cursorX, cursorY), set()).add('A')
 
+    return cursorX, cursorY
 
-    cursorX, cursorY = st.session_state.cursor
+
+def fold_moves(state):
+    """Bake the moves beyond ``MOVES_LIMIT`` into the base canvas."""
+    excess = len(state["moves"]) - MOVES_LIMIT
+    if excess <= 0:
+        return
+    cursorX, cursorY = state["base_cursor"]
+    for command in state["moves"][:excess]:
+        cursorX, cursorY = apply_move(state["base"], cursorX, cursorY, command)
+    state["base_cursor"] = [cursorX, cursorY]
+    del state["moves"][:excess]
+
+
+def run():
+    st.title("🖌 Etching Drawer")
+
+    state = game_state(
+        "etching",
+        base=dict,                    # canvas with the folded (oldest) moves
+        base_cursor=lambda: [0, 0],
+        moves=list,
+        redo_stack=list,
+        view=lambda: TextGrid(MASK_GLYPHS),
+    )
 
     st.text("Use WASD buttons to draw. Undo, Redo, Download as PNG available.")
 
     col1, col2, col3, col4, col5 = st.columns(5)
     with col1:
         if st.button('W'):
-            st.session_state.moves.append('W')
+            state["moves"].append('W')
     with col2:
         if st.button('A'):
-            st.session_state.moves.append('A')
+            state["moves"].append('A')
     with col3:
         if st.button('S'):
-            st.session_state.moves.append('S')
+            state["moves"].append('S')
     with col4:
         if st.button('D'):
-            st.session_state.moves.append('D')
+            state["moves"].append('D')
     with col5:
         if st.button('Clear'):
-            st.session_state.canvas = {}
-            st.session_state.moves = []
-            st.session_state.redo_stack = []
+            state["base"] = {}
+            state["base_cursor"] = [0, 0]
+            state["moves"] = []
+            state["redo_stack"] = []
+
+    fold_moves(state)
+
+    # Rebuild canvas from the base plus the undoable moves
+    canvas = {cell: set(directions) for cell, directions in state["base"].items()}
+    cursorX, cursorY = state["base_cursor"]
+    for command in state["moves"]:
+        cursorX, cursorY = apply_move(canvas, cursorX, cursorY, command)
 
     undo_col, redo_col, download_col = st.columns(3)
     with undo_col:
         if st.button('Undo'):
-            if st.session_state.moves:
-                move = st.session_state.moves.pop()
-                st.session_state.redo_stack.append(move)
+            if state["moves"]:
+                move = state["moves"].pop()
+                state["redo_stack"].append(move)
+                trim(state["redo_stack"], MOVES_LIMIT)
+                st.rerun()
     with redo_col:
         if st.button('Redo'):
-            if st.session_state.redo_stack:
-                st.session_state.moves.append(st.session_state.redo_stack.pop())
+            if state["redo_stack"]:
+                state["moves"].append(state["redo_stack"].pop())
+                st.rerun()
     with download_col:
         if st.button('Download PNG'):
-            img = render_image(st.session_state.canvas)
-            buf = io.BytesIO()
-            img.save(buf, format='PNG')
+            # Keyed on the drawing itself, so re-downloading an unchanged canvas is free.
+            cells = tuple(sorted((cell, ''.join(sorted(d))) for cell, d in canvas.items()))
+            png = cached_png(("etching", cells), lambda: render_image(canvas))
             st.download_button(
                 label="Download Drawing",
-                data=buf.getvalue(),
+                data=png,
                 file_name="drawing.png",
                 mime="image/png"
             )
 
-    # Rebuild canvas from moves
-    st.session_state.canvas = {}
-    # Rebuild from moves
-    cursorX, cursorY = st.session_state.cursor  # restore persisted cursor
-    st.session_state.canvas = {}
-
-    for command in st.session_state.moves:
-        if (cursorX, cursorY) not in st.session_state.canvas:
-            st.session_state.canvas[(cursorX, cursorY)] = set()
-
-        if command == 'W' and cursorY > 0:
-            st.session_state.canvas[(cursorX, cursorY)].add('W')
-            cursorY -= 1
-            st.session_state.canvas.setdefault((cursorX, cursorY), set()).add('S')
-
-        elif command == 'S' and cursorY < CANVAS_HEIGHT - 1:
-            st.session_state.canvas[(cursorX, cursorY)].add('S')
-            cursorY += 1
-            st.session_state.canvas.setdefault((cursorX, cursorY), set()).add('W')
-
-        elif command == 'A' and cursorX > 0:
-            st.session_state.canvas[(cursorX, cursorY)].add('A')
-            cursorX -= 1
-            st.session_state.canvas.setdefault((cursorX, cursorY), set()).add('D')
-
-        elif command == 'D' and cursorX < CANVAS_WIDTH - 1:
-            st.session_state.canvas[(cursorX, cursorY)].add('D')
-            cursorX += 1
-            st.session_state.canvas.setdefault((cursorX, cursorY), set()).add('A')
-
-    # SAVE BACK FINAL CURSOR
-    st.session_state.cursor = [cursorX, cursorY]
-
-
     st.markdown(
     """
     <style>
@@ -193,7 +209,7 @@ def run():
     )
 
     st.markdown(
-        f"<pre class='etching'>{get_canvas_string(st.session_state.canvas, cursorX, cursorY)}</pre>",
+        f"<pre class='etching'>{get_canvas_string(canvas, cursorX, cursorY, state['view'])}</pre>",
         unsafe_allow_html=True
     )
 
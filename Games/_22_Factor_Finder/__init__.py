@@ -0,0 +1,6 @@
+GAME = {
+    "id": "factor",
+    "emoji": "🔢",
+    "name": "Factor Finder",
+    "desc": "Analyze numbers",
+}
@@ -1,6 +1,23 @@
 import streamlit as st
 import math
 
+from Games.common.memo import memoize
+
+
+# ------------------------------------------------------
+# FACTORS
+# ------------------------------------------------------
+@memoize("factor_finder.factors", maxsize=1024, disk=True)
+def find_factors(n):
+    """Sorted tuple of every factor of ``n`` (trial division up to sqrt(n))."""
+    factors = set()
+    for i in range(1, int(math.sqrt(n)) + 1):
+        if n % i == 0:
+            factors.add(i)
+            factors.add(n // i)
+
+    return tuple(sorted(factors))
+
 
 # ------------------------------------------------------
 # MAIN APP FUNCTION
@@ -31,13 +48,7 @@ def run():
         # -------------------------
         # FIND FACTORS
         # -------------------------
-        factors = set()
-        for i in range(1, int(math.sqrt(n)) + 1):
-            if n % i == 0:
-                factors.add(i)
-                factors.add(n // i)
-
-        factors = sorted(list(factors))
+        factors = find_factors(n)
 
         st.code(", ".join(str(x) for x in factors))
 
@@ -57,7 +68,7 @@ def run():
         st.write("---")
         st.write("### 📊 Factor Chart")
 
-        chart_data = {"factor": factors}
+        chart_data = {"factor": list(factors)}
         st.bar_chart(chart_data)
 
 
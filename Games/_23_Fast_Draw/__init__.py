@@ -0,0 +1,6 @@
+GAME = {
+    "id": "fastdraw",
+    "emoji": "🤠",
+    "name": "Fast Draw",
+    "desc": "Test your reflexes",
+}
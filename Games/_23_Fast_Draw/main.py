@@ -1,11 +1,13 @@
 import streamlit as st
 import time, random
+from Games.common.state import game_state
 
 
 # ------------------------------------------------------
 # Session State Initialization
 # ------------------------------------------------------
 def init_stats():
+    state = game_state("fastdraw")
     defaults = {
         "attempts": 0,
         "wins": 0,
@@ -16,8 +18,9 @@ def init_stats():
         "phase": "idle",  # idle → waiting → draw
     }
     for k, v in defaults.items():
-        if k not in st.session_state:
-            st.session_state[k] = v
+        if k not in state:
+            state[k] = v
+    return state
 
 
 # ------------------------------------------------------
@@ -25,7 +28,7 @@ def init_stats():
 # ------------------------------------------------------
 def run():
     st.set_page_config(page_title="Fast Draw", layout="centered")
-    init_stats()
+    state = init_stats()
 
     st.title("🤠 Fast Draw — Reflex Tester")
 
@@ -56,27 +59,27 @@ def run():
     # START ROUND
     # ------------------------------------------------------
     if st.button("Start Round"):
-        st.session_state.phase = "waiting"
-        st.session_state.draw_time = None
+        state["phase"] = "waiting"
+        state["draw_time"] = None
         st.rerun()
 
     # ------------------------------------------------------
     # WAITING PHASE
     # ------------------------------------------------------
-    if st.session_state.phase == "waiting" and st.session_state.draw_time is None:
+    if state["phase"] == "waiting" and state["draw_time"] is None:
         st.subheader("⏳ It is high noon... get ready.")
         wait = random.uniform(2, 4)
         time.sleep(wait)
 
         # Transition to DRAW phase
-        st.session_state.draw_time = time.time()
-        st.session_state.phase = "draw"
+        state["draw_time"] = time.time()
+        state["phase"] = "draw"
         st.rerun()
 
     # ------------------------------------------------------
     # DRAW PHASE
     # ------------------------------------------------------
-    if st.session_state.phase == "draw":
+    if state["phase"] == "draw":
         st.markdown("## 🎯 **DRAW!**")
 
     # ------------------------------------------------------
@@ -84,25 +87,25 @@ def run():
     # ------------------------------------------------------
     clicked = st.button(
         "CLICK NOW!",
-        disabled=(st.session_state.phase != "draw"),  # Only active when draw phase
+        disabled=(state["phase"] != "draw"),  # Only active when draw phase
         use_container_width=True
     )
 
-    if clicked and st.session_state.phase == "draw":
-        reaction = time.time() - st.session_state.draw_time
-        st.session_state.attempts += 1
+    if clicked and state["phase"] == "draw":
+        reaction = time.time() - state["draw_time"]
+        state["attempts"] += 1
 
         if reaction <= allowed:
             st.success(f"🔥 FAST! Reaction time: **{round(reaction,4)}s**")
-            st.session_state.wins += 1
-            st.session_state.times.append(reaction)
+            state["wins"] += 1
+            state["times"].append(reaction)
         else:
             st.error(f"Too slow! ({round(reaction,4)}s)")
-            st.session_state.losses += 1
-            st.session_state.times.append(reaction)
+            state["losses"] += 1
+            state["times"].append(reaction)
 
-        st.session_state.phase = "idle"
-        st.session_state.draw_time = None
+        state["phase"] = "idle"
+        state["draw_time"] = None
 
     # ------------------------------------------------------
     # DASHBOARD (Beautiful UI)
@@ -111,14 +114,14 @@ def run():
     st.header("📊 Performance Dashboard")
 
     col1, col2, col3 = st.columns(3)
-    col1.metric("Attempts", st.session_state.attempts)
-    col2.metric("Wins", st.session_state.wins)
-    col3.metric("Losses", st.session_state.losses)
+    col1.metric("Attempts", state["attempts"])
+    col2.metric("Wins", state["wins"])
+    col3.metric("Losses", state["losses"])
 
-    if st.session_state.times:
-        best = min(st.session_state.times)
-        worst = max(st.session_state.times)
-        avg = sum(st.session_state.times) / len(st.session_state.times)
+    if state["times"]:
+        best = min(state["times"])
+        worst = max(state["times"])
+        avg = sum(state["times"]) / len(state["times"])
 
         st.write("### Reaction Summary")
         c1, c2, c3 = st.columns(3)
@@ -127,10 +130,10 @@ def run():
         c3.error(f"**Worst:** {round(worst,4)}s")
 
         st.write("### Reaction Timeline")
-        st.bar_chart(st.session_state.times)
+        st.bar_chart(state["times"])
 
     if st.button("Reset Stats"):
         for k in ["attempts","wins","losses","times","draw_time","waiting","phase"]:
-            st.session_state[k] = 0 if k in ["attempts","wins","losses"] else []
+            state[k] = 0 if k in ["attempts","wins","losses"] else []
         st.success("✅ Stats Cleared!")
         st.rerun()
@@ -0,0 +1,6 @@
+GAME = {
+    "id": "fibonacci",
+    "emoji": "🌀",
+    "name": "Fibonacci",
+    "desc": "Sequence generator",
+}
@@ -1,8 +1,14 @@
+import math
+
 import streamlit as st
-import matplotlib.pyplot as plt
 import networkx as nx
 from functools import lru_cache
 
+from Games.common import charts, jobs
+from Games.common.memo import memoize
+from Games.common.series import downsample
+from Games.common.state import game_state
+
 
 # -------------------------------------------------
 # SAFE RECURSIVE FIBONACCI (WITH LRU CACHE)
@@ -17,6 +23,7 @@ def fib_safe(n: int):
 # -------------------------------------------------
 # ITERATIVE FIBONACCI
 # -------------------------------------------------
+@memoize("fibonacci.fib_fast", maxsize=256)
 def fib_fast(n: int):
     if n == 1:
         return 0
@@ -29,6 +36,48 @@ def fib_fast(n: int):
     return b
 
 
+# -------------------------------------------------
+# HUGE N (BACKGROUND JOB)
+# -------------------------------------------------
+BACKGROUND_N = 20_000  # past this F(n) has >4000 digits and takes a while
+DIGITS_SHOWN = 50
+
+
+def fib_summary(n, progress=None, block=65536):
+    """``fib_fast(n)`` in blocks with progress ticks, summarised for display.
+
+    Returns the digit count, the leading/trailing digits and F(n)/F(n-1)
+    rather than the number itself, which can run to millions of digits.
+    """
+    if progress is not None:
+        progress.total = n
+    a, b = 0, 1  # F1, F2
+    for start in range(3, n + 1, block):
+        for _ in range(start, min(start + block, n + 1)):
+            a, b = b, a + b
+        if progress is not None:
+            progress.update(min(block, n + 1 - start))
+
+    digits = len(str(b)) if b < 10**4000 else int(b.bit_length() * math.log10(2)) + 1
+    if 10 ** (digits - 1) > b:  # the bit-length estimate can be one too high
+        digits -= 1
+    return {
+        "n": n,
+        "digits": digits,
+        "head": str(b // 10 ** max(0, digits - DIGITS_SHOWN)),
+        "tail": str(b % 10 ** DIGITS_SHOWN).zfill(min(digits, DIGITS_SHOWN)),
+        "phi": b / a,
+    }
+
+
+def show_summary(summary):
+    st.write("### ✅ Result")
+    st.success(f"Iterative Mode → Fibonacci #{summary['n']:,} has {summary['digits']:,} digits")
+    st.code(f"{summary['head']}…{summary['tail']}", language=None)
+    st.metric("Golden Ratio Convergence", f"{summary['phi']:.10f}")
+    st.caption("The timeline is skipped for N this large.")
+
+
 # -------------------------------------------------
 # BUILD GRAPH FOR RECURSION TREE
 # -------------------------------------------------
@@ -76,29 +125,37 @@ def hierarchy_pos(G, root):
 # DRAW TREE WITHOUT GRAPHVIZ
 # -------------------------------------------------
 def draw_tree_graph(n):
-    G = nx.DiGraph()
-    build_recursion_graph(n, G)
-
-    root = "fib(" + str(n) + ")"
-    pos = hierarchy_pos(G, root)
-
-    plt.figure(figsize=(12, 8))
-    nx.draw(
-        G,
-        pos,
-        with_labels=True,
-        arrows=False,
-        node_size=1800,
-        font_size=9,
-        font_weight="bold",
-    )
-    st.pyplot(plt)
+    def draw(fig):
+        G = nx.DiGraph()
+        build_recursion_graph(n, G)
+
+        root = "fib(" + str(n) + ")"
+        pos = hierarchy_pos(G, root)
+
+        nx.draw(
+            G,
+            pos,
+            ax=fig.subplots(),
+            with_labels=True,
+            arrows=False,
+            node_size=1800,
+            font_size=9,
+            font_weight="bold",
+        )
+
+    # The tree only depends on n, so each size is laid out and rasterized once.
+    charts.show_chart(("fibonacci.tree", n), draw, figsize=(12, 8))
 
 
 # -------------------------------------------------
 # ITERATIVE VISUALIZATION (TIMELINE)
 # -------------------------------------------------
-def draw_iterative_timeline(n):
+MAX_TICKS = 20
+FLOAT_MAX_N = 1400  # near float max (F1478 overflows) the axis ticker breaks
+
+
+def timeline_points(n):
+    """Term numbers and values of F1..Fn, reduced to at most MAX_POINTS points."""
     seq = []
     a, b = 0, 1
     seq.append(a)
@@ -109,13 +166,31 @@ def draw_iterative_timeline(n):
         a, b = b, a + b
         seq.append(b)
 
-    plt.figure(figsize=(12, 2))
-    plt.plot(range(len(seq)), seq, marker="o")
-    plt.xticks(range(len(seq)), [f"F{i+1}" for i in range(len(seq))], rotation=45)
-    plt.title("Iterative Fibonacci Timeline")
-    plt.grid(True)
+    return downsample(seq, range(1, len(seq) + 1))
+
+
+def draw_iterative_timeline(n, native=False):
+    if n > FLOAT_MAX_N:
+        st.caption(f"Timeline shown up to F{FLOAT_MAX_N}; later terms are too large to plot.")
+        n = FLOAT_MAX_N
+    if native:
+        terms, values = timeline_points(n)
+        charts.line_chart("fibonacci.timeline", terms, values,
+                          title="Iterative Fibonacci Timeline", xlabel="n", ylabel="F(n)",
+                          native=True)
+        return
+
+    def draw(fig):
+        terms, values = timeline_points(n)
+        ax = fig.subplots()
+        ax.plot(terms, values, marker="o" if len(terms) <= 100 else None)
+        # One label per term stops being readable (and gets slow) past a few dozen.
+        ticks = terms[::math.ceil(len(terms) / MAX_TICKS)]
+        ax.set_xticks(ticks, [f"F{i}" for i in ticks], rotation=45)
+        ax.set_title("Iterative Fibonacci Timeline")
+        ax.grid(True)
 
-    st.pyplot(plt)
+    charts.show_chart(("fibonacci.timeline", n), draw, figsize=(12, 2))
 
 
 # -------------------------------------------------
@@ -143,12 +218,39 @@ def run():
     )
 
     n = st.number_input("Enter N (example: 5, 20, 40):", min_value=1, step=1)
+    native = st.checkbox("Interactive chart", value=charts.NATIVE,
+                         help="Use Streamlit's native line chart for the timeline.")
 
     if mode.startswith("🛡") and n > 200:
         st.error("Recursive mode supports N ≤ 200 due to recursion depth limits.")
         st.stop()
 
-    if st.button("Generate Fibonacci"):
+    clicked = st.button("Generate Fibonacci")
+    # Huge N runs in the job pool; the job is kept in state across reruns.
+    background = mode.startswith("⚡") and n >= BACKGROUND_N
+    # The collected summary stays in state, so it survives the reruns after
+    # the one that collected it, until the next Generate.
+    state = game_state("fibonacci", summary=None)
+
+    if clicked:
+        state["summary"] = None
+    if clicked and background:
+        jobs.cancel(state)
+        state["job"] = jobs.submit(fib_summary, n, label=f"Computing F{n:,}")
+
+    status, value = jobs.collect(state)
+    if status == "running":
+        jobs.progress_panel(value, key="fibonacci")
+    elif status == "done":
+        state["summary"] = value
+    elif status == "cancelled":
+        st.warning("Computation cancelled.")
+    elif status == "error":
+        st.error(f"Computation failed: {value}")
+    if state["summary"] is not None:
+        show_summary(state["summary"])
+
+    if clicked and not background:
         st.write("### ✅ Result")
 
         if mode.startswith("⚡"):
@@ -172,7 +274,7 @@ def run():
         st.write("## 📊 Visualization")
 
         if mode.startswith("⚡"):
-            draw_iterative_timeline(n)
+            draw_iterative_timeline(n, native)
         else:
             st.write("### 🌳 Recursion Tree")
             if n > 10:
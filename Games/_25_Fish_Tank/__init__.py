@@ -0,0 +1,6 @@
+GAME = {
+    "id": "fish",
+    "emoji": "🐟",
+    "name": "Fish Tank",
+    "desc": "Aquarium simulation",
+}
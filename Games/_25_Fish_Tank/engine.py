@@ -0,0 +1,209 @@
+"""Fish Tank simulation, free of Streamlit.
+
+The whole aquarium is one dict (see ``new_tank``); ``simulate`` advances it
+by a frame and ``draw_frame`` turns it into text. Random draws go through the
+``rng`` argument (a ``random.Random``, e.g. ``Games.common.rng.Rng``).
+"""
+
+from Games.common.profiling import profiled
+
+# ---------------------------------------------------------
+# CONFIG
+# ---------------------------------------------------------
+WIDTH = 70
+HEIGHT = 25
+
+FISH_TYPES = [
+    {'right': ['><>'], 'left': ['<><']},
+    {'right': ['>||>'], 'left': ['<||<']},
+    {'right': ['>))>'], 'left': ['<[[<']},
+]
+
+CRAB_FRAMES = ["(\\_/)=", "=(\\_/)"]
+SAND_CHAR = "░"
+
+# KELP PATTERNS
+KELP_CHARS = ["(", ")"]
+
+
+def new_tank():
+    return {
+        "fishes": [],
+        "crabs": [],
+        "foods": [],
+        "kelps": [],
+        "bubbles": [],
+        "bubblers": [10, 30, 55],
+        "frame": 0,
+    }
+
+
+# ---------------------------------------------------------
+# UTILITY
+# ---------------------------------------------------------
+def empty_grid():
+    return [[" " for _ in range(WIDTH)] for _ in range(HEIGHT)]
+
+def place_text(grid, x, y, text):
+    if 0 <= y < HEIGHT:
+        for i, ch in enumerate(text):
+            if 0 <= x + i < WIDTH:
+                grid[y][x + i] = ch
+
+
+# ---------------------------------------------------------
+# GENERATORS
+# ---------------------------------------------------------
+def generate_fish(rng):
+    f = rng.choice(FISH_TYPES)
+    return {
+        "x": rng.randint(0, WIDTH-4),
+        "y": rng.randint(2, HEIGHT-6),
+        "right": f['right'],
+        "left": f['left'],
+        "dir": rng.choice([1, -1]),
+        "speed": rng.randint(3, 6)
+    }
+
+def generate_crab(rng):
+    return {
+        "x": rng.randint(0, WIDTH-6),
+        "y": HEIGHT - 2,
+        "dir": rng.choice([1, -1]),
+        "frame": 0
+    }
+
+def generate_kelp(rng):
+    height = rng.randint(5, 12)
+    return {
+        "x": rng.randint(1, WIDTH - 2),
+        "segments": [rng.choice(KELP_CHARS) for _ in range(height)]
+    }
+
+
+# ---------------------------------------------------------
+# SIMULATION
+# ---------------------------------------------------------
+@profiled("fish.simulate")
+def simulate(tank, rng):
+    """Advance every creature, bubble and food pellet by one frame."""
+    # FISH MOVEMENT
+    for fish in tank["fishes"]:
+        # If food exists, move toward nearest
+        if tank["foods"]:
+            nearest = min(
+                tank["foods"],
+                key=lambda f: abs(f["x"] - fish["x"]) + abs(f["y"] - fish["y"])
+            )
+
+            if nearest["x"] > fish["x"]:
+                fish["x"] += 1
+                fish["dir"] = 1
+            elif nearest["x"] < fish["x"]:
+                fish["x"] -= 1
+                fish["dir"] = -1
+
+            if nearest["y"] > fish["y"]:
+                fish["y"] += 1
+            elif nearest["y"] < fish["y"]:
+                fish["y"] -= 1
+        else:
+            # Free swim horizontal
+            if tank["frame"] % fish["speed"] == 0:
+                fish["x"] += fish["dir"]
+                if fish["x"] <= 0 or fish["x"] >= WIDTH - 4:
+                    fish["dir"] *= -1
+
+    # CRABS
+    for c in tank["crabs"]:
+        c["x"] += c["dir"]
+        if c["x"] <= 0 or c["x"] >= WIDTH - 6:
+            c["dir"] *= -1
+        c["frame"] = (c["frame"] + 1) % 2
+
+    # KELP WAVING
+    for kelp in tank["kelps"]:
+        for i in range(len(kelp["segments"])):
+            if rng.randint(1, 10) == 1:
+                kelp["segments"][i] = "(" if kelp["segments"][i] == ")" else ")"
+
+    # BUBBLES RISING
+    for b in tank["bubblers"]:
+        # chance of bubble
+        if rng.randint(1, 6) == 1:
+            tank["bubbles"].append({"x": b, "y": HEIGHT-3})
+
+    for bub in tank["bubbles"]:
+        bub["y"] -= 1
+
+    tank["bubbles"] = [
+        b for b in tank["bubbles"] if b["y"] > 0
+    ]
+
+    # FOOD FALLING
+    for f in tank["foods"]:
+        f["y"] += 1
+
+    tank["foods"] = [
+        f for f in tank["foods"] if f["y"] < HEIGHT-2
+    ]
+
+    tank["frame"] += 1
+
+
+# ---------------------------------------------------------
+# DRAW FRAME
+# ---------------------------------------------------------
+@profiled("fish.draw_frame")
+def draw_frame(tank, view=None):
+    """The tank as text; pass a ``TextGrid`` as ``view`` to reuse unchanged rows."""
+    grid = empty_grid()
+
+    # KELP
+    for kelp in tank["kelps"]:
+        bx = kelp["x"]
+        for idx, seg in enumerate(kelp["segments"]):
+            y = HEIGHT - 2 - idx
+            x = bx if seg == "(" else bx + 1
+            place_text(grid, x, y, seg)
+
+    # BUBBLES
+    for b in tank["bubbles"]:
+        place_text(grid, b["x"], b["y"], "o")
+
+    # FOOD
+    for food in tank["foods"]:
+        place_text(grid, food["x"], food["y"], ".")
+
+    # FISH
+    for f in tank["fishes"]:
+        frame = tank["frame"] % len(f["right"])
+        fish_str = f["right"][frame] if f["dir"] == 1 else f["left"][frame]
+        place_text(grid, f["x"], f["y"], fish_str)
+
+    # CRABS
+    for c in tank["crabs"]:
+        place_text(grid, c["x"], c["y"], CRAB_FRAMES[c["frame"]])
+
+    # SAND
+    place_text(grid, 0, HEIGHT - 1, SAND_CHAR * WIDTH)
+
+    if view is None:
+        return "\n".join("".join(row) for row in grid)
+    return view.render(grid)
+
+
+# ---------------------------------------------------------
+# HEADLESS RUN
+# ---------------------------------------------------------
+def run(steps, rng, fishes=10, crabs=3, kelps=6, render=True):
+    """Simulate (and by default draw) ``steps`` frames of a stocked tank."""
+    tank = new_tank()
+    tank["fishes"] = [generate_fish(rng) for _ in range(fishes)]
+    tank["crabs"] = [generate_crab(rng) for _ in range(crabs)]
+    tank["kelps"] = [generate_kelp(rng) for _ in range(kelps)]
+    for _ in range(steps):
+        simulate(tank, rng)
+        if render:
+            draw_frame(tank)
+    return {"frames": tank["frame"], "bubbles": len(tank["bubbles"])}
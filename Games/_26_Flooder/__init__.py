@@ -0,0 +1,6 @@
+GAME = {
+    "id": "flooder",
+    "emoji": "🎨",
+    "name": "Flooder",
+    "desc": "Color puzzle game",
+}
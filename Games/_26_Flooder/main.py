@@ -1,12 +1,14 @@
 # flooder_streamlit.py
 import streamlit as st
 import random
-import copy
+
+from Games.common.state import History, game_state, limit
 
 # ------------------ CONFIG ------------------
 BOARD_WIDTH = 12
 BOARD_HEIGHT = 10
 MOVES_PER_GAME = 20
+HISTORY_LIMIT = limit("flooder.history", MOVES_PER_GAME)
 
 TILE_TYPES = (0, 1, 2, 3, 4, 5)
 COLORS_MAP = {0: 'red', 1: 'green', 2: 'blue', 3: 'yellow', 4: 'cyan', 5: 'purple'}
@@ -73,88 +75,89 @@ def has_won(board):
 
 
 def simulate_gain(board, tile_choice):
-    copy_board = copy.deepcopy(board)
+    copy_board = dict(board)
     flood_fill(copy_board, 0, 0, tile_choice)
     t = copy_board[(0, 0)]
     return sum(1 for x in range(BOARD_WIDTH) for y in range(BOARD_HEIGHT) if copy_board[(x, y)] == t)
 
 # ------------------ SESSION STATE ------------------
 def init_state():
-    if "board" not in st.session_state:
-        st.session_state.board = get_new_board()
-        st.session_state.moves_left = MOVES_PER_GAME
-        st.session_state.history = []
-        st.session_state.message = ""
-        st.session_state.hint = None
+    return game_state(
+        "flooder",
+        board=get_new_board,
+        moves_left=MOVES_PER_GAME,
+        # Undo snapshots are whole boards: keep them compressed and bounded.
+        history=lambda: History(HISTORY_LIMIT, compress=True),
+        message="",
+        hint=None,
+    )
 
 
-def push_history():
-    st.session_state.history.append(
-        (copy.deepcopy(st.session_state.board), st.session_state.moves_left)
-    )
+def push_history(state):
+    state["history"].push((state["board"], state["moves_left"]))
 
 
-def undo():
-    if st.session_state.history:
-        board, moves = st.session_state.history.pop()
-        st.session_state.board = board
-        st.session_state.moves_left = moves
-        st.session_state.message = "Undid last move."
+def undo(state):
+    if state["history"]:
+        board, moves = state["history"].pop()
+        state["board"] = board
+        state["moves_left"] = moves
+        state["message"] = "Undid last move."
 
 
-def pick_color(tile_idx):
-    if st.session_state.moves_left <= 0:
+def pick_color(state, tile_idx):
+    if state["moves_left"] <= 0:
         return
 
-    current = st.session_state.board[(0, 0)]
+    current = state["board"][(0, 0)]
     if tile_idx == current:
-        st.session_state.message = "Already that color."
+        state["message"] = "Already that color."
         return
 
-    push_history()
+    push_history(state)
 
-    changed = flood_fill(st.session_state.board, 0, 0, tile_idx)
+    changed = flood_fill(state["board"], 0, 0, tile_idx)
     if not changed:
         return
 
-    st.session_state.moves_left -= 1
-    st.session_state.hint = None
+    state["moves_left"] -= 1
+    state["hint"] = None
 
-    if has_won(st.session_state.board):
-        st.session_state.message = "You won! 🎉"
-    elif st.session_state.moves_left == 0:
-        st.session_state.message = "Out of moves — game over."
+    if has_won(state["board"]):
+        state["message"] = "You won! 🎉"
+    elif state["moves_left"] == 0:
+        state["message"] = "Out of moves — game over."
     else:
-        st.session_state.message = f"Picked {COLOR_NAMES[tile_idx]}. Moves left: {st.session_state.moves_left}"
+        state["message"] = f"Picked {COLOR_NAMES[tile_idx]}. Moves left: {state['moves_left']}"
 
 
-def compute_hint():
-    current = st.session_state.board[(0, 0)]
+def compute_hint(state):
+    current = state["board"][(0, 0)]
     best, best_score = None, -1
     for t in TILE_TYPES:
         if t == current:
             continue
-        score = simulate_gain(st.session_state.board, t)
+        score = simulate_gain(state["board"], t)
         if score > best_score:
             best, best_score = t, score
-    st.session_state.hint = best
-    st.session_state.message = f"Suggested next: {COLOR_NAMES[best]}"
+    state["hint"] = best
+    state["message"] = f"Suggested next: {COLOR_NAMES[best]}"
 
 
-def reset_game():
-    st.session_state.board = get_new_board()
-    st.session_state.moves_left = MOVES_PER_GAME
-    st.session_state.history = []
-    st.session_state.message = "New game started!"
-    st.session_state.hint = None
+def reset_game(state):
+    state["board"] = get_new_board()
+    state["moves_left"] = MOVES_PER_GAME
+    state["history"].clear()
+    state["message"] = "New game started!"
+    state["hint"] = None
 
 # ------------------ RENDER ------------------
-def render_board():
+def render_board(state):
     html = [TILE_CSS, "<div>"]
     for y in range(BOARD_HEIGHT):
         html.append("<div class='row'>")
         for x in range(BOARD_WIDTH):
-            t = st.session_state.board[(x, y)]
+            t = state["board"][(x, y)]
             html.append(f"<div class='tile' style='background:{COLORS_MAP[t]}'></div>")
         html.append("</div>")
     html.append("</div>")
@@ -163,7 +166,7 @@ def render_board():
 # ------------------ UI ------------------
 def run():
     st.set_page_config(page_title="Flooder", layout="centered")
-    init_state()
+    state = init_state()
 
     st.markdown("### 🎮 Flooder — How to Play")
     st.markdown("""
@@ -175,26 +178,26 @@ def run():
     """)
 
     with st.sidebar:
-        st.write("Moves left:", st.session_state.moves_left)
+        st.write("Moves left:", state["moves_left"])
         if st.button("📌 New Game"):
-            reset_game()
+            reset_game(state)
             st.rerun()
         if st.button("↩ Undo"):
-            undo()
+            undo(state)
             st.rerun()
         if st.button("💡 Hint"):
-            compute_hint()
+            compute_hint(state)
 
     col1, col2 = st.columns([2, 1])
 
     with col1:
-        st.markdown(render_board(), unsafe_allow_html=True)
+        st.markdown(render_board(state), unsafe_allow_html=True)
 
     with col2:
         st.subheader("Pick a Color")
         for t in TILE_TYPES:
             if st.button(COLOR_NAMES[t], key=f"color_{t}"):
-                pick_color(t)
+                pick_color(state, t)
                 st.rerun()
 
             st.markdown(
@@ -202,11 +205,11 @@ def run():
                 unsafe_allow_html=True
             )
 
-        st.write(f"**Message:** {st.session_state.message}")
+        st.write(f"**Message:** {state['message']}")
 
-    if has_won(st.session_state.board):
+    if has_won(state["board"]):
         st.success("🎉 You won!")
-    elif st.session_state.moves_left <= 0:
+    elif state["moves_left"] <= 0:
         st.error("No moves left. Try again!")
 
 if __name__ == "__main__":
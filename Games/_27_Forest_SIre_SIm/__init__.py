@@ -0,0 +1,6 @@
+GAME = {
+    "id": "forest",
+    "emoji": "🌲🔥",
+    "name": "Forest Fire",
+    "desc": "Fire spread simulation",
+}
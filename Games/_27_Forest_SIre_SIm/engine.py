@@ -0,0 +1,116 @@
+"""Forest Fire simulation logic, free of Streamlit.
+
+State is a plain dict (``{"forest": grid, "moves": n}``) and every random
+draw goes through the ``rng`` argument (a ``Games.common.rng.Rng``), so the
+model can be run, benchmarked and replayed from a seed headless via
+``python -m Games run forest``. Each step draws the per-cell rolls in bulk.
+"""
+
+# ------------------ Constants & Defaults ------------------
+TREE = "🌲"
+FIRE = "🔥"
+EMPTY = "⬜"
+ASH = "⬛"   # burned / ash
+
+WIDTH = 20   # Reduced grid width
+HEIGHT = 15  # Reduced grid height
+
+NEIGHBOURS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+# ------------------ Forest Creation ------------------
+def create_forest(initial_density, rng, width=WIDTH, height=HEIGHT):
+    """Return a ``height x width`` grid with trees placed at ``initial_density``."""
+    rolls = rng.floats((height, width)).tolist()
+    return [[TREE if roll < initial_density else EMPTY for roll in row] for row in rolls]
+
+
+def new_state(rng, initial_density=0.25, width=WIDTH, height=HEIGHT):
+    return {"forest": create_forest(initial_density, rng, width, height), "moves": 0}
+
+
+# ------------------ Simulation Step ------------------
+def step_forest(old, rng, grow_chance, lightning_chance, spread_chance, rain_factor):
+    """
+    One simulation timestep; returns the new grid (``old`` is not modified):
+    - EMPTY -> TREE with probability grow_chance
+    - TREE -> FIRE by lightning (lightning_chance * (1 - rain_factor))
+    - FIRE spreads to neighbor TREES with probability spread_chance * (1 - rain_factor)
+    - FIRE -> ASH (burned) after spreading
+    """
+    height, width = len(old), len(old[0])
+    new = [row[:] for row in old]
+    lightning = lightning_chance * (1 - rain_factor)
+    spread = spread_chance * (1 - rain_factor)
+    # One roll per cell for grow/lightning/ash, drawn in a single call.
+    rolls = rng.floats((height, width)).tolist()
+
+    for i in range(height):
+        row_rolls = rolls[i]
+        for j in range(width):
+            cell = old[i][j]
+
+            if cell == EMPTY:
+                if row_rolls[j] < grow_chance:
+                    new[i][j] = TREE
+
+            elif cell == TREE:
+                # lightning (reduced by rain)
+                if row_rolls[j] < lightning:
+                    new[i][j] = FIRE
+
+            elif cell == FIRE:
+                # spread to neighbors (4-directional)
+                for di, dj in NEIGHBOURS:
+                    ni, nj = i + di, j + dj
+                    if 0 <= ni < height and 0 <= nj < width:
+                        if old[ni][nj] == TREE:
+                            if rng.random() < spread:
+                                new[ni][nj] = FIRE
+                # burned becomes ash next step
+                new[i][j] = ASH
+
+            elif cell == ASH:
+                # Ash -> EMPTY gradually (50% chance per step)
+                if row_rolls[j] < 0.5:
+                    new[i][j] = EMPTY
+
+    return new
+
+
+def step(state, rng, grow_chance=0.01, lightning_chance=0.01, spread_chance=0.6, rain_factor=0.0):
+    """Advance ``state`` by one timestep in place."""
+    state["forest"] = step_forest(
+        state["forest"], rng, grow_chance, lightning_chance, spread_chance, rain_factor
+    )
+    state["moves"] += 1
+
+
+def ignite(forest, i, j):
+    forest[i][j] = FIRE
+
+
+def population(forest):
+    """Count cells of each kind: ``{"tree": n, "fire": n, "ash": n, "empty": n}``."""
+    flat = [cell for row in forest for cell in row]
+    return {
+        "tree": flat.count(TREE),
+        "fire": flat.count(FIRE),
+        "ash": flat.count(ASH),
+        "empty": flat.count(EMPTY),
+    }
+
+
+# ------------------ Headless run ------------------
+def run(steps, rng, width=WIDTH, height=HEIGHT, sink=None, **options):
+    """Run ``steps`` timesteps on a fresh forest and return its final population.
+
+    With a ``ResultSink("forest.steps")`` the population after every step
+    is recorded as well.
+    """
+    state = new_state(rng, width=width, height=height)
+    for _ in range(steps):
+        step(state, rng, **options)
+        if sink is not None:
+            sink.write(step=state["moves"], **population(state["forest"]))
+    return population(state["forest"])
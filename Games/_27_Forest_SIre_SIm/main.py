@@ -14,19 +14,12 @@ Includes main() and run() entrypoint
 """
 
 import streamlit as st
-import random
-import time
-import numpy as np
-import copy
-
-# ------------------ Constants & Defaults ------------------
-TREE = "🌲"
-FIRE = "🔥"
-EMPTY = "⬜"
-ASH = "⬛"   # burned / ash
-
-WIDTH = 20   # Reduced grid width
-HEIGHT = 15  # Reduced grid height
+from Games.common.animation import animate
+from Games.common.profiling import profiled
+from Games.common.rng import session_rng
+from Games.common.state import game_state
+from . import engine
+from .engine import TREE, FIRE, EMPTY, ASH, WIDTH, HEIGHT
 
 # Default numeric mappings for dropdown choices
 INITIAL_DENSITY_MAP = {"Sparse": 0.15, "Normal": 0.25, "Dense": 0.40}
@@ -38,90 +31,48 @@ SPEED_MAP = {"Fast": 0.03, "Normal": 0.12, "Slow": 0.4}
 
 # ------------------ Session Initialization ------------------
 def init_session_state():
-    if "forest" not in st.session_state:
-        st.session_state.forest = create_forest(INITIAL_DENSITY_MAP["Normal"])
-    if "running" not in st.session_state:
-        st.session_state.running = False
-    if "moves" not in st.session_state:
-        st.session_state.moves = 0
-    if "last_action" not in st.session_state:
-        st.session_state.last_action = None
-
-# ------------------ Forest Creation ------------------
+    return game_state(
+        "forest",
+        forest=lambda: create_forest(INITIAL_DENSITY_MAP["Normal"]),
+        running=False,
+        moves=0,
+        last_action=None,
+    )
+
+# ------------------ Streamlit adapters over the engine ------------------
 def create_forest(initial_density):
-    # 2D list of strings
-    board = [[EMPTY for _ in range(WIDTH)] for _ in range(HEIGHT)]
-    for i in range(HEIGHT):
-        for j in range(WIDTH):
-            if random.random() < initial_density:
-                board[i][j] = TREE
-    return board
+    return engine.create_forest(initial_density, session_rng("forest"))
 
-# ------------------ Simulation Step ------------------
+@profiled("forest.step_simulation")
 def step_simulation(grow_chance, lightning_chance, spread_chance, rain_factor):
-    """
-    One simulation timestep:
-    - EMPTY -> TREE with probability grow_chance
-    - TREE -> FIRE by lightning (lightning_chance * (1 - rain_factor))
-    - FIRE spreads to neighbor TREES with probability spread_chance * (1 - rain_factor)
-    - FIRE -> ASH (burned) after spreading
-    """
-    old = st.session_state.forest
-    new = copy.deepcopy(old)
-
-    for i in range(HEIGHT):
-        for j in range(WIDTH):
-            cell = old[i][j]
-
-            if cell == EMPTY:
-                if random.random() < grow_chance:
-                    new[i][j] = TREE
-
-            elif cell == TREE:
-                # lightning (reduced by rain)
-                if random.random() < (lightning_chance * (1 - rain_factor)):
-                    new[i][j] = FIRE
-
-            elif cell == FIRE:
-                # spread to neighbors (4-directional)
-                for di, dj in [(-1,0),(1,0),(0,-1),(0,1)]:
-                    ni, nj = i + di, j + dj
-                    if 0 <= ni < HEIGHT and 0 <= nj < WIDTH:
-                        if old[ni][nj] == TREE:
-                            if random.random() < (spread_chance * (1 - rain_factor)):
-                                new[ni][nj] = FIRE
-                # burned becomes ash next step
-                new[i][j] = ASH
-
-            elif cell == ASH:
-                # Ash -> EMPTY gradually (50% chance per step)
-                if random.random() < 0.5:
-                    new[i][j] = EMPTY
-                else:
-                    new[i][j] = ASH
-
-    st.session_state.forest = new
-    st.session_state.moves += 1
+    """One simulation timestep on the session's forest (see engine.step_forest)."""
+    state = game_state("forest")
+    state["forest"] = engine.step_forest(
+        state["forest"], session_rng("forest"), grow_chance, lightning_chance, spread_chance, rain_factor
+    )
+    state["moves"] += 1
 
 # ------------------ Utility: draw grid as buttons ------------------
+@profiled("forest.render_grid")
 def render_grid(interaction_mode="ignite"):
     """Render grid using st.columns rows. Clicking a button ignites that cell."""
+    forest = game_state("forest")["forest"]
     for i in range(HEIGHT):
         cols = st.columns(WIDTH)
         for j in range(WIDTH):
-            label = st.session_state.forest[i][j]
+            label = forest[i][j]
             # button shows emoji representing the cell
             clicked = cols[j].button(label, key=f"cell_{i}_{j}")
             if clicked:
                 # Click = ignite immediately (set to FIRE)
-                st.session_state.forest[i][j] = FIRE
+                engine.ignite(forest, i, j)
                 # Immediately update the UI to reflect the ignition
                 st.rerun()
 
 # ------------------ MAIN UI ------------------
 def main():
     st.set_page_config(page_title="Forest Fire Simulator", layout="centered")
-    init_session_state()
+    state = init_session_state()
 
     st.title("🌲🔥 Forest Fire Simulator (interactive)")
 
@@ -189,16 +140,16 @@ def main():
     st.sidebar.markdown("---")
     st.sidebar.markdown("**Actions**")
     if st.sidebar.button("Reset forest"):
-        st.session_state.forest = create_forest(initial_density)
-        st.session_state.moves = 0
-        st.session_state.running = False
+        state["forest"] = create_forest(initial_density)
+        state["moves"] = 0
+        state["running"] = False
         st.rerun()
 
     if st.sidebar.button("Ignite random tree"):
-        trees = [(i, j) for i in range(HEIGHT) for j in range(WIDTH) if st.session_state.forest[i][j] == TREE]
+        trees = [(i, j) for i in range(HEIGHT) for j in range(WIDTH) if state["forest"][i][j] == TREE]
         if trees:
-            i, j = random.choice(trees)
-            st.session_state.forest[i][j] = FIRE
+            i, j = session_rng("forest").choice(trees)
+            engine.ignite(state["forest"], i, j)
             st.rerun()
 
     st.sidebar.markdown("---")
@@ -210,12 +161,12 @@ def main():
 
     # Handle Start / Stop / Step
     if start:
-        st.session_state.running = True
-        st.session_state.last_action = "start"
+        state["running"] = True
+        state["last_action"] = "start"
         st.rerun()
     if stop:
-        st.session_state.running = False
-        st.session_state.last_action = "stop"
+        state["running"] = False
+        state["last_action"] = "stop"
         st.rerun()
     if step:
         step_simulation(grow_chance, lightning_chance, spread_chance, rain_factor)
@@ -223,7 +174,6 @@ def main():
 
     # Info & legend
     st.markdown("### Controls & Legend")
-    st.write(f"Steps run: **{st.session_state.moves}**")
     st.markdown(f"- {TREE} = Tree")
     st.markdown(f"- {FIRE} = Fire")
     st.markdown(f"- {ASH} = Ash (recently burned)")
@@ -232,16 +182,19 @@ def main():
     st.markdown("---")
     st.markdown("### Click grid to ignite a cell (clicking sets it to FIRE)")
 
-    # Grid rendering (clickable)
-    render_grid(interaction_mode="ignite")
-
-    # Auto-run: when running is True, do a single step, wait, rerun (loop behavior)
-    if st.session_state.running:
-        step_simulation(grow_chance, lightning_chance, spread_chance, rain_factor)
-        # small delay to control speed
-        time.sleep(speed)
-        # rerun to update UI and continue loop
-        st.rerun()
+    # Grid rendering (clickable). While auto-running, only this region
+    # refreshes: one simulation step per `speed` seconds.
+    def render():
+        st.write(f"Steps run: **{state['moves']}**")
+        render_grid(interaction_mode="ignite")
+
+    animate(
+        "forest",
+        render,
+        step=lambda: step_simulation(grow_chance, lightning_chance, spread_chance, rain_factor),
+        interval=speed,
+        running=state["running"],
+    )
 
     # Footer: small notes
     st.markdown("---")
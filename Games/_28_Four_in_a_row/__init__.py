@@ -0,0 +1,6 @@
+GAME = {
+    "id": "fourinarow",
+    "emoji": "🎮",
+    "name": "Four in a Row",
+    "desc": "Connect four game",
+}
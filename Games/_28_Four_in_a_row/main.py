@@ -1,5 +1,7 @@
 import streamlit as st
 
+from Games.common.state import game_state
+
 EMPTY_SPACE = '.'
 PLAYER_X = 'X'
 PLAYER_O = 'O'
@@ -55,9 +57,10 @@ def render_board(board):
 
 
 def reset_game():
-    st.session_state.board = getNewBoard()
-    st.session_state.player = PLAYER_X
-    st.session_state.winner = None
+    state = game_state("four")
+    state["board"] = getNewBoard()
+    state["player"] = PLAYER_X
+    state["winner"] = None
 
 
 def run():
@@ -87,12 +90,10 @@ def run():
     """
     )
 
-    if "board" not in st.session_state:
-        reset_game()
-
-    board = st.session_state.board
-    player = st.session_state.player
-    winner = st.session_state.winner
+    state = game_state("four", board=getNewBoard, player=PLAYER_X, winner=None)
+    board = state["board"]
+    player = state["player"]
+    winner = state["winner"]
 
     render_board(board)
 
@@ -109,9 +110,9 @@ def run():
         if pos:
             board[pos] = player
             if isWinner(player, board):
-                st.session_state.winner = player
+                state["winner"] = player
             else:
-                st.session_state.player = PLAYER_O if player == PLAYER_X else PLAYER_X
+                state["player"] = PLAYER_O if player == PLAYER_X else PLAYER_X
 
     st.button("Drop", on_click=on_drop)
 
@@ -0,0 +1,6 @@
+GAME = {
+    "id": "guess",
+    "emoji": "📱",
+    "name": "Guess Number",
+    "desc": "Find the secret number",
+}
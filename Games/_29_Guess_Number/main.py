@@ -1,5 +1,6 @@
 import random
 import streamlit as st
+from Games.common.state import game_state
 
 # ------------------ PAGE CONFIG ------------------
 st.set_page_config(
@@ -24,11 +25,12 @@ div.stButton > button {
 
 # ------------------ RESET GAME ------------------
 def reset_game(max_num, max_attempts):
-    st.session_state.secret = random.randint(1, max_num)
-    st.session_state.history = []
-    st.session_state.attempt_count = 0
-    st.session_state.over = False
-    st.session_state.max_attempts = max_attempts
+    state = game_state("guess")
+    state["secret"] = random.randint(1, max_num)
+    state["history"] = []
+    state["attempt_count"] = 0
+    state["over"] = False
+    state["max_attempts"] = max_attempts
 
 
 # ------------------ APP ------------------
@@ -63,12 +65,13 @@ def run():
         max_num, max_attempts = 500, 12
 
     # -------- Track difficulty change --------
-    if "current_level" not in st.session_state:
-        st.session_state.current_level = level
+    state = game_state("guess")
+    if "current_level" not in state:
+        state["current_level"] = level
         reset_game(max_num, max_attempts)
 
-    if st.session_state.current_level != level:
-        st.session_state.current_level = level
+    if state["current_level"] != level:
+        state["current_level"] = level
         reset_game(max_num, max_attempts)
         st.rerun()
 
@@ -81,27 +84,27 @@ def run():
     )
 
     # -------- Submit --------
-    if st.button("Submit Guess", disabled=st.session_state.over):
-        if st.session_state.attempt_count < max_attempts:
-            st.session_state.attempt_count += 1  # ✅ FIRST MOVE COUNTS
+    if st.button("Submit Guess", disabled=state["over"]):
+        if state["attempt_count"] < max_attempts:
+            state["attempt_count"] += 1  # ✅ FIRST MOVE COUNTS
 
-            if guess == st.session_state.secret:
-                st.session_state.history.append((guess, "🎉 Correct"))
+            if guess == state["secret"]:
+                state["history"].append((guess, "🎉 Correct"))
                 st.success("🎉 Correct! You guessed the number!")
-                st.session_state.over = True
-            elif guess < st.session_state.secret:
-                st.session_state.history.append((guess, "🔽 Too Low"))
+                state["over"] = True
+            elif guess < state["secret"]:
+                state["history"].append((guess, "🔽 Too Low"))
             else:
-                st.session_state.history.append((guess, "🔼 Too High"))
+                state["history"].append((guess, "🔼 Too High"))
 
-            if st.session_state.attempt_count >= max_attempts and not st.session_state.over:
-                st.error(f"❌ Game Over! Number was **{st.session_state.secret}**")
-                st.session_state.over = True
+            if state["attempt_count"] >= max_attempts and not state["over"]:
+                st.error(f"❌ Game Over! Number was **{state['secret']}**")
+                state["over"] = True
 
         st.rerun()  # 🔑 FORCE UI TO UPDATE IMMEDIATELY
 
     # -------- Remaining (CALCULATED AFTER SUBMIT) --------
-    remaining = max_attempts - st.session_state.attempt_count
+    remaining = max_attempts - state["attempt_count"]
 
     st.markdown(f"""
     <div style="
@@ -119,21 +122,21 @@ def run():
     """, unsafe_allow_html=True)
 
     # -------- Guess History --------
-    if st.session_state.history:
+    if state["history"]:
         st.markdown("### 🧾 Guess History")
-        for g, hint in st.session_state.history:
+        for g, hint in state["history"]:
             st.write(f"**{g}** → {hint}")
 
     # -------- Smart Hint --------
-    if remaining <= 3 and not st.session_state.over:
-        lows = [g for g, h in st.session_state.history if "Low" in h]
-        highs = [g for g, h in st.session_state.history if "High" in h]
+    if remaining <= 3 and not state["over"]:
+        lows = [g for g, h in state["history"] if "Low" in h]
+        highs = [g for g, h in state["history"] if "High" in h]
         low = max(lows) if lows else 1
         high = min(highs) if highs else max_num
         st.info(f"💡 Hint: Number is between **{low} and {high}**")
 
     # -------- Restart --------
-    if st.session_state.over:
+    if state["over"]:
         if st.button("🔁 Play Again"):
             reset_game(max_num, max_attempts)
             st.rerun()
@@ -0,0 +1,6 @@
+GAME = {
+    "id": "gullible",
+    "emoji": "😄",
+    "name": "Gullible",
+    "desc": "Prank game",
+}
@@ -1,4 +1,5 @@
 import streamlit as st
+from Games.common.state import game_state
 
 # ------------------ PAGE CONFIG ------------------
 st.set_page_config(
@@ -16,40 +17,41 @@ def run():
     """)
 
     # ------------------ SESSION STATE ------------------
-    if "yes_count" not in st.session_state:
-        st.session_state.yes_count = 0
-        st.session_state.finished = False
-        st.session_state.message = ""
+    state = game_state("gullible")
+    if "yes_count" not in state:
+        state["yes_count"] = 0
+        state["finished"] = False
+        state["message"] = ""
 
     # ------------------ INPUT ------------------
     response = st.text_input("Your response:", placeholder="y / n / yes / no")
 
-    if st.button("Submit") and not st.session_state.finished:
+    if st.button("Submit") and not state["finished"]:
         cleaned = response.strip().lower()
 
         if cleaned in ("n", "no"):
-            st.session_state.finished = True
+            state["finished"] = True
 
         elif cleaned in ("y", "yes"):
-            st.session_state.yes_count += 1
+            state["yes_count"] += 1
 
             # Smart message every 5 yeses
-            if st.session_state.yes_count % 5 == 0:
-                st.session_state.message = "😄 Still waiting... aren’t you curious?"
+            if state["yes_count"] % 5 == 0:
+                state["message"] = "😄 Still waiting... aren’t you curious?"
             else:
-                st.session_state.message = ""
+                state["message"] = ""
 
         else:
-            st.session_state.message = f'"{response}" is not a valid yes/no response.'
+            state["message"] = f'"{response}" is not a valid yes/no response.'
 
     # ------------------ OUTPUT ------------------
-    if st.session_state.finished:
+    if state["finished"]:
         st.success("Thank you. Have a nice day! 😊")
-        st.info(f"🧮 You said **YES** {st.session_state.yes_count} times.")
+        st.info(f"🧮 You said **YES** {state['yes_count']} times.")
     else:
         st.write("Do you want to know how to keep a gullible person busy for hours? Y/N")
-        if st.session_state.message:
-            st.warning(st.session_state.message)
+        if state["message"]:
+            st.warning(state["message"])
 
 
 # ------------------ RUN ------------------
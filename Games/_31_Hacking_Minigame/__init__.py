@@ -0,0 +1,6 @@
+GAME = {
+    "id": "hacking",
+    "emoji": "🖥️",
+    "name": "Hacking Minigame",
+    "desc": "Crack the code",
+}
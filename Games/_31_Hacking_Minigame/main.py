@@ -1,5 +1,6 @@
 import random
 import streamlit as st
+from Games.common.state import game_state
 
 def run():
 
@@ -52,17 +53,19 @@ def run():
         else:
             return "🔥 Hot"
 
+    # ------------------ STATE ------------------
+    state = game_state("hacking")
 
     def reset_game():
-        st.session_state.words = random.sample(WORDS, 12)
-        st.session_state.secret = random.choice(st.session_state.words)
-        st.session_state.tries = 0
-        st.session_state.logs = []
-        st.session_state.locked = False
+        state["words"] = random.sample(WORDS, 12)
+        state["secret"] = random.choice(state["words"])
+        state["tries"] = 0
+        state["logs"] = []
+        state["locked"] = False
 
 
     # ------------------ INIT STATE ------------------
-    if "secret" not in st.session_state:
+    if "secret" not in state:
         reset_game()
 
     # ------------------ UI ------------------
@@ -84,7 +87,7 @@ def run():
     st.markdown("#### Find the password in the computer memory")
 
     # ------------------ MEMORY DISPLAY ------------------
-    memory_display = "\n".join(st.session_state.words)
+    memory_display = "\n".join(state["words"])
 
     st.markdown(
         f"<div class='terminal'>{memory_display}</div>",
@@ -94,42 +97,42 @@ def run():
     # ------------------ INPUT ------------------
     guess = st.text_input(
         "Enter password",
-        disabled=st.session_state.locked
+        disabled=state["locked"]
     ).upper()
 
-    if st.button("EXECUTE", disabled=st.session_state.locked):
-        if guess not in st.session_state.words:
+    if st.button("EXECUTE", disabled=state["locked"]):
+        if guess not in state["words"]:
             st.warning("That is not one of the possible passwords.")
         else:
-            st.session_state.tries += 1
-            matches = matching_letters(st.session_state.secret, guess)
+            state["tries"] += 1
+            matches = matching_letters(state["secret"], guess)
             heat = heat_label(matches)
 
-            if guess == st.session_state.secret:
-                st.session_state.logs.append("A C C E S S   G R A N T E D")
+            if guess == state["secret"]:
+                state["logs"].append("A C C E S S   G R A N T E D")
                 st.success("ACCESS GRANTED")
-                st.session_state.locked = True
+                state["locked"] = True
             else:
-                st.session_state.logs.append(
+                state["logs"].append(
                     f"ACCESS DENIED ({matches}/7 correct) — {heat}"
                 )
 
-            if st.session_state.tries >= MAX_TRIES and not st.session_state.locked:
-                st.session_state.logs.append(
-                    f"SYSTEM LOCKED — PASSWORD WAS {st.session_state.secret}"
+            if state["tries"] >= MAX_TRIES and not state["locked"]:
+                state["logs"].append(
+                    f"SYSTEM LOCKED — PASSWORD WAS {state['secret']}"
                 )
-                st.session_state.locked = True
+                state["locked"] = True
 
     # ------------------ OUTPUT LOG ------------------
-    if st.session_state.logs:
+    if state["logs"]:
         st.markdown("#### Terminal Output")
         st.markdown(
-            "<div class='terminal'>" + "\n".join(st.session_state.logs) + "</div>",
+            "<div class='terminal'>" + "\n".join(state["logs"]) + "</div>",
             unsafe_allow_html=True
         )
 
     # ------------------ RESTART ------------------
-    if st.session_state.locked:
+    if state["locked"]:
         if st.button("🔁 Restart Hack"):
             reset_game()
             st.rerun()
@@ -0,0 +1,6 @@
+GAME = {
+    "id": "hangman",
+    "emoji": "🪓",
+    "name": "Hangman Guillotine",
+    "desc": "Guess before doom",
+}
@@ -1,5 +1,6 @@
 import random
 import streamlit as st
+from Games.common.state import game_state
 
 def run():
 
@@ -151,19 +152,21 @@ r"""
     }
 
     # ------------------ STATE HELPERS ------------------
+    state = game_state("hangman")
+
     def reset_game(category):
-        st.session_state.category = category
-        st.session_state.secret = random.choice(CATEGORIES[category])
-        st.session_state.missed = []
-        st.session_state.correct = []
-        st.session_state.game_over = False
-        st.session_state.logs = []
+        state["category"] = category
+        state["secret"] = random.choice(CATEGORIES[category])
+        state["missed"] = []
+        state["correct"] = []
+        state["game_over"] = False
+        state["logs"] = []
 
     # ------------------ INIT STATE ------------------
-    if "category" not in st.session_state:
+    if "category" not in state:
         reset_game(random.choice(list(CATEGORIES.keys())))
-        st.session_state.style = "Hangman"
-        st.session_state.prev_category = st.session_state.category
+        state["style"] = "Hangman"
+        state["prev_category"] = state["category"]
 
     # ------------------ TITLE & RULES ------------------
     st.title("🪢 Hangman & Guillotine")
@@ -187,13 +190,13 @@ r"""
         category = st.selectbox(
             "Choose Category",
             list(CATEGORIES.keys()),
-            index=list(CATEGORIES.keys()).index(st.session_state.category)
+            index=list(CATEGORIES.keys()).index(state["category"])
         )
 
     # 🔁 Restart game ONLY if category changes
-    if category != st.session_state.prev_category:
+    if category != state["prev_category"]:
         reset_game(category)
-        st.session_state.prev_category = category
+        state["prev_category"] = category
         st.rerun()
 
     with col2:
@@ -202,18 +205,18 @@ r"""
     pics = HANGMAN_PICS if style == "Hangman" else GUILLOTINE_PICS
 
     # ------------------ DRAW GAME ------------------
-    art = pics[len(st.session_state.missed)]
+    art = pics[len(state["missed"])]
     blanks = [
-        letter if letter in st.session_state.correct else "_"
-        for letter in st.session_state.secret
+        letter if letter in state["correct"] else "_"
+        for letter in state["secret"]
     ]
 
     game_screen = f"""
 {art}
 
-Category: {st.session_state.category}
+Category: {state["category"]}
 
-Missed letters: {" ".join(st.session_state.missed) if st.session_state.missed else "None"}
+Missed letters: {" ".join(state["missed"]) if state["missed"] else "None"}
 
 {" ".join(blanks)}
 """
@@ -224,42 +227,42 @@ Missed letters: {" ".join(st.session_state.missed) if st.session_state.missed el
     guess = st.text_input(
         "Guess a letter",
         max_chars=1,
-        disabled=st.session_state.game_over
+        disabled=state["game_over"]
     ).upper()
 
-    if st.button("GUESS", disabled=st.session_state.game_over):
+    if st.button("GUESS", disabled=state["game_over"]):
         if not guess.isalpha():
             st.warning("Please enter a letter.")
-        elif guess in st.session_state.missed + st.session_state.correct:
+        elif guess in state["missed"] + state["correct"]:
             st.warning("You already guessed that letter.")
-        elif guess in st.session_state.secret:
-            st.session_state.correct.append(guess)
-            if all(l in st.session_state.correct for l in st.session_state.secret):
-                st.session_state.logs.append(
-                    f"🎉 YOU WON! Word was {st.session_state.secret}"
+        elif guess in state["secret"]:
+            state["correct"].append(guess)
+            if all(l in state["correct"] for l in state["secret"]):
+                state["logs"].append(
+                    f"🎉 YOU WON! Word was {state['secret']}"
                 )
-                st.session_state.game_over = True
+                state["game_over"] = True
         else:
-            st.session_state.missed.append(guess)
-            if len(st.session_state.missed) == len(pics) - 1:
-                st.session_state.logs.append(
-                    f"💀 GAME OVER — Word was {st.session_state.secret}"
+            state["missed"].append(guess)
+            if len(state["missed"]) == len(pics) - 1:
+                state["logs"].append(
+                    f"💀 GAME OVER — Word was {state['secret']}"
                 )
-                st.session_state.game_over = True
+                state["game_over"] = True
         st.rerun()
 
     # ------------------ OUTPUT LOG ------------------
-    if st.session_state.logs:
+    if state["logs"]:
         st.markdown("#### Terminal Output")
         st.markdown(
-            "<div class='terminal'>" + "\n".join(st.session_state.logs) + "</div>",
+            "<div class='terminal'>" + "\n".join(state["logs"]) + "</div>",
             unsafe_allow_html=True
         )
 
     # ------------------ RESTART ------------------
-    if st.session_state.game_over:
+    if state["game_over"]:
         if st.button("🔁 Restart Game"):
-            reset_game(st.session_state.category)
+            reset_game(state["category"])
             st.rerun()
 
 
@@ -0,0 +1,6 @@
+GAME = {
+    "id": "hexgrid",
+    "emoji": "✏️",
+    "name": "HexGrid",
+    "desc": "Carpet design",
+}
@@ -1,6 +1,8 @@
 import streamlit as st
-from PIL import Image, ImageDraw, ImageFont
-import io
+from PIL import Image, ImageDraw
+
+from Games.common.images import cached_png, load_font
+from Games.common.profiling import profiled
 
 # ------------------ PAGE CONFIG ------------------
 st.set_page_config(
@@ -105,15 +107,18 @@ def run():
 
 
 # ------------------ IMAGE GENERATION ------------------
+@profiled("hexgrid.generate_image")
 def generate_image(text, bg_color):
+    """PNG bytes of the carpet; unchanged inputs are served from the PNG cache."""
+    return cached_png(("hexgrid", text, bg_color), lambda: render_carpet(text, bg_color))
+
+
+def render_carpet(text, bg_color):
     lines = text.splitlines()
     font_size = 16
     padding = 20
 
-    try:
-        font = ImageFont.truetype("DejaVuSansMono.ttf", font_size)
-    except:
-        font = ImageFont.load_default()
+    font = load_font("DejaVuSansMono.ttf", font_size)
 
     # Measure text
     dummy_img = Image.new("RGB", (1, 1))
@@ -132,10 +137,7 @@ def generate_image(text, bg_color):
         draw.text((padding, y), line, fill="white", font=font)
         y += line_height
 
-    buffer = io.BytesIO()
-    img.save(buffer, format="PNG")
-    buffer.seek(0)
-    return buffer.getvalue()
+    return img
 
 
 # ------------------ RUN ------------------
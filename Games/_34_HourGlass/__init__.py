@@ -0,0 +1,6 @@
+GAME = {
+    "id": "hourglass",
+    "emoji": "⏳",
+    "name": "Hourglass",
+    "desc": "Time visualization",
+}
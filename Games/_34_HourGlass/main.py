@@ -1,6 +1,10 @@
 import streamlit as st
-import random
-import time
+
+from Games.common.animation import animate
+from Games.common.profiling import profiled
+from Games.common.rng import session_rng
+from Games.common.state import game_state
+from Games.common.textgrid import TextGrid
 
 # ------------------ PAGE CONFIG ------------------
 st.set_page_config(
@@ -55,14 +59,16 @@ def create_hourglass():
 
 
 # ------------------ PHYSICS STEP ------------------
-def step(grid):
+@profiled("hourglass.step")
+def step(grid, rng):
     moved = False
+    # All random draws for the step at once: a column order per row
+    # (⭐ removes left/right bias) and a diagonal preference per cell.
+    orders = (rng.permutations(WIDTH - 2, HEIGHT - 1) + 1).tolist()
+    flips = rng.integers(0, 2, (HEIGHT - 1, WIDTH)).tolist()
 
     for y in range(HEIGHT - 2, -1, -1):
-        xs = list(range(1, WIDTH - 1))
-        random.shuffle(xs)  # ⭐ removes left/right bias
-
-        for x in xs:
+        for x in orders[y]:
             if grid[y][x] != SAND:
                 continue
 
@@ -73,8 +79,7 @@ def step(grid):
                 continue
 
             # Try diagonals (random order per grain)
-            directions = [(-1, 1), (1, 1)]
-            random.shuffle(directions)
+            directions = ((-1, 1), (1, 1)) if flips[y][x] else ((1, 1), (-1, 1))
 
             for dx, dy in directions:
                 nx, ny = x + dx, y + dy
@@ -92,8 +97,9 @@ def step(grid):
 
 
 # ------------------ RENDER ------------------
-def render(grid):
-    return "\n".join("".join(row) for row in grid)
+@profiled("hourglass.render")
+def render(grid, view):
+    return view.render(grid)
 
 
 # ------------------ APP ------------------
@@ -109,8 +115,7 @@ def run():
 - Click **Flip Hourglass** to restart
     """)
 
-    if "grid" not in st.session_state:
-        st.session_state.grid = create_hourglass()
+    state = game_state("hourglass", grid=create_hourglass, settled=False, view=TextGrid)
 
     col1, col2 = st.columns(2)
 
@@ -119,16 +124,23 @@ def run():
 
     with col2:
         if st.button("🔄 Flip Hourglass"):
-            st.session_state.grid = create_hourglass()
-
-    moved = step(st.session_state.grid)
-
-    st.code(render(st.session_state.grid))
-
-    if moved:
-        time.sleep(speed)
-        st.rerun()
-    else:
+            state["grid"] = create_hourglass()
+            state["settled"] = False
+
+    def advance():
+        if not step(state["grid"], session_rng("hourglass")):
+            state["settled"] = True
+            return False
+
+    animate(
+        "hourglass",
+        lambda: st.code(render(state["grid"], state["view"])),
+        step=advance,
+        interval=speed,
+        running=not state["settled"],
+    )
+
+    if state["settled"]:
         st.info("Sand has settled. Flip the hourglass to continue.")
 
 
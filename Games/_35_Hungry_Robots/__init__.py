@@ -0,0 +1,6 @@
+GAME = {
+    "id": "robots",
+    "emoji": "🤖",
+    "name": "Hungry Robots",
+    "desc": "Robot eats robot",
+}
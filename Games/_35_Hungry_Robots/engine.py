@@ -0,0 +1,118 @@
+"""Hungry Robots rules, free of Streamlit.
+
+A game is a plain dict (see ``new_game``). ``step`` applies one player turn
+and then moves every robot; random draws go through the ``rng`` argument.
+"""
+
+# ------------------ CONFIG ------------------
+WIDTH = 15
+HEIGHT = 12
+NUM_ROBOTS = 8
+NUM_TELEPORTS = 2
+
+EMPTY = " "
+WALL = "⬛"
+
+# The eight directions the player can move in.
+MOVES = [(-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
+
+
+# ------------------ HELPERS ------------------
+def empty_board():
+    board = {}
+    for x in range(WIDTH):
+        for y in range(HEIGHT):
+            board[(x, y)] = EMPTY
+
+    for x in range(WIDTH):
+        board[(x, 0)] = WALL
+        board[(x, HEIGHT - 1)] = WALL
+    for y in range(HEIGHT):
+        board[(0, y)] = WALL
+        board[(WIDTH - 1, y)] = WALL
+
+    return board
+
+
+def random_empty(board, occupied, rng):
+    while True:
+        x = rng.randint(1, WIDTH - 2)
+        y = rng.randint(1, HEIGHT - 2)
+        if board[(x, y)] == EMPTY and (x, y) not in occupied:
+            return (x, y)
+
+
+def move_robot(rx, ry, px, py):
+    dx = 1 if px > rx else -1 if px < rx else 0
+    dy = 1 if py > ry else -1 if py < ry else 0
+    return rx + dx, ry + dy
+
+
+# ------------------ GAME INIT ------------------
+def new_game(rng):
+    board = empty_board()
+    return {
+        "board": board,
+        "player": random_empty(board, [], rng),
+        "robots": [random_empty(board, [], rng) for _ in range(NUM_ROBOTS)],
+        "teleports": NUM_TELEPORTS,
+        "score": 0,
+        "over": False,
+    }
+
+
+# ------------------ GAME STEP ------------------
+def step(game, rng, move=None, teleport=False):
+    """Apply the player's move (or teleport), then advance every robot."""
+    if game["over"]:
+        return
+
+    px, py = game["player"]
+
+    if teleport and game["teleports"] > 0:
+        game["teleports"] -= 1
+        game["player"] = random_empty(game["board"], game["robots"], rng)
+
+    elif move:
+        nx, ny = px + move[0], py + move[1]
+        if game["board"][(nx, ny)] == EMPTY:
+            game["player"] = (nx, ny)
+
+    # Move robots
+    next_positions = {}
+    survivors = []
+
+    for rx, ry in game["robots"]:
+        nx, ny = move_robot(rx, ry, *game["player"])
+
+        if (nx, ny) == game["player"]:
+            game["over"] = True
+            return
+
+        next_positions.setdefault((nx, ny), 0)
+        next_positions[(nx, ny)] += 1
+
+    for pos, count in next_positions.items():
+        if count == 1:
+            survivors.append(pos)
+        else:
+            game["score"] += count
+
+    game["robots"] = survivors
+
+    if not survivors:
+        game["over"] = True
+
+
+# ------------------ HEADLESS RUN ------------------
+def run(steps, rng):
+    """Play ``steps`` random turns, starting a new game whenever one ends."""
+    game = new_game(rng)
+    games = wins = 0
+    for _ in range(steps):
+        if game["over"]:
+            games += 1
+            wins += not game["robots"]
+            game = new_game(rng)
+        step(game, rng, move=rng.choice(MOVES))
+    return {"games_finished": games, "wins": wins}
@@ -1,17 +1,15 @@
 import streamlit as st
-import random
+from Games.common.profiling import profiled
+from Games.common.rng import session_rng
+from Games.common.state import game_state
+from Games.common.textgrid import TextGrid
+from . import engine
+from .engine import WIDTH, HEIGHT
 
 # ------------------ CONFIG ------------------
-WIDTH = 15
-HEIGHT = 12
-NUM_ROBOTS = 8
-NUM_TELEPORTS = 2
-
-EMPTY = " "
 PLAYER = "🧍"
 ROBOT = "🤖"
 DEAD = "💥"
-WALL = "⬛"
 
 # ------------------ RULES ------------------
 RULES = """
@@ -28,108 +26,29 @@ RULES = """
 - Win by destroying **all robots**
 """
 
-# ------------------ HELPERS ------------------
-def empty_board():
-    board = {}
-    for x in range(WIDTH):
-        for y in range(HEIGHT):
-            board[(x, y)] = EMPTY
-
-    for x in range(WIDTH):
-        board[(x, 0)] = WALL
-        board[(x, HEIGHT - 1)] = WALL
-    for y in range(HEIGHT):
-        board[(0, y)] = WALL
-        board[(WIDTH - 1, y)] = WALL
-
-    return board
-
-
-def random_empty(board, occupied):
-    while True:
-        x = random.randint(1, WIDTH - 2)
-        y = random.randint(1, HEIGHT - 2)
-        if board[(x, y)] == EMPTY and (x, y) not in occupied:
-            return (x, y)
-
-
-def move_robot(rx, ry, px, py):
-    dx = 1 if px > rx else -1 if px < rx else 0
-    dy = 1 if py > ry else -1 if py < ry else 0
-    return rx + dx, ry + dy
-
-
 # ------------------ GAME INIT ------------------
 def reset_game():
-    st.session_state.board = empty_board()
-    st.session_state.player = random_empty(st.session_state.board, [])
-    st.session_state.robots = [
-        random_empty(st.session_state.board, [])
-        for _ in range(NUM_ROBOTS)
-    ]
-    st.session_state.teleports = NUM_TELEPORTS
-    st.session_state.score = 0
-    st.session_state.over = False
+    st.session_state.robot_game = engine.new_game(session_rng("robots"))
 
 
 # ------------------ RENDER ------------------
+@profiled("robots.render")
 def render():
-    grid = ""
-    for y in range(HEIGHT):
-        for x in range(WIDTH):
-            pos = (x, y)
-            if pos == st.session_state.player:
-                grid += PLAYER
-            elif pos in st.session_state.robots:
-                grid += ROBOT
-            else:
-                grid += st.session_state.board[pos]
-        grid += "\n"
-    st.code(grid)
+    game = st.session_state.robot_game
+    board = game["board"]
+    view = game_state("robots", view=TextGrid)["view"]
+
+    rows = [[board[(x, y)] for x in range(WIDTH)] for y in range(HEIGHT)]
+    # A dict instead of a per-cell scan of the robot list; the player is drawn on top.
+    marks = dict.fromkeys(game["robots"], ROBOT)
+    marks[game["player"]] = PLAYER
+    st.code(view.render(rows, marks) + "\n")
 
 
 # ------------------ GAME STEP ------------------
+@profiled("robots.step")
 def step(move=None, teleport=False):
-    if st.session_state.over:
-        return
-
-    px, py = st.session_state.player
-
-    if teleport and st.session_state.teleports > 0:
-        st.session_state.teleports -= 1
-        st.session_state.player = random_empty(
-            st.session_state.board, st.session_state.robots
-        )
-
-    elif move:
-        nx, ny = px + move[0], py + move[1]
-        if st.session_state.board[(nx, ny)] == EMPTY:
-            st.session_state.player = (nx, ny)
-
-    # Move robots
-    next_positions = {}
-    survivors = []
-
-    for rx, ry in st.session_state.robots:
-        nx, ny = move_robot(rx, ry, *st.session_state.player)
-
-        if (nx, ny) == st.session_state.player:
-            st.session_state.over = True
-            return
-
-        next_positions.setdefault((nx, ny), 0)
-        next_positions[(nx, ny)] += 1
-
-    for pos, count in next_positions.items():
-        if count == 1:
-            survivors.append(pos)
-        else:
-            st.session_state.score += count
-
-    st.session_state.robots = survivors
-
-    if not survivors:
-        st.session_state.over = True
+    engine.step(st.session_state.robot_game, session_rng("robots"), move=move, teleport=teleport)
 
 
 # ------------------ UI ------------------
@@ -140,17 +59,18 @@ def run():
 
     st.markdown(RULES)
 
-    if "board" not in st.session_state:
+    if "robot_game" not in st.session_state:
         reset_game()
+    game = st.session_state.robot_game
 
     # -------- Board --------
     render()
 
     # -------- Stats --------
     s1, s2, s3 = st.columns(3)
-    s1.metric("🤖 Robots", len(st.session_state.robots))
-    s2.metric("💥 Score", st.session_state.score)
-    s3.metric("🌀 Teleports", st.session_state.teleports)
+    s1.metric("🤖 Robots", len(game["robots"]))
+    s2.metric("💥 Score", game["score"])
+    s3.metric("🌀 Teleports", game["teleports"])
 
     # -------- Controls BELOW board --------
     st.markdown("### 🎮 Move")
@@ -201,8 +121,8 @@ def run():
             reset_game(); st.rerun()
 
     # -------- End states --------
-    if st.session_state.over:
-        if st.session_state.robots:
+    if game["over"]:
+        if game["robots"]:
             st.error("💀 You were caught by a robot!")
         else:
             st.success("🎉 All robots destroyed! You win!")
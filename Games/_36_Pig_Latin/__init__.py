@@ -0,0 +1,6 @@
+GAME = {
+    "id": "piglatin",
+    "emoji": "🐷",
+    "name": "Pig Latin",
+    "desc": "Language fun",
+}
@@ -1,6 +1,8 @@
 import streamlit as st
 import random
 import re
+from Games.common.memo import memoize
+from Games.common.state import game_state
 
 # ------------------ CONFIG ------------------
 VOWELS = ("a", "e", "i", "o", "u")
@@ -28,6 +30,7 @@ SENTENCES = [
 ]
 
 # ------------------ PIG LATIN LOGIC ------------------
+@memoize("pig_latin.translate", maxsize=512)
 def english_to_pig_latin(sentence):
     output = []
 
@@ -63,16 +66,18 @@ def english_to_pig_latin(sentence):
 
 # ------------------ GAME STATE ------------------
 def new_round():
+    state = game_state("piglatin")
     text = random.choice(SENTENCES)
-    st.session_state.question = text
-    st.session_state.answer = english_to_pig_latin(text)
-    st.session_state.user_input = ""
-    st.session_state.submitted = False
-    st.session_state.correct = None
+    state["question"] = text
+    state["answer"] = english_to_pig_latin(text)
+    state["user_input"] = ""
+    state["submitted"] = False
+    state["correct"] = None
 
 def reset_game():
-    st.session_state.scores = [0, 0]
-    st.session_state.turn = 0
+    state = game_state("piglatin")
+    state["scores"] = [0, 0]
+    state["turn"] = 0
     new_round()
 
 # ------------------ UI ------------------
@@ -89,46 +94,47 @@ def run():
 - Correct answer gives **+1 point**
         """)
 
-    if "scores" not in st.session_state:
+    state = game_state("piglatin")
+    if "scores" not in state:
         reset_game()
 
     # -------- Scoreboard --------
     c1, c2 = st.columns(2)
-    c1.metric("🧑 Player 1", st.session_state.scores[0])
-    c2.metric("🧑 Player 2", st.session_state.scores[1])
+    c1.metric("🧑 Player 1", state["scores"][0])
+    c2.metric("🧑 Player 2", state["scores"][1])
 
-    current_player = st.session_state.turn + 1
+    current_player = state["turn"] + 1
     st.markdown(f"### 🔄 Player {current_player}'s Turn")
 
     # -------- Question --------
     st.markdown("### 🔤 Convert to Pig Latin:")
-    st.code(st.session_state.question)
+    st.code(state["question"])
 
     # -------- Input --------
-    st.session_state.user_input = st.text_input(
+    state["user_input"] = st.text_input(
         "Your answer:",
-        disabled=st.session_state.submitted
+        disabled=state["submitted"]
     )
 
     # -------- Submit --------
-    if st.button("✅ Submit", disabled=st.session_state.submitted):
-        st.session_state.submitted = True
-        if st.session_state.user_input.strip() == st.session_state.answer:
-            st.session_state.correct = True
-            st.session_state.scores[st.session_state.turn] += 1
+    if st.button("✅ Submit", disabled=state["submitted"]):
+        state["submitted"] = True
+        if state["user_input"].strip() == state["answer"]:
+            state["correct"] = True
+            state["scores"][state["turn"]] += 1
         else:
-            st.session_state.correct = False
+            state["correct"] = False
 
     # -------- Feedback --------
-    if st.session_state.submitted:
-        if st.session_state.correct:
+    if state["submitted"]:
+        if state["correct"]:
             st.success("🎉 Correct!")
         else:
             st.error("❌ Incorrect")
-            st.info(f"Correct answer:\n**{st.session_state.answer}**")
+            st.info(f"Correct answer:\n**{state['answer']}**")
 
         if st.button("➡ Next Turn"):
-            st.session_state.turn = 1 - st.session_state.turn
+            state["turn"] = 1 - state["turn"]
             new_round()
             st.rerun()
 
@@ -0,0 +1,6 @@
+GAME = {
+    "id": "jaccuse",
+    "emoji": "🕵️",
+    "name": "J’ACCUSE!",
+    "desc": "Mystery deduction game",
+}
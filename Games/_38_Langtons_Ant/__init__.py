@@ -0,0 +1,6 @@
+GAME = {
+    "id": "langton",
+    "emoji": "🐜",
+    "name": "Langton’s Ant",
+    "desc": "Emergent behavior",
+}
@@ -0,0 +1,68 @@
+"""Langton's Ant logic, free of Streamlit.
+
+A game is a plain dict ``{"grid", "ants", "running", "steps"}``; ``rng`` is
+only used to pick the ants' starting directions.
+"""
+
+# ================== CONSTANTS ==================
+NORTH, EAST, SOUTH, WEST = 0, 1, 2, 3
+DIRECTIONS = [NORTH, EAST, SOUTH, WEST]
+
+# (dx, dy) for each direction, indexed by NORTH/EAST/SOUTH/WEST
+MOVES = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+# ================== INITIALIZATION ==================
+def new_game(grid_size, num_ants, rng):
+    grid = [[0 for _ in range(grid_size)] for _ in range(grid_size)]
+    ants = []
+
+    for _ in range(num_ants):
+        ants.append({
+            "x": grid_size // 2,
+            "y": grid_size // 2,
+            "dir": rng.choice(DIRECTIONS)
+        })
+
+    return {
+        "grid": grid,
+        "ants": ants,
+        "running": False,
+        "steps": 0
+    }
+
+
+# ================== STEP LOGIC ==================
+def step(game):
+    """Move every ant once (white: turn right, black: turn left, flip, advance)."""
+    grid = game["grid"]
+    size = len(grid)
+
+    for ant in game["ants"]:
+        x, y = ant["x"], ant["y"]
+
+        if grid[y][x] == 0:  # WHITE
+            ant["dir"] = (ant["dir"] + 1) % 4
+            grid[y][x] = 1
+        else:               # BLACK
+            ant["dir"] = (ant["dir"] - 1) % 4
+            grid[y][x] = 0
+
+        dx, dy = MOVES[ant["dir"]]
+        ant["x"] = (x + dx) % size
+        ant["y"] = (y + dy) % size
+
+    game["steps"] += 1
+
+
+def black_cells(game):
+    return sum(map(sum, game["grid"]))
+
+
+# ================== HEADLESS RUN ==================
+def run(steps, rng, grid_size=60, num_ants=1):
+    """Run ``steps`` ticks on a fresh board and summarise the result."""
+    game = new_game(grid_size, num_ants, rng)
+    for _ in range(steps):
+        step(game)
+    return {"steps": game["steps"], "black_cells": black_cells(game)}
@@ -1,10 +1,14 @@
 import streamlit as st
-import random
-import time
+from Games.common.animation import animate
+from Games.common.profiling import profiled
+from Games.common.rng import session_rng
+from Games.common.state import game_state
+from Games.common.textgrid import TextGrid
+from . import engine
 
-# ================== CONSTANTS ==================
-NORTH, EAST, SOUTH, WEST = 0, 1, 2, 3
-DIRECTIONS = [NORTH, EAST, SOUTH, WEST]
+# ================== GLYPHS ==================
+CELL_GLYPHS = ("⬜", "⬛")  # indexed by cell value (0 white, 1 black)
+ANT = "🐜"
 
 # ================== RULES ==================
 RULES_TEXT = """
@@ -28,72 +32,20 @@ RULES_TEXT = """
 - Simple rules → **complex emergent behavior**
 """
 
-# ================== INITIALIZATION ==================
+# ================== ENGINE ADAPTERS ==================
 def init_game(grid_size, num_ants):
-    grid = [[0 for _ in range(grid_size)] for _ in range(grid_size)]
-    ants = []
-
-    for _ in range(num_ants):
-        ants.append({
-            "x": grid_size // 2,
-            "y": grid_size // 2,
-            "dir": random.choice(DIRECTIONS)
-        })
-
-    st.session_state.ant_game = {
-        "grid": grid,
-        "ants": ants,
-        "running": False,
-        "steps": 0
-    }
-
-# ================== STEP LOGIC ==================
+    st.session_state.ant_game = engine.new_game(grid_size, num_ants, session_rng("langton"))
+
+@profiled("langton.step_simulation")
 def step_simulation():
-    game = st.session_state.ant_game
-    grid = game["grid"]
-    size = len(grid)
-
-    for ant in game["ants"]:
-        x, y = ant["x"], ant["y"]
-
-        if grid[y][x] == 0:  # WHITE
-            ant["dir"] = (ant["dir"] + 1) % 4
-            grid[y][x] = 1
-        else:               # BLACK
-            ant["dir"] = (ant["dir"] - 1) % 4
-            grid[y][x] = 0
-
-        if ant["dir"] == NORTH:
-            ant["y"] = (y - 1) % size
-        elif ant["dir"] == SOUTH:
-            ant["y"] = (y + 1) % size
-        elif ant["dir"] == EAST:
-            ant["x"] = (x + 1) % size
-        elif ant["dir"] == WEST:
-            ant["x"] = (x - 1) % size
-
-    game["steps"] += 1
+    engine.step(st.session_state.ant_game)
 
 # ================== RENDER ==================
+@profiled("langton.render_grid")
 def render_grid():
     game = st.session_state.ant_game
-    grid = game["grid"]
-    ants = game["ants"]
-    size = len(grid)
-
-    ant_positions = {(a["x"], a["y"]) for a in ants}
-
-    display = []
-    for y in range(size):
-        row = ""
-        for x in range(size):
-            if (x, y) in ant_positions:
-                row += "🐜"
-            else:
-                row += "⬛" if grid[y][x] else "⬜"
-        display.append(row)
-
-    return "\n".join(display)
+    view = game_state("langton", view=lambda: TextGrid(CELL_GLYPHS))["view"]
+    return view.render(game["grid"], {(a["x"], a["y"]): ANT for a in game["ants"]})
 
 # ================== MAIN ENTRY ==================
 def run():
@@ -131,15 +83,12 @@ def run():
 
     game = st.session_state.ant_game
 
-    # ---------- Simulation ----------
-    if game["running"]:
-        step_simulation()
-        time.sleep(speed)
-        st.rerun()
+    # ---------- Simulation + Display ----------
+    def render():
+        st.markdown(f"**Steps:** {st.session_state.ant_game['steps']}")
+        st.code(render_grid())
 
-    # ---------- Display ----------
-    st.markdown(f"**Steps:** {game['steps']}")
-    st.code(render_grid())
+    animate("langton", render, step=step_simulation, interval=speed, running=game["running"])
 
 # ================== REQUIRED ==================
 if __name__ == "__main__":
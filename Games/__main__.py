@@ -0,0 +1,121 @@
+"""Headless runner for the simulation engines.
+
+    python -m Games list
+    python -m Games run forest --steps 10000 --seed 1
+    python -m Games run langton --steps 100000 --opt grid_size=80 --opt num_ants=3
+    python -m Games run forest --steps 1000000 --parquet forest.parquet
+
+Runs an engine for N steps outside Streamlit and reports steps/sec.
+``--parquet`` streams per-step results to a Parquet file for engines that
+record them (see ``RESULTS``).
+"""
+
+import argparse
+import ast
+import importlib
+import json
+import sys
+import time
+
+from Games.common import profiling
+from Games.common.results import ResultSink
+from Games.common.rng import Rng
+
+ENGINES = {
+    "fish": "Games._25_Fish_Tank.engine",
+    "forest": "Games._27_Forest_SIre_SIm.engine",
+    "robots": "Games._35_Hungry_Robots.engine",
+    "langton": "Games._38_Langtons_Ant.engine",
+}
+
+# Engines whose ``run`` accepts a ``sink``, and the results schema they write.
+RESULTS = {
+    "forest": "forest.steps",
+}
+
+
+def parse_option(text):
+    """``key=value`` -> (key, value), with value parsed as a Python literal if possible."""
+    key, _, value = text.partition("=")
+    try:
+        value = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        pass
+    return key, value
+
+
+def run_engine(name, steps, seed=None, profile=False, parquet=None, **options):
+    """Run engine ``name`` headless; returns a report dict."""
+    engine = importlib.import_module(ENGINES[name])
+    rng = Rng(seed)
+    if parquet and name not in RESULTS:
+        raise SystemExit(f"{name} does not record results; --parquet works with {sorted(RESULTS)}")
+    sink = ResultSink(RESULTS[name], path=parquet) if parquet else None
+    if sink is not None:
+        options["sink"] = sink
+
+    with profiling.recording(name, enabled=profile, log=False) as rec:
+        start = time.perf_counter()
+        try:
+            summary = engine.run(steps, rng, **options)
+        finally:
+            if sink is not None:
+                sink.close()
+        elapsed = time.perf_counter() - start
+
+    report = {
+        "engine": name,
+        "steps": steps,
+        "seed": rng.seed_value,
+        "seconds": round(elapsed, 4),
+        "steps_per_sec": round(steps / elapsed, 1) if elapsed else None,
+        "summary": summary,
+    }
+    if sink is not None:
+        report["parquet"] = {"path": sink.path, "rows": sink.rows, "row_groups": sink.batches}
+    if rec.result is not None:
+        report["sections"] = rec.result.to_dict()["sections"]
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m Games", description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="list the available engines")
+
+    run_p = sub.add_parser("run", help="run an engine headless and report steps/sec")
+    run_p.add_argument("engine", choices=sorted(ENGINES))
+    run_p.add_argument("--steps", type=int, default=1000)
+    run_p.add_argument("--seed", type=int, default=None)
+    run_p.add_argument("--opt", action="append", default=[], metavar="KEY=VALUE",
+                       help="engine option, e.g. --opt grid_size=80 (repeatable)")
+    run_p.add_argument("--json", action="store_true", help="print the report as JSON")
+    run_p.add_argument("--profile", action="store_true", help="include per-section timings")
+    run_p.add_argument("--parquet", metavar="PATH", help="stream per-step results to this Parquet file")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name, module in sorted(ENGINES.items()):
+            print(f"{name:<10} {module}")
+        return 0
+
+    options = dict(map(parse_option, args.opt))
+    report = run_engine(args.engine, args.steps, args.seed, profile=args.profile,
+                        parquet=args.parquet, **options)
+    if args.json:
+        print(json.dumps(report))
+    else:
+        print(f"{report['engine']}: {report['steps']} steps in {report['seconds']:.3f}s "
+              f"-> {report['steps_per_sec']} steps/sec")
+        print(f"  {report['summary']}")
+        if "parquet" in report:
+            print(f"  wrote {report['parquet']['rows']} rows to {report['parquet']['path']}")
+        for section_name, stats in report.get("sections", {}).items():
+            print(f"  {section_name:<24} {stats['calls']:>8} calls {stats['ms']:>10.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Shared infrastructure used by app.py and the individual games."""
@@ -0,0 +1,92 @@
+"""Fragment-based animation scheduler.
+
+Games used to animate with ``time.sleep(...)`` followed by ``st.rerun()``,
+which re-executes the whole page (every widget, every CSS block) per frame.
+``animate`` instead runs a step/render pair inside an ``st.fragment`` with
+``run_every``, so each tick only refreshes the animated region.
+
+Ticks are paced against the wall clock. If the server falls behind (a tick
+arrives late because the host is busy) the model is advanced by the number
+of missed ticks and drawn once, i.e. frames are skipped rather than queued.
+"""
+
+import time
+
+import streamlit as st
+
+from . import profiling
+
+
+def _clock(key):
+    clocks = st.session_state.setdefault("_anim_clocks", {})
+    return clocks.setdefault(key, {"last": None, "steps": 0, "frames": 0, "skipped": 0})
+
+
+def reset_clock(key):
+    """Forget the pacing state of ``key`` (next tick starts a fresh timeline)."""
+    st.session_state.setdefault("_anim_clocks", {}).pop(key, None)
+
+
+def due_steps(clock, interval, max_catchup, now=None):
+    """How many model steps are owed since the last tick (0 if it is too early)."""
+    now = time.monotonic() if now is None else now
+    if clock["last"] is None:
+        # First tick only anchors the timeline; the model moves one interval later.
+        clock["last"] = now
+        return 0
+
+    owed = int((now - clock["last"]) / interval)
+    if owed <= 0:
+        return 0
+    # Keep the timeline anchored to whole intervals; drop what we can't catch up.
+    clock["last"] += owed * interval
+    if owed > max_catchup:
+        clock["last"] = now
+        owed = max_catchup
+    return owed
+
+
+def animate(key, render, step=None, interval=0.1, running=True, max_catchup=5):
+    """Render an animated region that refreshes on its own every ``interval`` s.
+
+    ``step()`` advances the model by one tick; returning ``False`` means the
+    animation is over, and the full page is rerun so the caller can stop
+    passing ``running=True``. ``render()`` draws the current state; it runs
+    inside a fragment, so it may only write to the main area (no sidebar).
+
+    Call ``reset_clock(key)`` when an animation that was hidden (not rendered
+    at all) starts again, so the pause is not replayed as missed ticks.
+    """
+
+    @st.fragment(run_every=interval if running else None)
+    def _region():
+        with profiling.recording(
+            f"tick:{key}", enabled=st.session_state.get(profiling.SESSION_FLAG, False), game=key
+        ):
+            _tick()
+
+    def _tick():
+        clock = _clock(key)
+        finished = False
+
+        if running and step is not None:
+            owed = due_steps(clock, interval, max_catchup)
+            clock["skipped"] += max(0, owed - 1)
+            with profiling.section(f"{key}.step"):
+                for _ in range(owed):
+                    clock["steps"] += 1
+                    if step() is False:
+                        finished = True
+                        break
+
+        with profiling.section(f"{key}.render"):
+            render()
+        clock["frames"] += 1
+
+        if finished:
+            reset_clock(key)
+            st.rerun()
+
+    if not running:
+        reset_clock(key)
+    _region()
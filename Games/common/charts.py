@@ -0,0 +1,128 @@
+"""Figure lifecycle and rendered-chart cache for the matplotlib games.
+
+``plt.figure()`` registers every figure in pyplot's global manager, where it
+stays until someone calls ``plt.close``; on a long-running server each rerun
+leaked one. Charts here are drawn on bare ``matplotlib.figure.Figure``
+objects that pyplot never sees, inside ``figure()`` which releases them on
+exit, and the rendered PNG/SVG bytes are cached by the plotted data:
+
+    def draw(fig):
+        ax = fig.subplots()
+        ax.plot(xs, ys)
+
+    show_chart(("birthday.curve", xs, ys), draw, figsize=(6, 4))
+
+A rerun with the same data is a hash + cache lookup, not a re-rasterize.
+``line_chart`` additionally takes the native ``st.line_chart`` path for
+plain x/y data when ``native=True`` (or ``ARCADE_NATIVE_CHARTS=1``).
+
+The cache budget is ``ARCADE_LIMIT_CHART_CACHE_MB`` (default 32).
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+from .images import ByteLRU, content_key
+from .state import limit
+
+NATIVE = os.environ.get("ARCADE_NATIVE_CHARTS", "") not in ("", "0")
+CHART_CACHE = ByteLRU(limit("chart_cache_mb", 32) * 1024 * 1024)
+
+# Figures created through ``figure()`` and their renders, for the collector.
+_stats = {"live": 0, "created": 0, "rendered": 0, "peak_kb": 0.0}
+
+
+# ------------------ Lifecycle ------------------
+@contextlib.contextmanager
+def figure(figsize=(6, 4), dpi=100):
+    """A pyplot-free ``Figure`` that is cleared and dropped when the block exits."""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    _stats["live"] += 1
+    _stats["created"] += 1
+    try:
+        yield fig
+    finally:
+        fig.clear()
+        _stats["live"] -= 1
+
+
+def render(draw, figsize=(6, 4), fmt="png", dpi=100):
+    """Bytes of the chart ``draw(fig)`` makes, in ``fmt`` (``"png"`` or ``"svg"``)."""
+    with figure(figsize, dpi) as fig:
+        draw(fig)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, bbox_inches="tight")
+        # Raster size of the canvas the figure held while it was alive.
+        width, height = fig.canvas.get_width_height()
+        _stats["peak_kb"] = max(_stats["peak_kb"], width * height * 4 / 1024)
+    _stats["rendered"] += 1
+    return buffer.getvalue()
+
+
+def cached_chart(key, draw, figsize=(6, 4), fmt="png", dpi=100):
+    """``render`` memoised on ``key``, a tuple of everything that is plotted."""
+    digest = content_key("chart", fmt, figsize, dpi, *key)
+    data = CHART_CACHE.get(digest)
+    if data is None:
+        data = CHART_CACHE.put(digest, render(draw, figsize, fmt, dpi))
+    return data
+
+
+# ------------------ Streamlit ------------------
+def show_chart(key, draw, figsize=(6, 4), fmt="png", dpi=100, **image_kwargs):
+    """Display a cached chart with ``st.image``."""
+    import streamlit as st
+
+    data = cached_chart(key, draw, figsize, fmt, dpi)
+    st.image(data.decode() if fmt == "svg" else data, **image_kwargs)
+    return data
+
+
+def line_chart(key, x, y, title="", xlabel="", ylabel="", native=None,
+               figsize=(6, 4), marker=None, **image_kwargs):
+    """Plain x/y line: ``st.line_chart`` when native, else a cached matplotlib PNG."""
+    import streamlit as st
+
+    x, y = list(x), list(y)
+    if NATIVE if native is None else native:
+        if title:
+            st.caption(title)
+        st.line_chart({xlabel or "x": x, ylabel or "y": _arrow_safe(y)},
+                      x=xlabel or "x", y=ylabel or "y")
+        return None
+
+    def draw(fig):
+        ax = fig.subplots()
+        ax.plot(x, y, marker=marker)
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+
+    return show_chart((key, title, xlabel, ylabel, marker, x, y), draw, figsize, **image_kwargs)
+
+
+def _arrow_safe(values):
+    """``values`` as floats if any int is too wide for an Arrow int64 column."""
+    if not any(isinstance(v, int) and not -2**63 <= v < 2**63 for v in values):
+        return values
+    out = []
+    for v in values:
+        try:
+            out.append(float(v))
+        except OverflowError:
+            out.append(float("inf"))
+    return out
+
+
+def chart_collector():
+    """Profiling collector: figure counts, canvas memory and chart cache stats."""
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    return {"charts": {
+        **_stats,
+        "pyplot_open": len(pyplot.get_fignums()) if pyplot else 0,
+        "cache": CHART_CACHE.stats(),
+    }}
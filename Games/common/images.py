@@ -0,0 +1,129 @@
+"""Shared PNG pipeline for the games that draw with PIL.
+
+- ``cached_png(key, build)`` content-hashes the inputs that determine an
+  image and keeps the *encoded* bytes in a process-wide LRU bounded by total
+  size, so clicking "Apply" or "Download" with unchanged inputs costs a hash
+  instead of a render + encode.
+- ``encode_png(img, "fast")`` is for live frames (zlib level 1, no
+  optimizer); ``"max"`` is for downloads (level 9 + optimize).
+- ``reuse_canvas`` hands back the previous frame's image, cleared, when the
+  size and mode still match, instead of allocating a new one per frame.
+
+The cache budget is ``ARCADE_LIMIT_PNG_CACHE_MB`` (default 64).
+"""
+
+import functools
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+from .state import limit
+
+COMPRESSION = {
+    "fast": {"compress_level": 1},
+    "max": {"compress_level": 9, "optimize": True},
+}
+
+
+# ------------------ Encoding ------------------
+def encode_png(img, mode="max"):
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG", **COMPRESSION[mode])
+    return buffer.getvalue()
+
+
+def content_key(*parts):
+    """Stable digest of the inputs that determine an image."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else repr(part).encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+# ------------------ Cache ------------------
+class ByteLRU:
+    """Thread-safe LRU of ``bytes`` values, bounded by their total size."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.items = OrderedDict()
+        self.size = 0
+        self.hits = self.misses = self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self.items.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if len(value) > self.max_bytes:
+            return value  # never cache something that would evict everything
+        with self._lock:
+            old = self.items.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self.items[key] = value
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                _, evicted = self.items.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+        return value
+
+    def stats(self):
+        return {
+            "entries": len(self.items),
+            "kb": round(self.size / 1024, 1),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+PNG_CACHE = ByteLRU(limit("png_cache_mb", 64) * 1024 * 1024)
+
+
+def cached_png(key, build, mode="max"):
+    """PNG bytes for ``key`` (a tuple of inputs); ``build()`` makes the image on a miss."""
+    digest = content_key(mode, *key)
+    data = PNG_CACHE.get(digest)
+    if data is None:
+        data = PNG_CACHE.put(digest, encode_png(build(), mode))
+    return data
+
+
+def cache_collector():
+    """Profiling collector: PNG cache occupancy and hit rate."""
+    return {"png_cache": PNG_CACHE.stats()}
+
+
+# ------------------ Canvases & fonts ------------------
+def reuse_canvas(previous, size, mode="RGB", color=(0, 0, 0)):
+    """``previous`` cleared to ``color`` if it still fits, else a new image."""
+    from PIL import Image
+
+    if previous is not None and previous.size == tuple(size) and previous.mode == mode:
+        previous.paste(color, (0, 0, *previous.size))
+        return previous
+    return Image.new(mode, tuple(size), color)
+
+
+@functools.lru_cache(maxsize=16)
+def load_font(name=None, size=16):
+    """A TrueType font by file name, falling back to PIL's default (cached)."""
+    from PIL import ImageFont
+
+    if name:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            pass
+    return ImageFont.load_default()
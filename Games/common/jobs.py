@@ -0,0 +1,291 @@
+"""Background jobs: heavy computations on a shared process pool.
+
+A 100k-trial Birthday run or a huge Fibonacci number used to run inside the
+Streamlit script thread, freezing the session until it finished. Games now
+``submit`` such work to one process pool per server and keep the returned
+``Job`` in their session state:
+
+    job = jobs.submit(simulate, 23, 100_000, seed, label="Birthday trials")
+    ...
+    if job.done():
+        matches = job.result()
+    else:
+        jobs.progress_panel(job, key="birthday")  # live bar + Cancel button
+
+The submitted function must be importable (module level) and accept a
+``progress`` keyword: a ``tqdm`` bar whose counts are mirrored to the
+session (``progress.total = n`` / ``progress.update(k)``). ``update`` raises
+``Cancelled`` once the user has cancelled, so loops stop at their next
+progress tick. ``progress.publish(**values)`` shares partial results (say,
+matches so far) that the page reads back from ``job.progress()``, so a
+cancelled job's work up to its last ``publish`` is not lost.
+
+``ARCADE_LIMIT_JOBS_WORKERS`` caps the processes (default: CPU count, at
+most 4) and ``ARCADE_LIMIT_JOBS_QUEUE`` the jobs queued or running at once
+(default 32; ``submit`` raises ``JobLimitError`` past it). ``ARCADE_JOBS=0``
+runs every job inline, on the calling thread.
+"""
+
+import contextlib
+import io
+import itertools
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor
+
+from tqdm import tqdm
+
+from .state import limit
+
+ENABLED = os.environ.get("ARCADE_JOBS", "") != "0"
+WORKERS = limit("jobs.workers", min(os.cpu_count() or 1, 4))
+QUEUE = limit("jobs.queue", 32)
+POLL = 0.5  # seconds between progress refreshes in the UI
+MIN_INTERVAL = 0.2  # seconds between progress reports from a worker
+
+_lock = threading.Lock()
+_pool = None
+_manager = None
+_ids = itertools.count(1)
+_active = set()
+
+
+class Cancelled(Exception):
+    """Raised inside a job when it was cancelled."""
+
+
+class JobLimitError(RuntimeError):
+    """Too many jobs queued or running on this server."""
+
+
+# ------------------ Progress ------------------
+class Progress(tqdm):
+    """A silent ``tqdm`` that mirrors its counts into ``channel`` and checks for cancel."""
+
+    def __init__(self, channel, cancel, total=None):
+        self.channel = channel
+        self.cancel_event = cancel
+        super().__init__(total=total, file=io.StringIO(), mininterval=MIN_INTERVAL,
+                         miniters=1, leave=False)
+
+    def display(self, msg=None, pos=None):
+        d = self.format_dict
+        self.channel.update(n=d["n"], total=d["total"], rate=d["rate"], elapsed=d["elapsed"])
+        return True
+
+    def update(self, n=1):
+        if self.cancel_event.is_set():
+            raise Cancelled()
+        return super().update(n)
+
+    def publish(self, **values):
+        """Share partial results with the session; they appear in ``Job.progress()``."""
+        self.channel.update(values)
+
+
+def _execute(func, args, kwargs, channel, cancel):
+    """Runs in the worker: call ``func`` with a ``Progress`` bar and report the outcome."""
+    if cancel.is_set():
+        raise Cancelled()
+    with Progress(channel, cancel) as progress:
+        result = func(*args, progress=progress, **kwargs)
+        progress.refresh()
+    return result
+
+
+# ------------------ Pool ------------------
+def mp_context():
+    """Start method for worker processes (also used by headless fan-outs)."""
+    # Forking a threaded server (Streamlit) can copy held locks into the
+    # child; forkserver/spawn start clean.
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+@contextlib.contextmanager
+def _plain_main():
+    """Hide the Streamlit script from processes started inside the block.
+
+    Streamlit runs the page as ``__main__``; a forkserver/spawn child re-runs
+    ``__main__`` from its file before doing any work, i.e. it would execute
+    the whole app. Worker functions live in importable modules, so children
+    get an empty ``__main__`` instead. Callers hold ``_lock``.
+    """
+    real = sys.modules["__main__"]
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        sys.modules["__main__"] = real
+
+
+def pool():
+    """The server's process pool and the manager that shares progress (lazily started)."""
+    global _pool, _manager
+    with _lock:
+        if _pool is None:
+            context = mp_context()
+            with _plain_main():
+                _manager = context.Manager()
+            _pool = ProcessPoolExecutor(max_workers=WORKERS, mp_context=context)
+        return _pool, _manager
+
+
+def shutdown():
+    global _pool, _manager
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _manager.shutdown()
+            _pool = _manager = None
+
+
+# ------------------ Jobs ------------------
+class Job:
+    """Handle on one submitted computation; safe to keep in session state."""
+
+    def __init__(self, label, future, channel, cancel):
+        self.id = next(_ids)
+        self.label = label
+        self.future = future
+        self.channel = channel
+        self.cancel_event = cancel
+        self.submitted = time.time()
+
+    def done(self):
+        return self.future.done()
+
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def cancel(self):
+        """Ask the job to stop; a queued job never starts, a running one stops at its next tick."""
+        self.cancel_event.set()
+        self.future.cancel()
+
+    def result(self):
+        """The return value; raises ``Cancelled`` or the job's own exception."""
+        if self.future.cancelled():
+            raise Cancelled()
+        return self.future.result()
+
+    def progress(self):
+        """``{"n", "total", "rate", "elapsed", "fraction"}`` plus published values, as last reported."""
+        try:
+            info = dict(self.channel)
+        except (EOFError, OSError, BrokenPipeError):  # manager gone (shutdown)
+            info = {}
+        n, total = info.get("n", 0), info.get("total")
+        info.setdefault("n", n)
+        info["fraction"] = min(1.0, n / total) if total else 0.0
+        return info
+
+
+class _InlineEvent:
+    def __init__(self):
+        self._set = False
+
+    def set(self):
+        self._set = True
+
+    def is_set(self):
+        return self._set
+
+
+def _inline(label, func, args, kwargs):
+    """Run now on this thread; used when jobs are disabled."""
+    from concurrent.futures import Future
+
+    future, channel, cancel = Future(), {}, _InlineEvent()
+    try:
+        future.set_result(_execute(func, args, kwargs, channel, cancel))
+    except BaseException as exc:
+        future.set_exception(exc)
+    return Job(label, future, channel, cancel)
+
+
+def submit(func, *args, label=None, **kwargs):
+    """Run ``func(*args, progress=..., **kwargs)`` in the pool; returns a ``Job``."""
+    label = label or func.__name__
+    if not ENABLED:
+        return _inline(label, func, args, kwargs)
+
+    with _lock:
+        _active.difference_update({job for job in _active if job.done()})
+        if len(_active) >= QUEUE:
+            raise JobLimitError(f"{len(_active)} jobs already queued or running; try again shortly")
+    executor, manager = pool()
+    channel, cancel = manager.dict(), manager.Event()
+    with _lock, _plain_main():  # submit is where the pool starts workers
+        future = executor.submit(_execute, func, args, kwargs, channel, cancel)
+    job = Job(label, future, channel, cancel)
+    with _lock:
+        _active.add(job)
+    return job
+
+
+def jobs_collector():
+    """Profiling collector: jobs queued/running on this server."""
+    with _lock:
+        running = sum(1 for job in _active if not job.done())
+    return {"jobs": {"active": running, "workers": WORKERS if _pool is not None else 0}}
+
+
+# ------------------ Streamlit ------------------
+def progress_panel(job, key, extra=None, cancel_label="✖ Cancel"):
+    """Live progress bar with a Cancel button; reruns the page once ``job`` is done.
+
+    ``extra(info)`` draws more live output (from ``job.progress()``) under the bar.
+    """
+    import streamlit as st
+
+    @st.fragment(run_every=POLL)
+    def _panel():
+        if job.done():
+            st.rerun()
+        info = job.progress()
+        total = info.get("total")
+        text = f"{job.label}: {info['n']:,}" + (f" / {total:,}" if total else "")
+        if info.get("rate"):
+            text += f" · {info['rate']:,.0f}/s"
+        st.progress(info["fraction"], text=text)
+        if extra is not None:
+            extra(info)
+        if job.cancelled():
+            st.caption("Cancelling…")
+        elif st.button(cancel_label, key=f"{key}_cancel_{job.id}"):
+            job.cancel()
+
+    _panel()
+
+
+def cancel(state, key="job"):
+    """Cancel and forget the job under ``key`` (e.g. a newer request replaces it)."""
+    job = state.pop(key, None)
+    if job is not None:
+        job.cancel()
+
+
+def collect(state, key="job"):
+    """Pop a finished job from ``state`` -> ``(status, value)``.
+
+    ``status`` is ``"running"`` or ``"cancelled"`` (value is the job, e.g.
+    for its last ``progress()``), ``"done"`` (its result), ``"error"`` (the
+    exception), or ``None`` if there is no job.
+    """
+    job = state.get(key)
+    if job is None:
+        return None, None
+    if not job.done():
+        return "running", job
+    state.pop(key)
+    try:
+        return "done", job.result()
+    except Cancelled:
+        return "cancelled", job
+    except Exception as exc:
+        return "error", exc
@@ -0,0 +1,162 @@
+"""Game discovery.
+
+Scans ``Games/_NN_*`` packages and builds the registry app.py renders as
+cards. Metadata comes from the ``GAME`` dict in each package's ``__init__.py``
+and is read with ``ast`` so discovery never imports a game (or the heavy
+libraries it uses). The result is cached on disk keyed by file mtimes, which
+makes a warm start one ``stat`` per file.
+
+A package is registered when its ``main.py`` defines ``run()``; empty
+placeholders are skipped until they get an implementation.
+"""
+
+import ast
+import json
+import os
+import re
+
+from .paths import GAMES_DIR, cache_path
+
+MANIFEST_VERSION = 1
+PACKAGE_RE = re.compile(r"^_(\d{2})_(\w+)$")
+
+# Libraries worth warning about before a game is loaded.
+HEAVY_MODULES = {"matplotlib", "networkx", "numpy", "pandas", "PIL", "pyarrow",
+                 "streamlit_drawable_canvas"}
+
+
+# ------------------ STATIC INSPECTION ------------------
+def _parse(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+
+def read_metadata(init_path):
+    """Return the literal ``GAME = {...}`` dict from ``init_path`` (or {})."""
+    tree = _parse(init_path)
+    if tree is None:
+        return {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "GAME" for t in node.targets
+        ):
+            try:
+                return dict(ast.literal_eval(node.value))
+            except ValueError:
+                return {}
+    return {}
+
+
+def inspect_main(main_path):
+    """Return ``(has_run, heavy_deps)`` for a game's main.py without importing it."""
+    tree = _parse(main_path)
+    if tree is None:
+        return False, []
+
+    has_run = any(isinstance(node, ast.FunctionDef) and node.name == "run" for node in tree.body)
+    imported = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            imported.add(node.module.split(".")[0])
+    return has_run, sorted(imported & HEAVY_MODULES)
+
+
+def _default_name(slug):
+    return slug.replace("_", " ").title()
+
+
+def _package_files(package):
+    base = os.path.join(GAMES_DIR, package)
+    return os.path.join(base, "__init__.py"), os.path.join(base, "main.py")
+
+
+def build_entry(package):
+    """Inspect one package; returns a registry entry or None for placeholders."""
+    number, slug = PACKAGE_RE.match(package).groups()
+    init_path, main_path = _package_files(package)
+
+    has_run, heavy = inspect_main(main_path)
+    if not has_run:
+        return None
+
+    meta = read_metadata(init_path)
+    return {
+        "id": meta.get("id", slug.lower()),
+        "emoji": meta.get("emoji", "🎮"),
+        "name": meta.get("name", _default_name(slug)),
+        "desc": meta.get("desc", ""),
+        "module": f"Games.{package}.main",
+        "number": int(number),
+        "heavy": meta.get("heavy", heavy),
+    }
+
+
+# ------------------ CACHE KEY ------------------
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def scan_packages():
+    """Return ``{package: [init_stat, main_stat]}`` for every ``_NN_*`` dir."""
+    key = {}
+    for name in sorted(os.listdir(GAMES_DIR)):
+        if PACKAGE_RE.match(name) and os.path.isdir(os.path.join(GAMES_DIR, name)):
+            key[name] = [_stat_key(p) for p in _package_files(name)]
+    return key
+
+
+# ------------------ MANIFEST ------------------
+def _read_cache(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(path, data):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # a read-only checkout just rebuilds every time
+
+
+def load_manifest(cache_file=None):
+    """Return the list of registered games, rebuilding only what changed."""
+    cache_file = cache_file or cache_path("manifest.json")
+    key = scan_packages()
+
+    cached = _read_cache(cache_file)
+    if cached and cached.get("version") == MANIFEST_VERSION and cached.get("key") == key:
+        return cached["games"]
+
+    # Reuse entries whose files did not change; inspect the rest.
+    previous = {}
+    if cached and cached.get("version") == MANIFEST_VERSION:
+        old_key = cached.get("key", {})
+        previous = {p: e for p, e in cached.get("entries", {}).items()
+                    if old_key.get(p) == key.get(p)}
+
+    entries = {p: previous[p] if p in previous else build_entry(p) for p in key}
+    games = [e for e in entries.values() if e is not None]
+    games.sort(key=lambda e: e["number"])
+
+    _write_cache(cache_file, {
+        "version": MANIFEST_VERSION,
+        "key": key,
+        "entries": entries,
+        "games": games,
+    })
+    return games
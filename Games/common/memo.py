@@ -0,0 +1,183 @@
+"""Process-wide memoization for pure functions, shared by every session.
+
+``functools.lru_cache`` is unbounded in bytes and has no expiry or stats;
+``st.cache_data`` pickles every hit. ``memoize`` keeps results in one LRU
+per function, bounded by entry count and total (deep) size, with an
+optional TTL and an optional on-disk tier, so a popular input computed for
+one user is served from memory to the next:
+
+    @memoize("collatz.sequence", maxsize=512)
+    def collatz_sequence(n): ...
+
+    collatz_sequence.stats()   # hits, misses, disk_hits, entries, kb
+    collatz_sequence.clear()
+
+Values are shared between sessions, so memoized functions should return
+immutable values (tuples, strings, ints).
+
+Bounds can be tuned per deployment: ``ARCADE_LIMIT_MEMO_<NAME>`` (entries)
+and ``ARCADE_LIMIT_MEMO_MB`` (per-function size, default 16). The disk tier
+(pickles under ``.cache/memo/<name>/``) is on for functions declared with
+``disk=True`` when ``ARCADE_MEMO_DISK=1``.
+"""
+
+import functools
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from .images import content_key
+from .paths import cache_path
+from .state import limit, sizeof
+
+DISK = os.environ.get("ARCADE_MEMO_DISK", "") not in ("", "0")
+MAX_BYTES = limit("memo_mb", 16) * 1024 * 1024
+
+_registry = {}
+
+
+class Memo:
+    """LRU + TTL store behind one memoized function."""
+
+    def __init__(self, name, maxsize, max_bytes, ttl, disk):
+        self.name = name
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.disk = disk
+        self.items = OrderedDict()  # key -> (value, bytes, expires)
+        self.size = 0
+        self.hits = self.misses = self.disk_hits = self.evictions = 0
+        self._lock = threading.Lock()
+
+    # ------------------ Memory tier ------------------
+    def get(self, key):
+        with self._lock:
+            entry = self.items.get(key)
+            if entry is not None:
+                value, nbytes, expires = entry
+                if expires is None or expires > time.monotonic():
+                    self.items.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self.items[key]
+                self.size -= nbytes
+        if self.disk:
+            found, value = self._disk_get(key)
+            if found:
+                with self._lock:
+                    self.disk_hits += 1
+                self._store(key, value)
+                return True, value
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def put(self, key, value):
+        self._store(key, value)
+        if self.disk:
+            self._disk_put(key, value)
+
+    def _store(self, key, value):
+        nbytes = sizeof(value)
+        if nbytes > self.max_bytes:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            old = self.items.pop(key, None)
+            if old is not None:
+                self.size -= old[1]
+            self.items[key] = (value, nbytes, expires)
+            self.size += nbytes
+            while len(self.items) > self.maxsize or self.size > self.max_bytes:
+                _, (_, evicted, _) = self.items.popitem(last=False)
+                self.size -= evicted
+                self.evictions += 1
+
+    # ------------------ Disk tier ------------------
+    def _path(self, key):
+        return cache_path("memo", self.name, content_key(key) + ".pkl")
+
+    def _disk_get(self, key):
+        path = self._path(key)
+        try:
+            if self.ttl and time.time() - os.path.getmtime(path) > self.ttl:
+                os.remove(path)
+                return False, None
+            with open(path, "rb") as f:
+                stored_key, value = pickle.load(f)
+        except FileNotFoundError:
+            return False, None
+        except Exception:
+            # Truncated, corrupt or no longer unpicklable (a renamed class):
+            # drop the file and let the caller recompute.
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return False, None
+        return (True, value) if stored_key == key else (False, None)
+
+    def _disk_put(self, key, value):
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump((key, value), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    def clear(self):
+        with self._lock:
+            self.items.clear()
+            self.size = 0
+
+    def stats(self):
+        return {
+            "entries": len(self.items),
+            "kb": round(self.size / 1024, 1),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def memoize(name, maxsize=256, ttl=None, disk=False, max_bytes=None):
+    """Decorator: share ``func``'s results across sessions (see module docstring).
+
+    ``ttl`` is in seconds; arguments must be hashable.
+    """
+    memo = Memo(
+        name,
+        maxsize=limit("memo." + name, maxsize),
+        max_bytes=max_bytes or MAX_BYTES,
+        ttl=ttl,
+        disk=disk and DISK,
+    )
+    _registry[name] = memo
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            found, value = memo.get(key)
+            if not found:
+                value = func(*args, **kwargs)
+                memo.put(key, value)
+            return value
+
+        wrapper.memo = memo
+        wrapper.stats = memo.stats
+        wrapper.clear = memo.clear
+        return wrapper
+
+    return decorator
+
+
+def memo_collector():
+    """Profiling collector: hit/miss counts and size of every memoized function."""
+    return {"memo": {name: memo.stats() for name, memo in _registry.items()}}
@@ -0,0 +1,112 @@
+"""Per-session output files: content-addressed, streamed to disk, expired by TTL.
+
+Games that offer a generated file for download used to write it to one
+shared path (``outputs/bitmap_output.txt``), so concurrent sessions
+overwrote each other, and kept a second full copy in memory for the
+download button. ``artifact`` instead streams the file into this session's
+own directory under a name derived from the inputs that determine it:
+
+    path = outputs.artifact("bitmap_output.txt", ("bitmap.text", message, shape),
+                            lambda f: f.writelines(text_lines(message, shape)))
+    st.download_button("Download", data=Path(path).read_bytes, file_name="bitmap_output.txt")
+
+A repeated request with the same inputs finds the file and reuses it
+without rewriting. Files untouched for ``ARCADE_LIMIT_OUTPUTS_TTL`` seconds
+(default 3600) are deleted by a sweep that runs at most every few minutes.
+They live under ``.cache/outputs/<session>/``.
+"""
+
+import os
+import secrets
+import threading
+import time
+
+from .images import content_key
+from .paths import CACHE_DIR, cache_path
+from .state import limit
+
+ROOT = os.path.join(CACHE_DIR, "outputs")
+TTL = limit("outputs_ttl", 3600)  # seconds a file is kept after its last use
+SWEEP_EVERY = 300  # seconds between sweeps
+SESSION_KEY = "_outputs"
+
+_lock = threading.Lock()
+_last_sweep = {}  # root -> time of its last sweep
+_stats = {"written": 0, "reused": 0, "expired": 0}
+
+
+def session_dir():
+    """This session's directory name (random, so pinned seeds don't collide)."""
+    import streamlit as st
+
+    return st.session_state.setdefault(SESSION_KEY, secrets.token_hex(8))
+
+
+# ------------------ Files ------------------
+def artifact(name, key, write, binary=False, session=None):
+    """Path of output ``name`` for ``key``; ``write(f)`` streams it only if it doesn't exist yet.
+
+    ``key`` is a tuple of everything the content depends on. ``write`` gets
+    a file open for writing (text, UTF-8, unless ``binary``); a file that is
+    only half written is never visible under the final name.
+    """
+    sweep()
+    session = session or session_dir()
+    path = cache_path("outputs", session, f"{content_key(*key)}-{name}")
+    if os.path.exists(path):
+        os.utime(path)  # used again: keep it another TTL
+        with _lock:
+            _stats["reused"] += 1
+        return path
+
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") if binary else open(tmp, "w", encoding="utf-8") as f:
+            write(f)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    with _lock:
+        _stats["written"] += 1
+    return path
+
+
+def sweep(ttl=None, force=False, root=None):
+    """Delete files unused for ``ttl`` seconds, then idle empty session directories.
+
+    ``root`` defaults to the outputs; ``results.py`` sweeps its Parquet files too.
+    """
+    root = root or ROOT
+    now = time.time()
+    with _lock:
+        if not force and now - _last_sweep.get(root, 0.0) < SWEEP_EVERY:
+            return 0
+        _last_sweep[root] = now
+    ttl = TTL if ttl is None else ttl
+    removed = 0
+    for dirpath, _, files in os.walk(root, topdown=False):
+        for name in files:
+            path = os.path.join(dirpath, name)
+            try:
+                if now - os.path.getmtime(path) > ttl:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                pass  # already gone (another sweep, or a concurrent replace)
+        if dirpath != root:
+            try:
+                # Idle for a TTL too, so a session about to write isn't pulled from under it.
+                if now - os.path.getmtime(dirpath) > ttl:
+                    os.rmdir(dirpath)  # only succeeds once empty
+            except OSError:
+                pass
+    with _lock:
+        _stats["expired"] += removed
+    return removed
+
+
+def outputs_collector():
+    """Profiling collector: files written, reused and expired."""
+    with _lock:
+        return {"outputs": dict(_stats)}
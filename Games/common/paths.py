@@ -0,0 +1,15 @@
+import os
+
+# Repository layout, resolved once so helpers work from any working directory.
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+GAMES_DIR = os.path.join(ROOT, "Games")
+
+# Machine-local, disposable state (manifest cache, profiles, disk caches).
+CACHE_DIR = os.environ.get("ARCADE_CACHE_DIR", os.path.join(ROOT, ".cache"))
+
+
+def cache_path(*parts):
+    """Return a path under CACHE_DIR, creating its parent directory."""
+    path = os.path.join(CACHE_DIR, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
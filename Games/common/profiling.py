@@ -0,0 +1,242 @@
+"""Opt-in per-rerun profiling.
+
+A *recording* covers one script rerun (or one animation tick). While it is
+active, named *sections* accumulate wall time, call counts and, when
+``tracemalloc`` is tracing, allocation deltas. Finished recordings are kept
+for the timing panel and appended as JSON lines to ``.cache/profile.jsonl``
+for offline analysis.
+
+Outside a recording ``section``/``profiled`` cost one attribute lookup, so
+hot functions can stay instrumented permanently. Nothing here imports
+Streamlit at module level; the engines use it too.
+
+Enable with ``ARCADE_PROFILE=1`` (every session) or ``?profile=1`` in the
+URL (one session). ``ARCADE_PROFILE=alloc`` also turns on ``tracemalloc``,
+which is much slower; it slows the whole process, so only the server
+setting can ask for it, and tracing stops once no recording needs it. The
+log is rotated to ``profile.jsonl.1`` past ``ARCADE_LIMIT_PROFILE_LOG_MB``
+(default 16).
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+from .paths import cache_path
+from .state import limit
+
+ENABLED = os.environ.get("ARCADE_PROFILE", "") not in ("", "0")
+TRACE_ALLOC = os.environ.get("ARCADE_PROFILE", "") == "alloc"
+LOG_FILE = os.environ.get("ARCADE_PROFILE_LOG")
+LOG_MAX_BYTES = limit("profile_log_mb", 16) * 1024 * 1024
+
+# Session-state key app.py sets when profiling is on for that session.
+SESSION_FLAG = "_profile"
+
+_local = threading.local()
+_log_lock = threading.Lock()
+_trace_lock = threading.Lock()
+_tracers = 0  # recordings that need tracemalloc; tracing started here stops at 0
+_trace_owned = False
+_collectors = []
+
+
+def current():
+    """The active recording on this thread, or None."""
+    return getattr(_local, "record", None)
+
+
+def _allocated():
+    return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+
+
+class Recording:
+    def __init__(self, label, meta):
+        self.label = label
+        self.meta = meta
+        self.sections = {}
+        self.started = time.time()
+        self._t0 = time.perf_counter()
+        self._m0 = _allocated()
+        self.wall_ms = None
+        self.alloc_kb = None
+        self.extra = {}
+
+    def add(self, name, ms, alloc):
+        stats = self.sections.setdefault(name, {"calls": 0, "ms": 0.0, "alloc_kb": 0.0})
+        stats["calls"] += 1
+        stats["ms"] += ms
+        if alloc is not None:
+            stats["alloc_kb"] += alloc / 1024
+
+    def finish(self):
+        self.wall_ms = (time.perf_counter() - self._t0) * 1000
+        end = _allocated()
+        if end is not None and self._m0 is not None:
+            self.alloc_kb = (end - self._m0) / 1024
+        for collect in _collectors:
+            self.extra.update(collect() or {})
+
+    def to_dict(self):
+        return {
+            "ts": round(self.started, 3),
+            "label": self.label,
+            **self.meta,
+            "wall_ms": round(self.wall_ms or 0.0, 3),
+            "alloc_kb": None if self.alloc_kb is None else round(self.alloc_kb, 1),
+            "sections": {
+                name: {"calls": s["calls"], "ms": round(s["ms"], 3), "alloc_kb": round(s["alloc_kb"], 1)}
+                for name, s in self.sections.items()
+            },
+            **self.extra,
+        }
+
+
+class section:
+    """``with section("name"):`` times a block inside the active recording."""
+
+    __slots__ = ("name", "record", "t0", "m0")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.record = current()
+        if self.record is not None:
+            self.m0 = _allocated()
+            self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self.record is not None:
+            ms = (time.perf_counter() - self.t0) * 1000
+            m1 = _allocated()
+            alloc = m1 - self.m0 if m1 is not None and self.m0 is not None else None
+            self.record.add(self.name, ms, alloc)
+        return False
+
+
+def profiled(name):
+    """Decorator form of ``section``."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if current() is None:
+                return func(*args, **kwargs)
+            with section(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class recording:
+    """Start a recording for the current rerun/tick (a section if one is active).
+
+    ``enabled`` defaults to ``ENABLED``; ``trace_alloc`` (default
+    ``TRACE_ALLOC``) runs tracemalloc for the recording's duration. The
+    finished ``Recording`` is available as ``.result`` after the block and
+    is appended to the JSONL log.
+    """
+
+    def __init__(self, label, enabled=None, trace_alloc=None, log=True, **meta):
+        self.label = label
+        self.enabled = ENABLED if enabled is None else enabled
+        self.trace_alloc = TRACE_ALLOC if trace_alloc is None else trace_alloc
+        self.log = log
+        self.meta = meta
+        self.result = None
+        self._nested = None
+
+    def __enter__(self):
+        if not self.enabled:
+            return self
+        if current() is not None:
+            self._nested = section(self.label)
+            self._nested.__enter__()
+            return self
+        if self.trace_alloc:
+            _start_tracing()
+        _local.record = Recording(self.label, self.meta)
+        return self
+
+    def __exit__(self, *exc):
+        if self._nested is not None:
+            return self._nested.__exit__(*exc)
+        record = current()
+        if not self.enabled or record is None:
+            return False
+        _local.record = None
+        try:
+            record.finish()
+        finally:
+            if self.trace_alloc:
+                _stop_tracing()
+        self.result = record
+        if self.log:
+            append_log(record.to_dict())
+        return False
+
+
+def _start_tracing():
+    global _tracers, _trace_owned
+    with _trace_lock:
+        if _tracers == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _trace_owned = True
+        _tracers += 1
+
+
+def _stop_tracing():
+    global _tracers, _trace_owned
+    with _trace_lock:
+        _tracers -= 1
+        if _tracers == 0 and _trace_owned:
+            tracemalloc.stop()
+            _trace_owned = False
+
+
+def add_collector(func):
+    """Register ``func() -> dict`` whose output is merged into every record."""
+    if func not in _collectors:
+        _collectors.append(func)
+    return func
+
+
+def append_log(entry, path=None):
+    path = path or LOG_FILE or cache_path("profile.jsonl")
+    line = json.dumps(entry, ensure_ascii=False)
+    with _log_lock:
+        try:
+            if os.path.exists(path) and os.path.getsize(path) > LOG_MAX_BYTES:
+                os.replace(path, path + ".1")  # keep one old file, drop the one before
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError:
+            pass
+
+
+# ------------------ UI ------------------
+def render_panel(record):
+    """Collapsible timing table for a finished recording."""
+    import streamlit as st
+
+    if record is None:
+        return
+    data = record.to_dict()
+    with st.expander(f"⏱ Timing — {data['wall_ms']:.1f} ms", expanded=False):
+        rows = [
+            {"section": name, "calls": s["calls"], "total ms": s["ms"],
+             "ms / call": round(s["ms"] / s["calls"], 3), "alloc KB": s["alloc_kb"]}
+            for name, s in sorted(data["sections"].items(), key=lambda kv: -kv[1]["ms"])
+        ]
+        if rows:
+            st.table(rows)
+        else:
+            st.caption("No instrumented sections ran.")
+        extra = {k: v for k, v in data.items()
+                 if k not in ("ts", "label", "wall_ms", "sections") and k not in record.meta}
+        if extra:
+            st.json(extra, expanded=False)
@@ -0,0 +1,156 @@
+"""Columnar results sink: simulation output streamed to Parquet in chunks.
+
+The simulations used to hand results back as text (Collatz TXT/CSV) or keep
+them in session state, which caps a run at what fits in memory and pays
+CSV formatting per value. A ``ResultSink`` buffers rows column-wise, turns
+every ``chunk_rows`` of them into an Arrow record batch and appends it to a
+Parquet file as a row group, so a million-trial run never holds more than
+one chunk:
+
+    with ResultSink("birthday.trials") as sink:
+        sink.write(group_size=23, trial=range(n), matched=matched_array)
+    sink.path  # .cache/results/birthday.trials-<timestamp>-<random>.parquet
+
+Each kind of output has one fixed schema in ``schemas()``; ``write`` takes
+scalars (broadcast) or equal-length columns (lists or NumPy arrays).
+Pass ``path=io.BytesIO()`` (or any file object) to build a download in
+memory instead of on disk. Files under ``.cache/results`` untouched for
+``ARCADE_LIMIT_RESULTS_TTL`` seconds (default a day) are swept when new ones
+are created.
+"""
+
+import functools
+import io
+import os
+import secrets
+import time
+
+from . import outputs
+from .paths import CACHE_DIR, cache_path
+from .state import limit
+
+RESULTS_DIR = os.path.join(CACHE_DIR, "results")
+TTL = limit("results_ttl", 24 * 3600)  # seconds a results file is kept after its last write
+
+
+@functools.lru_cache(maxsize=None)
+def schemas():
+    """Output kind -> Arrow schema (built on first use; pyarrow is imported lazily)."""
+    import pyarrow as pa
+
+    return {
+        # One row per simulated group (hash-sizing groups can be large).
+        "birthday.trials": pa.schema([
+            ("group_size", pa.int32()),
+            ("trial", pa.int64()),
+            ("matched", pa.bool_()),
+            ("distinct_days", pa.int32()),
+        ]),
+        # One row per timestep of a Forest Fire run.
+        "forest.steps": pa.schema([
+            ("step", pa.int64()),
+            ("tree", pa.int32()),
+            ("fire", pa.int32()),
+            ("ash", pa.int32()),
+            ("empty", pa.int32()),
+        ]),
+        # One row per value of a Collatz sequence.
+        "collatz.values": pa.schema([
+            ("start", pa.int64()),
+            ("step", pa.int32()),
+            ("value", pa.int64()),
+        ]),
+    }
+
+
+def default_path(name):
+    """A fresh file per sink: the random part keeps runs in the same second apart."""
+    outputs.sweep(TTL, root=RESULTS_DIR)
+    stamp = time.strftime('%Y%m%d-%H%M%S')
+    return cache_path("results", f"{name}-{stamp}-{secrets.token_hex(4)}.parquet")
+
+
+# ------------------ Sink ------------------
+class ResultSink:
+    """Append rows of ``schemas()[name]``; flushed to Parquet every ``chunk_rows``."""
+
+    def __init__(self, name, path=None, chunk_rows=65536, compression="zstd"):
+        import pyarrow.parquet as pq
+
+        self.name = name
+        self.schema = schemas()[name]
+        self.path = path or default_path(name)
+        self.chunk_rows = chunk_rows
+        self.rows = 0
+        self.batches = 0
+        self._columns = {field.name: [] for field in self.schema}
+        self._pending = 0
+        self._writer = pq.ParquetWriter(self.path, self.schema, compression=compression)
+
+    def write(self, **columns):
+        """Append rows; scalars are repeated to the length of the array columns."""
+        lengths = {len(v) for v in columns.values() if not _is_scalar(v)}
+        if len(lengths) > 1:
+            raise ValueError(f"{self.name}: columns have different lengths {sorted(lengths)}")
+        n = lengths.pop() if lengths else 1
+        missing = self._columns.keys() - columns.keys()
+        if missing:
+            raise ValueError(f"{self.name}: missing columns {sorted(missing)}")
+        for key, buffer in self._columns.items():
+            value = columns[key]
+            buffer.append([value] * n if _is_scalar(value) else value)
+        self._pending += n
+        if self._pending >= self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        """Write what is buffered as one record batch (one Parquet row group)."""
+        import numpy as np
+        import pyarrow as pa
+
+        if not self._pending:
+            return
+        arrays = [
+            pa.array(np.concatenate([np.asarray(part) for part in parts]), type=field.type)
+            for field, parts in zip(self.schema, self._columns.values())
+        ]
+        self._writer.write_batch(pa.record_batch(arrays, schema=self.schema))
+        self.rows += self._pending
+        self.batches += 1
+        self._pending = 0
+        for parts in self._columns.values():
+            parts.clear()
+
+    def close(self):
+        if self._writer is not None:
+            self.flush()
+            self._writer.close()
+            self._writer = None
+        return self.path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def _is_scalar(value):
+    return not hasattr(value, "__len__") or isinstance(value, (str, bytes))
+
+
+# ------------------ Helpers ------------------
+def to_parquet_bytes(name, **columns):
+    """A small table of ``schemas()[name]`` as Parquet bytes, e.g. for a download."""
+    buffer = io.BytesIO()
+    with ResultSink(name, path=buffer) as sink:
+        sink.write(**columns)
+    return buffer.getvalue()
+
+
+def read(path, columns=None):
+    """Load a results file back as a pandas DataFrame (for offline analysis)."""
+    import pyarrow.parquet as pq
+
+    return pq.read_table(path, columns=columns).to_pandas()
@@ -0,0 +1,119 @@
+"""Seedable random numbers shared by the games.
+
+``Rng`` is a ``random.Random`` (so ``rng.random()``, ``rng.choice()``,
+``rng.shuffle()`` keep working) with a NumPy ``Generator`` attached for bulk
+draws: one call returns a whole array of floats, ints or choices instead of
+one Python call per cell. Both streams are derived from one seed, so a game
+run replays bit-for-bit from that seed given the same inputs.
+
+Each session gets one seed (``?seed=123`` in the URL or ``ARCADE_SEED``
+pins it, otherwise it is random) and each game draws from its own ``Rng``
+derived from that seed, so games don't perturb each other's streams.
+"""
+
+import hashlib
+import os
+import random
+import secrets
+
+
+def derive_seed(*parts):
+    """A stable 63-bit seed from any mix of ints/strings (unlike ``hash``)."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") >> 1
+
+
+class Rng(random.Random):
+    """``random.Random`` plus NumPy-backed bulk draws from the same seed."""
+
+    def __init__(self, seed=None):
+        self._np = None
+        super().__init__(seed)
+
+    def seed(self, a=None, version=2):
+        if a is None:
+            a = secrets.randbits(63)
+        self.seed_value = a
+        self._np = None
+        super().seed(a, version)
+
+    @property
+    def np(self):
+        """The ``numpy.random.Generator`` for this seed (NumPy imported on first use)."""
+        if self._np is None:
+            import numpy as np
+
+            seed = self.seed_value
+            if not isinstance(seed, int) or seed < 0:
+                seed = derive_seed(seed)
+            self._np = np.random.default_rng(seed)
+        return self._np
+
+    # ------------------ Bulk draws ------------------
+    def floats(self, size):
+        """Uniform floats in ``[0, 1)`` (an array of shape ``size``)."""
+        return self.np.random(size)
+
+    def integers(self, low, high, size):
+        """Ints in ``[low, high)``; note ``high`` is exclusive, unlike ``randint``."""
+        return self.np.integers(low, high, size)
+
+    def choices_array(self, options, size):
+        """Uniform picks from ``options`` (an array of shape ``size``)."""
+        return self.np.choice(options, size)
+
+    def permutations(self, n, rows):
+        """``rows`` independent shuffles of ``range(n)``, one per row."""
+        import numpy as np
+
+        return self.np.permuted(np.tile(np.arange(n), (rows, 1)), axis=1)
+
+    # ------------------ Snapshots ------------------
+    def getstate(self):
+        np_state = self._np.bit_generator.state if self._np is not None else None
+        return self.seed_value, super().getstate(), np_state
+
+    def setstate(self, state):
+        self.seed_value, py_state, np_state = state
+        super().setstate(py_state)
+        self._np = None
+        if np_state is not None:
+            self.np.bit_generator.state = np_state
+
+    def __reduce__(self):
+        return self.__class__, (self.seed_value,), self.getstate()
+
+
+# ------------------ Sessions ------------------
+SEED_KEY = "_seed"
+RNGS_KEY = "_rngs"
+
+
+def session_seed():
+    """This session's seed: ``?seed=`` in the URL, then ``ARCADE_SEED``, else random."""
+    import streamlit as st
+
+    requested = st.query_params.get("seed") or os.environ.get("ARCADE_SEED")
+    if requested is not None and str(requested) != str(st.session_state.get(SEED_KEY)):
+        # A new pinned seed starts every game's stream over.
+        st.session_state[SEED_KEY] = int(requested) if str(requested).isdigit() else requested
+        st.session_state.pop(RNGS_KEY, None)
+    if SEED_KEY not in st.session_state:
+        st.session_state[SEED_KEY] = secrets.randbits(32)
+    return st.session_state[SEED_KEY]
+
+
+def session_rng(namespace):
+    """The ``Rng`` game ``namespace`` uses in this session."""
+    import streamlit as st
+
+    seed = session_seed()
+    rngs = st.session_state.setdefault(RNGS_KEY, {})
+    if namespace not in rngs:
+        rngs[namespace] = Rng(derive_seed(seed, namespace))
+    return rngs[namespace]
+
+
+def seed_collector():
+    """Profiling collector: the seed that replays this session."""
+    return {"seed": session_seed()}
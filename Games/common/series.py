@@ -0,0 +1,136 @@
+"""Series reduction and table paging for charts that can get long.
+
+A Collatz run from a large start or a Fibonacci timeline to a large N has
+thousands of points; shipping every one to the browser (or asking
+matplotlib to draw a tick per term) costs far more than the picture shows.
+``downsample`` caps a series at ``max_points`` while keeping its shape:
+
+- ``"lttb"`` (Largest-Triangle-Three-Buckets) keeps, per bucket, the point
+  that spans the largest triangle with its neighbours, i.e. the visually
+  significant one;
+- ``"minmax"`` keeps each bucket's minimum and maximum, so no spike is lost.
+
+Either way the first, last, global max and global min points are always
+kept. ``paginate`` shows one page of a table and ``download_full`` offers
+the whole thing as a CSV generated only when the button is clicked.
+
+The default cap is ``ARCADE_LIMIT_CHART_POINTS`` (default 1000).
+"""
+
+import math
+
+from .state import limit
+
+MAX_POINTS = limit("chart_points", 1000)
+PAGE_SIZE = limit("table_page", 100)
+
+
+# ------------------ Reduction ------------------
+def _floats(values):
+    import numpy as np
+
+    try:
+        return np.asarray(values, dtype=float)
+    except OverflowError:
+        return None  # ints beyond float range; callers fall back to striding
+
+
+def lttb_indices(y, threshold):
+    """Indices of the ``threshold`` points LTTB keeps (x is the index)."""
+    import numpy as np
+
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    # Triangle areas multiply two values; scale so huge series can't overflow.
+    y = y / (np.abs(y).max() or 1.0)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    keep = [0]
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) is the third vertex.
+        nxt_end = edges[i + 2] if i + 2 < len(edges) else n
+        nxt = slice(end, max(nxt_end, end + 1))
+        cx = (nxt.start + nxt.stop - 1) / 2
+        cy = y[nxt].mean()
+        xs = np.arange(start, end)
+        area = np.abs((a - cx) * (y[start:end] - y[a]) - (a - xs) * (cy - y[a]))
+        a = int(start + area.argmax())
+        keep.append(a)
+    keep.append(n - 1)
+    return keep
+
+
+def minmax_indices(y, threshold):
+    """Indices of each bucket's min and max, about ``threshold`` points in all."""
+    import numpy as np
+
+    n = len(y)
+    buckets = max(1, threshold // 2)
+    if n <= threshold:
+        return list(range(n))
+    keep = {0, n - 1}
+    for chunk in np.array_split(np.arange(n), buckets):
+        values = y[chunk]
+        keep.add(int(chunk[values.argmin()]))
+        keep.add(int(chunk[values.argmax()]))
+    return sorted(keep)
+
+
+def downsample(y, x=None, max_points=None, method="lttb"):
+    """``(x, y)`` lists with at most about ``max_points`` points, peaks kept.
+
+    ``x`` defaults to the position in ``y``; the returned values are the
+    original objects (Python ints stay exact).
+    """
+    max_points = max_points or MAX_POINTS
+    y = list(y)
+    x = list(range(len(y))) if x is None else list(x)
+    if len(y) <= max_points:
+        return x, y
+
+    values = _floats(y)
+    if values is None:
+        step = math.ceil(len(y) / max_points)
+        keep = sorted(set(range(0, len(y), step)) | {len(y) - 1})
+    else:
+        pick = lttb_indices if method == "lttb" else minmax_indices
+        keep = set(pick(values, max_points))
+        keep.update((int(values.argmax()), int(values.argmin())))
+        keep = sorted(keep)
+    return [x[i] for i in keep], [y[i] for i in keep]
+
+
+# ------------------ Tables ------------------
+def paginate(df, key, page_size=None, style=None, **dataframe_kwargs):
+    """Show one page of ``df`` with a page picker; returns the page's frame.
+
+    ``style(page) -> Styler`` styles just the visible rows.
+    """
+    import streamlit as st
+
+    page_size = page_size or PAGE_SIZE
+    pages = max(1, math.ceil(len(df) / page_size))
+    page = 1
+    if pages > 1:
+        page = st.number_input(f"Page (of {pages})", 1, pages, 1, key=f"{key}_page")
+    view = df.iloc[(page - 1) * page_size: page * page_size]
+    st.dataframe(style(view) if style else view, **dataframe_kwargs)
+    if pages > 1:
+        st.caption(f"Rows {(page - 1) * page_size + 1}–{min(page * page_size, len(df))} of {len(df)}")
+    return view
+
+
+def download_full(label, make_df, file_name, key=None):
+    """Download button for the whole table; the CSV is built only on click."""
+    import streamlit as st
+
+    st.download_button(
+        label,
+        data=lambda: make_df().to_csv(index=False),
+        file_name=file_name,
+        mime="text/csv",
+        key=key,
+    )
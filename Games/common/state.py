@@ -0,0 +1,140 @@
+"""Namespaced session state, size accounting and capped histories.
+
+Every game used to write bare keys (``running``, ``board``, ``history``...)
+straight into ``st.session_state``, so two games could clobber each other
+and nothing bounded what a long-lived session kept around. Games now keep
+their state in one dict per game (``game_state("flooder", ...)``), growing
+structures are capped (``limit``, ``History``, ``trim``), and
+``session_report`` measures what each key actually costs.
+
+Caps can be tuned per deployment with ``ARCADE_LIMIT_<NAME>`` environment
+variables, e.g. ``ARCADE_LIMIT_FLOODER_HISTORY=10``.
+"""
+
+import os
+import pickle
+import sys
+import zlib
+from collections import deque
+
+PREFIX = "game:"
+
+
+# ------------------ Namespaces ------------------
+def game_state(namespace, **defaults):
+    """The state dict of ``namespace``, with missing keys filled from ``defaults``.
+
+    A callable default is a factory (``history=list``) and is only called
+    when the key is missing.
+    """
+    import streamlit as st
+
+    state = st.session_state.setdefault(PREFIX + namespace, {})
+    for key, default in defaults.items():
+        if key not in state:
+            state[key] = default() if callable(default) else default
+    return state
+
+
+def limit(name, default):
+    """Cap called ``name`` (``"flooder.history"``), overridable from the environment."""
+    env = "ARCADE_LIMIT_" + name.upper().replace(".", "_")
+    try:
+        return max(1, int(os.environ[env]))
+    except (KeyError, ValueError):
+        return default
+
+
+# ------------------ Eviction ------------------
+def trim(items, cap):
+    """Drop the oldest entries of list ``items`` so at most ``cap`` remain."""
+    excess = len(items) - cap
+    if excess > 0:
+        del items[:excess]
+    return items
+
+
+def pack(obj):
+    return zlib.compress(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL), 1)
+
+
+def unpack(blob):
+    return pickle.loads(zlib.decompress(blob))
+
+
+class History:
+    """Bounded undo stack; the oldest entry is dropped once ``cap`` is reached.
+
+    With ``compress=True`` entries are stored pickled and zlib-compressed,
+    which suits whole-board snapshots: they are written on every move but
+    only read back on undo.
+    """
+
+    def __init__(self, cap, compress=False):
+        self.compress = compress
+        self.items = deque(maxlen=cap)
+
+    def push(self, item):
+        self.items.append(pack(item) if self.compress else item)
+
+    def pop(self):
+        item = self.items.pop()
+        return unpack(item) if self.compress else item
+
+    def clear(self):
+        self.items.clear()
+
+    def __len__(self):
+        return len(self.items)
+
+
+# ------------------ Accounting ------------------
+def sizeof(obj, _seen=None):
+    """Approximate deep size of ``obj`` in bytes (containers, arrays, images)."""
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(sizeof(k, seen) + sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(sizeof(item, seen) for item in obj)
+    elif hasattr(obj, "nbytes"):                          # numpy arrays
+        size += int(obj.nbytes)
+    elif hasattr(obj, "getbands") and hasattr(obj, "size"):  # PIL images
+        width, height = obj.size
+        size += width * height * len(obj.getbands())
+    elif hasattr(obj, "__dict__"):
+        size += sizeof(vars(obj), seen)
+    return size
+
+
+def session_report(session=None):
+    """``[(key, bytes), ...]`` for every session key, largest first.
+
+    Namespaced game state is broken down one level (``game:flooder.history``).
+    """
+    if session is None:
+        import streamlit as st
+        session = st.session_state
+
+    rows = []
+    for key in list(session.keys()):
+        value = session[key]
+        if str(key).startswith(PREFIX) and isinstance(value, dict):
+            rows.extend((f"{key}.{sub}", sizeof(item)) for sub, item in value.items())
+        else:
+            rows.append((str(key), sizeof(value)))
+    rows.sort(key=lambda row: -row[1])
+    return rows
+
+
+def memory_collector(top=10):
+    """Profiling collector: total session size and the biggest keys, in KB."""
+    rows = session_report()
+    return {
+        "session_kb": round(sum(size for _, size in rows) / 1024, 1),
+        "session_top_kb": {key: round(size / 1024, 1) for key, size in rows[:top]},
+    }
@@ -0,0 +1,70 @@
+"""Text-grid rendering with row buffers and a dirty-row cache.
+
+Several games draw their board as one big string every frame. Built by
+``+=`` per cell that is quadratic-ish and allocates a new string per cell;
+``TextGrid`` instead maps each row through a precomputed cell -> glyph
+lookup, joins it once, and remembers the joined line. On the next frame a
+row whose cells (and overlay marks) are unchanged reuses its line, so a
+mostly static board costs one tuple comparison per row.
+
+    view = TextGrid(["⬜", "⬛"])              # cell value -> glyph
+    text = view.render(grid, {(x, y): "🐜"})  # overlay wins over the cell
+
+``glyphs`` can be a list/tuple (int cells), a dict, or ``None`` when the
+cells already are glyphs. In that last case rows are joined directly: a
+join of ready-made glyphs costs no more than the comparison the cache would
+need, so only rows carrying overlay marks go through the cache. Keep one
+``TextGrid`` per session and board.
+"""
+
+
+class TextGrid:
+    def __init__(self, glyphs=None, sep="\n"):
+        self.lookup = None if glyphs is None else glyphs.__getitem__
+        self.sep = sep
+        self.keys = []
+        self.lines = []
+        self.hits = 0
+        self.misses = 0
+
+    def _line(self, row, marks):
+        cells = list(row) if self.lookup is None else list(map(self.lookup, row))
+        if marks:
+            for x, glyph in marks:
+                cells[x] = glyph
+        return "".join(cells)
+
+    def render(self, rows, overlay=None):
+        """Text for ``rows`` (a sequence of rows of cells) plus ``{(x, y): glyph}`` marks."""
+        if self.lookup is None and not overlay:
+            return self.sep.join(map("".join, rows))
+
+        marks_by_row = {}
+        if overlay:
+            for (x, y), glyph in overlay.items():
+                marks_by_row.setdefault(y, []).append((x, glyph))
+
+        keys, lines = self.keys, self.lines
+        if len(keys) != len(rows):
+            keys[:] = [None] * len(rows)
+            lines[:] = [None] * len(rows)
+
+        for y, row in enumerate(rows):
+            marks = marks_by_row.get(y)
+            if self.lookup is None and not marks:
+                lines[y] = "".join(row)
+                keys[y] = None
+                continue
+            key = (tuple(row), tuple(sorted(marks)) if marks else None)
+            if keys[y] == key:
+                self.hits += 1
+                continue
+            self.misses += 1
+            keys[y] = key
+            lines[y] = self._line(row, marks)
+
+        return self.sep.join(lines)
+
+    def clear(self):
+        self.keys = []
+        self.lines = []
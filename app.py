@@ -1,43 +1,17 @@
+import importlib
+
 import streamlit as st
 
+from Games.common import charts, images, jobs, memo, outputs, profiling, rng, state
+from Games.common.manifest import load_manifest
+
 # -----------------------
-# 🎮 GAME IMPORTS
-# -----------------------
-from Games._01_Bagels import main as bagels
-from Games._02_Birthday_Paradox import main as bdayParadox
-from Games._03_BitMap_Message import main as bitmapMessage
-from Games._04_BlackJack import main as blackJack
-from Games._05_Bouncing_DVD_logo import main as bouncingDVD
-from Games._06_Caesar_Cipher import main as caeserCipher
-from Games._07_Calendar_Maker import main as calendarMaker
-from Games._08_Carrot_Bluff import main as carrotBluff
-from Games._09_Cho_Han import main as choHan
-from Games._10_Clickbait_Headline_Gen import main as headlinesGen
-from Games._11_Calletz_Sequence import main as collatz
-from Games._13_CountDown import main as countDown
-from Games._15_Diamond import main as diamondGen
-from Games._16_Dice_math import main as mathQuiz
-from Games._17_Dice_Roller import main as diceRoll
-from Games._18_Digital_stream import main as digStream
-from Games._19_DNA_visualization import main as dnaVis
-from Games._20_Ducklings import main as ducklings
-from Games._22_Factor_Finder import main as factorFinder
-from Games._23_Fast_Draw import main as fastDraw
-from Games._24_Fibonacci import main as fibonacci
-from Games._25_Fish_Tank import main as fishTank
-from Games._26_Flooder import main as flooder
-from Games._27_Forest_SIre_SIm import main as forestFire
-from Games._28_Four_in_a_row import main as fourInaRow
-from Games._29_Guess_Number import main as guessNum
-from Games._30_Gullible import main as gullible
-from Games._31_Hacking_Minigame import main as hacking
-from Games._32_Hangman_Guillotine import main as hangman
-from Games._33_HexGrid import main as hexgrid
-from Games._34_HourGlass import main as hourglass
-from Games._35_Hungry_Robots import main as robots
-from Games._36_Pig_Latin import main as pigLatin
-from Games._37_JAccuse import main as jaccuse
-from Games._38_Langtons_Ant import main as langtonsAnt
+# 🎮 GAME LOADING
+# -----------------------
+@st.cache_resource(show_spinner=False)
+def load_game_module(module_path):
+    """Import a game module on first use; the module is cached for the process."""
+    return importlib.import_module(module_path)
 
 
 # -----------------------
@@ -56,46 +30,29 @@ if "active_game" not in st.session_state:
     st.session_state.active_game = None
 
 
+# -----------------------
+# ⏱ PROFILING (opt-in: ARCADE_PROFILE=1 or ?profile=1; allocation tracing only
+# with ARCADE_PROFILE=alloc, since tracemalloc slows the whole process)
+# Random streams replay from ?seed=N (the seed is listed in the timing panel).
+# -----------------------
+default_mode = "1" if profiling.ENABLED else ""
+profile_mode = st.query_params.get("profile", default_mode)
+st.session_state[profiling.SESSION_FLAG] = profile_mode not in ("", "0")
+# Profiled reruns also report what this session keeps in memory, per key.
+profiling.add_collector(state.memory_collector)
+profiling.add_collector(rng.seed_collector)
+profiling.add_collector(images.cache_collector)
+profiling.add_collector(charts.chart_collector)
+profiling.add_collector(jobs.jobs_collector)
+profiling.add_collector(memo.memo_collector)
+profiling.add_collector(outputs.outputs_collector)
+
+
 # -----------------------
 # 🎯 GAME REGISTRY
 # -----------------------
-GAMES = [
-    {"id": "bagels", "emoji": "🎲", "name": "Bagels", "desc": "Guess the secret number", "run": bagels.run},
-    {"id": "birthday", "emoji": "🎂", "name": "Birthday Paradox", "desc": "Probability simulation", "run": bdayParadox.run},
-    {"id": "bitmap", "emoji": "🗺️", "name": "Bitmap Message", "desc": "Text art generator", "run": bitmapMessage.run},
-    {"id": "blackjack", "emoji": "🃏", "name": "BlackJack", "desc": "Classic 21 card game", "run": blackJack.run},
-    {"id": "dvd", "emoji": "💿", "name": "Bouncing DVD Logo", "desc": "Retro animation", "run": bouncingDVD.run},
-    {"id": "caesar", "emoji": "🔑", "name": "Caesar Cipher", "desc": "Encrypt and decrypt messages", "run": caeserCipher.run},
-    {"id": "calendar", "emoji": "📅", "name": "Calendar Maker", "desc": "Build calendars & notes", "run": calendarMaker.run},
-    {"id": "carrot", "emoji": "🥕", "name": "Carrot Bluff", "desc": "Funny bluffing game", "run": carrotBluff.run},
-    {"id": "chohan", "emoji": "🎲", "name": "Cho Han", "desc": "Dice gambling game", "run": choHan.run},
-    {"id": "clickbait", "emoji": "📢", "name": "Clickbait Headlines", "desc": "Generate viral headlines", "run": headlinesGen.run},
-    {"id": "collatz", "emoji": "🔢", "name": "Collatz Sequence", "desc": "Explore 3n + 1", "run": collatz.run},
-    {"id": "countdown", "emoji": "⏱️", "name": "Countdown Timer", "desc": "Track productivity", "run": countDown.run},
-    {"id": "diamond", "emoji": "💎", "name": "Animated Diamonds", "desc": "Rotating diamond art", "run": diamondGen.run},
-    {"id": "dice_math", "emoji": "🎲", "name": "Dice Math", "desc": "Dice sum quiz", "run": mathQuiz.run},
-    {"id": "dice_roll", "emoji": "🐉", "name": "Dice Roller", "desc": "DnD style roller", "run": diceRoll.run},
-    {"id": "matrix", "emoji": "💻", "name": "Matrix Rain", "desc": "Hacker animation", "run": digStream.run},
-    {"id": "dna", "emoji": "🧬", "name": "DNA Visualization", "desc": "Visualize DNA strands", "run": dnaVis.run},
-    {"id": "ducklings", "emoji": "🐥", "name": "Ducklings", "desc": "Cute terminal animation", "run": ducklings.run},
-    {"id": "fibonacci", "emoji": "🌀", "name": "Fibonacci", "desc": "Sequence generator", "run": fibonacci.run},
-    {"id": "fastdraw", "emoji": "🤠", "name": "Fast Draw", "desc": "Test your reflexes", "run": fastDraw.run},
-    {"id": "factor", "emoji": "🔢", "name": "Factor Finder", "desc": "Analyze numbers", "run": factorFinder.run},
-    {"id": "fish", "emoji": "🐟", "name": "Fish Tank", "desc": "Aquarium simulation", "run": fishTank.run},
-    {"id": "flooder", "emoji": "🎨", "name": "Flooder", "desc": "Color puzzle game", "run": flooder.run},
-    {"id": "forest", "emoji": "🌲🔥", "name": "Forest Fire", "desc": "Fire spread simulation", "run": forestFire.run},
-    {"id": "fourinarow", "emoji": "🎮", "name": "Four in a Row", "desc": "Connect four game", "run": fourInaRow.run},
-    {"id": "guess", "emoji": "📱", "name": "Guess Number", "desc": "Find the secret number", "run": guessNum.run},
-    {"id": "gullible", "emoji": "😄", "name": "Gullible", "desc": "Prank game", "run": gullible.run},
-    {"id": "hacking", "emoji": "🖥️", "name": "Hacking Minigame", "desc": "Crack the code", "run": hacking.run},
-    {"id": "hangman", "emoji": "🪓", "name": "Hangman Guillotine", "desc": "Guess before doom", "run": hangman.run},
-    {"id": "hexgrid", "emoji": "✏️", "name": "HexGrid", "desc": "Carpet design", "run": hexgrid.run},
-    {"id": "hourglass", "emoji": "⏳", "name": "Hourglass", "desc": "Time visualization", "run": hourglass.run},
-    {"id": "robots", "emoji": "🤖", "name": "Hungry Robots", "desc": "Robot eats robot", "run": robots.run},
-    {"id": "piglatin", "emoji": "🐷", "name": "Pig Latin", "desc": "Language fun", "run": pigLatin.run},
-    {"id": "jaccuse", "emoji": "🕵️", "name": "J’ACCUSE!", "desc": "Mystery deduction game", "run": jaccuse.run},
-    {"id": "langton", "emoji": "🐜", "name": "Langton’s Ant", "desc": "Emergent behavior", "run": langtonsAnt.run},
-]
+# Discovered from Games/_NN_*/__init__.py; see Games/common/manifest.py.
+GAMES = load_manifest()
 
 
 # -----------------------
@@ -150,7 +107,7 @@ def home_page():
                 """,
                 unsafe_allow_html=True
             )
-            if st.button(f"▶ Play", key=game["id"]):
+            if st.button(f"▶ Play", key=f"play_{game['id']}"):
                 st.session_state.active_game = game
                 st.rerun()
 
@@ -161,7 +118,11 @@ def home_page():
 def game_page(game):
     st.button("⬅ Back to Home", on_click=lambda: go_home())
     st.divider()
-    game["run"]()
+    heavy = f" ({', '.join(game['heavy'])})" if game.get("heavy") else ""
+    with st.spinner(f"Loading {game['name']}{heavy}..."), profiling.section("load_module"):
+        module = load_game_module(game["module"])
+    with profiling.section(f"{game['id']}.run"):
+        module.run()
 
 
 def go_home():
@@ -171,7 +132,15 @@ def go_home():
 # -----------------------
 # 🚀 APP ENTRY
 # -----------------------
-if st.session_state.active_game is None:
-    home_page()
-else:
-    game_page(st.session_state.active_game)
+active = st.session_state.active_game
+with profiling.recording(
+    "rerun",
+    enabled=st.session_state[profiling.SESSION_FLAG],
+    game=active["id"] if active else "home",
+) as rerun_profile:
+    if active is None:
+        home_page()
+    else:
+        game_page(active)
+
+profiling.render_panel(rerun_profile.result)
@@ -0,0 +1,178 @@
+"""Birthday Paradox Monte Carlo microbenchmark.
+
+Times the baseline game's trial loop (kept below verbatim: ``datetime``
+birthdays from ``random.randint``, one Python ``set`` per group) against
+``engine.count_matches`` (sort/diff on an int matrix) and checks that both
+match rates agree with the exact probability, so a speedup can't come from
+simulating something different.
+It then builds the probability-by-group-size curve both ways: the old fixed
+1000 trials per size, and ``engine.calculate_probabilities`` (shared
+batches, adaptive stop at a target CI width), reporting birthdays drawn,
+time, worst error against the exact curve and the widest 95% interval.
+Last, the analytic curve must give 1.0 for groups larger than the bucket
+count.
+
+    python -m benchmarks.birthday_bench
+    python -m benchmarks.birthday_bench --trials 10000000 --group 23 --group 50 --json birthday.json
+"""
+
+import argparse
+import datetime
+import json
+import math
+import random
+import sys
+import time
+
+import numpy as np
+
+from Games._02_Birthday_Paradox import calendars, engine
+from Games.common.rng import Rng
+
+# Legacy trials per run are capped; it is far slower and the rate is what matters.
+LEGACY_MAX = 200_000
+Z_LIMIT = 4.0  # standard errors from the exact probability before we call it a mismatch
+
+
+# ------------------ LEGACY ------------------
+# The baseline game's trial loop and helpers, verbatim; only the seeding of
+# ``random`` from the benchmark's Rng is added.
+def legacy_count_matches(group_size, trials, rng):
+    random.seed(rng.getrandbits(63))
+    return sum(
+        1 for _ in range(trials)
+        if getMatch(getBirthdays(group_size))
+    )
+
+
+def legacy_curve(a, b, rng):
+    random.seed(rng.getrandbits(63))
+    group_sizes = list(range(a, b))
+    probabilities = []
+    for group_size in group_sizes:
+        match_count = 0
+        for _ in range(1000):
+            if getMatch(getBirthdays(group_size)):
+                match_count += 1
+        probabilities.append(match_count / 1000)
+    return {"sizes": group_sizes, "values": probabilities}
+
+
+def getBirthdays(num):
+    start = datetime.date(2001, 1, 1)
+    birthdays = [start + datetime.timedelta(random.randint(0, 364)) for _ in range(num)]
+    return birthdays
+
+
+def getMatch(birthdays):
+    seen = set()
+    for b in birthdays:
+        if b in seen:
+            return b
+        seen.add(b)
+    return None
+
+
+def exact(group_size, days=engine.DAYS):
+    """P(at least two of ``group_size`` share a day)."""
+    p = 1.0
+    for i in range(group_size):
+        p *= (days - i) / days
+    return 1.0 - p
+
+
+# ------------------ MEASUREMENT ------------------
+def timed(count, group_size, trials, seed):
+    t0 = time.perf_counter()
+    matches = count(group_size, trials, Rng(seed))
+    return matches / trials, time.perf_counter() - t0
+
+
+def z_score(rate, p, trials):
+    return (rate - p) / math.sqrt(max(p * (1 - p), 1e-12) / trials)
+
+
+def bench(group_size, trials, seed):
+    p = exact(group_size)
+    legacy_trials = min(trials, LEGACY_MAX)
+    legacy_rate, legacy_s = timed(legacy_count_matches, group_size, legacy_trials, seed)
+    new_rate, new_s = timed(engine.count_matches, group_size, trials, seed)
+    legacy_tps, new_tps = legacy_trials / legacy_s, trials / new_s
+    return {
+        "group_size": group_size,
+        "trials": trials,
+        "exact": round(p, 6),
+        "legacy_rate": round(legacy_rate, 6),
+        "new_rate": round(new_rate, 6),
+        "legacy_trials_per_s": round(legacy_tps),
+        "new_trials_per_s": round(new_tps),
+        "new_seconds": round(new_s, 3),
+        "speedup": round(new_tps / legacy_tps, 1),
+        "legacy_z": round(z_score(legacy_rate, p, legacy_trials), 2),
+        "new_z": round(z_score(new_rate, p, trials), 2),
+    }
+
+
+def curve_bench(a, b, seed):
+    """Old fixed-1000-per-size curve vs the adaptive shared-batch one."""
+    sizes = range(a, b)
+    p = [exact(g) for g in sizes]
+    t0 = time.perf_counter()
+    old = legacy_curve(a, b, Rng(seed))
+    t1 = time.perf_counter()
+    new = engine.calculate_probabilities(a, b, Rng(seed))
+    t2 = time.perf_counter()
+    old_width = [2 * engine.Z * math.sqrt(v * (1 - v) / 1000) for v in p]
+    return {
+        "sizes": f"{a}-{b - 1}",
+        "legacy_draws": 1000 * sum(sizes),
+        "new_draws": new["draws"],
+        "legacy_seconds": round(t1 - t0, 3),
+        "new_seconds": round(t2 - t1, 3),
+        "legacy_max_error": round(max(abs(v - e) for v, e in zip(old["values"], p)), 4),
+        "new_max_error": round(max(abs(v - e) for v, e in zip(new["values"], p)), 4),
+        "legacy_max_ci": round(max(old_width), 4),
+        "new_max_ci": round(max(h - lo for h, lo in zip(new["high"], new["low"])), 4),
+    }
+
+
+def pigeonhole_check(bits=8):
+    """The exact analytic curve must be 1.0 (not NaN) once the group outgrows the buckets."""
+    sizes = [2 ** bits + 1, 300, 1000]
+    values = engine.analytic_probabilities(sizes, 2, calendars.hash_buckets(bits))
+    return bool(np.all(values == 1.0))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Birthday Paradox Monte Carlo microbenchmark.")
+    parser.add_argument("--trials", type=int, default=1_000_000)
+    parser.add_argument("--group", type=int, action="append", help="group size (repeatable)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--curve", type=int, nargs=2, default=(5, 70), metavar=("A", "B"),
+                        help="group-size range for the probability-curve comparison")
+    parser.add_argument("--json", help="write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    rows = [bench(g, args.trials, args.seed) for g in args.group or (10, 23, 50)]
+    print(f"{'group':>5} {'exact':>8} {'legacy':>8} {'new':>8} {'legacy/s':>11} "
+          f"{'new/s':>12} {'speedup':>8} {'z':>6}")
+    for row in rows:
+        print(f"{row['group_size']:>5} {row['exact']:>8.4f} {row['legacy_rate']:>8.4f} "
+              f"{row['new_rate']:>8.4f} {row['legacy_trials_per_s']:>11,} "
+              f"{row['new_trials_per_s']:>12,} {row['speedup']:>7}x {row['new_z']:>6}")
+    curve = curve_bench(*args.curve, args.seed)
+    print(f"\ncurve {curve['sizes']}: {'draws':>10} {'seconds':>8} {'max err':>8} {'max CI':>7}")
+    for who in ("legacy", "new"):
+        print(f"{who:>12}: {curve[who + '_draws']:>10,} {curve[who + '_seconds']:>8} "
+              f"{curve[who + '_max_error']:>8} {curve[who + '_max_ci']:>7}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"trials": rows, "curve": curve}, f, indent=2)
+    pigeonhole = pigeonhole_check()
+    print(f"\nanalytic, more items than buckets: {'ok' if pigeonhole else 'WRONG (not 1.0)'}")
+    bad = [r for r in rows if max(abs(r["legacy_z"]), abs(r["new_z"])) > Z_LIMIT]
+    return 1 if bad or not pigeonhole else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Bitmap Message rendering microbenchmark.
+
+Times the pre-template renderer (kept below verbatim: ``vary_color`` per
+cell, a ``<span>`` per character appended with ``+=``, and a second pass for
+the plain text) against ``Games._03_BitMap_Message.engine.render``, which
+writes the text in the same pass, on the game's bitmap tiled to larger
+sizes. The plain-text outputs are compared, so a speedup can't come from
+drawing something different, and the number
+of ``<span>`` elements each emits is reported. The PNG columns time
+``engine.rasterize`` plus a fast PNG encode of the same message.
+
+    python -m benchmarks.bitmap_bench
+    python -m benchmarks.bitmap_bench --tile 1 --tile 4 --tile 16 --json bitmap.json
+"""
+
+import argparse
+import io
+import json
+import random
+import sys
+import time
+
+from Games._03_BitMap_Message import engine
+from Games._03_BitMap_Message.main import bitmap as BITMAP
+from Games.common.images import encode_png
+from Games.common.rng import Rng
+
+MESSAGE = "Happy birthday, Bitmap Message! "
+
+
+# ------------------ LEGACY RENDERER ------------------
+def vary_color(hex_color):
+    """Create slight RGB variations for colorful effect"""
+    hex_color = hex_color.lstrip("#")
+    r = int(hex_color[0:2], 16)
+    g = int(hex_color[2:4], 16)
+    b = int(hex_color[4:6], 16)
+
+    r = min(255, max(0, r + random.randint(-40, 40)))
+    g = min(255, max(0, g + random.randint(-40, 40)))
+    b = min(255, max(0, b + random.randint(-40, 40)))
+
+    return f"rgb({r},{g},{b})"
+
+
+def legacy_render(message, bitmap, base_color):
+    message_index = 0
+    final_html = ""
+
+    for line in bitmap.splitlines():
+        line_html = ""
+        for c in line:
+            if c == "*":
+                ch = message[message_index % len(message)]
+                message_index += 1
+                color = vary_color(base_color)
+                line_html += f"<span style='color:{color}'>{ch}</span>"
+            else:
+                line_html += "&nbsp;"
+        final_html += line_html + "<br>"
+
+    text_only = ""
+    idx = 0
+    for line in bitmap.splitlines():
+        out = ""
+        for c in line:
+            if c == "*":
+                out += message[idx % len(message)]
+                idx += 1
+            else:
+                out += " "
+        text_only += out + "\n"
+    return final_html, text_only
+
+
+# ------------------ MEASUREMENT ------------------
+def tiled(tile):
+    """The game's bitmap repeated ``tile`` times across and down."""
+    lines = BITMAP.splitlines()
+    return "\n".join(line * tile for line in lines * tile)
+
+
+def bench(tile, repeat, seed):
+    bitmap = tiled(tile)
+    rng = Rng(seed)
+    engine.render(MESSAGE, bitmap, "#00FFAA", rng)  # warm-up; compiles the template once
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        legacy_html, legacy_text = legacy_render(MESSAGE, bitmap, "#00FFAA")
+    t1 = time.perf_counter()
+    for _ in range(repeat):
+        text_file = io.StringIO()
+        html_lines = engine.render(MESSAGE, bitmap, "#00FFAA", rng, text=text_file)
+        text = text_file.getvalue()
+    t2 = time.perf_counter()
+    for _ in range(repeat):
+        png = encode_png(engine.rasterize(MESSAGE, engine.compile_bitmap(bitmap)["mask"],
+                                          "#00FFAA", rng), "fast")
+    t3 = time.perf_counter()
+    new_html = "<br>".join(html_lines)
+    return {
+        "tile": tile,
+        "cells": engine.compile_bitmap(bitmap)["mask"].size,
+        "legacy_ms": round((t1 - t0) / repeat * 1000, 2),
+        "new_ms": round((t2 - t1) / repeat * 1000, 2),
+        "speedup": round((t1 - t0) / (t2 - t1), 1),
+        "legacy_spans": legacy_html.count("<span"),
+        "new_spans": new_html.count("<span"),
+        "legacy_kb": round(len(legacy_html) / 1024, 1),
+        "new_kb": round(len(new_html) / 1024, 1),
+        "png_ms": round((t3 - t2) / repeat * 1000, 2),
+        "png_kb": round(len(png) / 1024, 1),
+        "text_match": legacy_text == text,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bitmap Message rendering microbenchmark.")
+    parser.add_argument("--tile", type=int, action="append", help="tile factor (repeatable)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    rows = [bench(tile, args.repeat, args.seed) for tile in args.tile or (1, 4, 16)]
+    print(f"{'tile':>4} {'cells':>9} {'legacy ms':>10} {'new ms':>8} {'speedup':>8} "
+          f"{'spans':>15} {'KB':>15} {'png ms':>8} {'png KB':>7} {'text':>5}")
+    for row in rows:
+        print(f"{row['tile']:>4} {row['cells']:>9,} {row['legacy_ms']:>10} {row['new_ms']:>8} "
+              f"{row['speedup']:>7}x {row['legacy_spans']:>7,}->{row['new_spans']:<7,} "
+              f"{row['legacy_kb']:>7}->{row['new_kb']:<7} {row['png_ms']:>8} {row['png_kb']:>7} "
+              f"{'ok' if row['text_match'] else 'DIFF':>5}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+    return 0 if all(row["text_match"] for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""Blackjack card encoding microbenchmark.
+
+Times the string-card path (kept below verbatim: ``(rank, suit)`` tuples,
+``getHandValue`` re-parsing ranks with ``int()`` and rescanning the hand on
+every check) against the byte cards and incremental ``rules.Hand`` used by
+the game and ``simulator.py``:
+
+- every hand of up to ``--cards`` ranks is valued both ways, and they must
+  agree;
+- a dealer-style draw-to-17 loop is timed over the same card sequences;
+- whole rounds are played through the simulator both ways, reporting
+  hands/sec and both house-edge estimates, which must agree within
+  ``Z_LIMIT`` standard errors.
+
+It exits with status 1 on any disagreement.
+
+    python -m benchmarks.blackjack_bench
+    python -m benchmarks.blackjack_bench --hands 500000 --difficulty hard --json blackjack.json
+"""
+
+import argparse
+import itertools
+import json
+import math
+import sys
+import time
+
+from Games._04_BlackJack import rules, simulator
+from Games.common.rng import Rng
+from Games.common.state import sizeof
+
+Z_LIMIT = 4.0  # standard errors between the two house-edge estimates
+SEQUENCES = 200_000  # card sequences for the draw-to-17 loop
+
+
+# ------------------ LEGACY ------------------
+LEGACY_RANKS = tuple(str(rank) for rank in range(2, 11)) + ('J', 'Q', 'K', 'A')
+
+
+def legacy_deck():
+    return [(rank, suit) for suit in rules.SUITS for rank in LEGACY_RANKS]
+
+
+def getHandValue(cards):
+    value = 0
+    numberOfAces = 0
+    for card in cards:
+        rank = card[0]
+        if rank == 'A':
+            numberOfAces += 1
+        elif rank in ('K', 'Q', 'J'):
+            value += 10
+        else:
+            value += int(rank)
+    value += numberOfAces
+    for _ in range(numberOfAces):
+        if value + 10 <= 21:
+            value += 10
+    return value
+
+
+def is_soft(cards):
+    hard = sum(1 if rank == 'A' else 10 if rank in ('K', 'Q', 'J') else int(rank)
+               for rank, _ in cards)
+    return any(rank == 'A' for rank, _ in cards) and hard + 10 <= 21
+
+
+def card_value(card):
+    rank = card[0]
+    return 11 if rank == 'A' else 10 if rank in ('K', 'Q', 'J') else int(rank)
+
+
+def legacy_play_hand(rng, difficulty, decide, counts):
+    deck = legacy_deck()
+    dealer = [rules.draw(deck, rng), rules.draw(deck, rng)]
+    hand = [rules.draw(deck, rng), rules.draw(deck, rng)]
+    up = card_value(dealer[1])
+    bet = 1
+    while True:
+        value = getHandValue(hand)
+        if value >= 21:
+            break
+        action = decide(value, is_soft(hand), up, len(hand) == 2)
+        if action == "stand":
+            break
+        hand.append(rules.draw(deck, rng))
+        if action == "double":
+            bet = 2
+            counts["doubles"] += 1
+            break
+
+    value = getHandValue(hand)
+    counts["hands"] += 1
+    if value > 21:
+        counts["player_busts"] += 1
+        counts["losses"] += 1
+        return -bet
+
+    threshold = rules.dealer_threshold(difficulty, rng)
+    while getHandValue(dealer) < threshold:
+        dealer.append(rules.draw(deck, rng))
+    dealer_value = getHandValue(dealer)
+    counts["dealer_plays"] += 1
+    counts["dealer_busts"] += dealer_value > 21
+    outcome = rules.settle(value, dealer_value)
+    counts["wins" if outcome > 0 else "losses" if outcome < 0 else "ties"] += 1
+    return outcome * bet
+
+
+# ------------------ MEASUREMENT ------------------
+def encode(card):
+    """Byte for a legacy ``(rank, suit)`` card."""
+    rank, suit = card
+    return rules.SUITS.index(suit) << 4 | rules.RANKS.index(rank)
+
+
+def check_values(max_cards):
+    """Hands of up to ``max_cards`` ranks where ``Hand`` and ``getHandValue`` disagree."""
+    suit = rules.SUITS[0]
+    bad = 0
+    for n in range(1, max_cards + 1):
+        for ranks in itertools.combinations_with_replacement(LEGACY_RANKS, n):
+            cards = [(rank, suit) for rank in ranks]
+            hand = rules.Hand(encode(card) for card in cards)
+            bad += hand.value != getHandValue(cards) or hand.soft != is_soft(cards)
+    return bad
+
+
+def draw_loop(seed, sequences=SEQUENCES):
+    """Draw-to-17 over the same shuffled decks: legacy rescans vs ``Hand.add``."""
+    rng = Rng(seed)
+    decks = [rules.getDeck(rng)[:12] for _ in range(sequences)]
+    legacy = [[(rules.RANKS[c & 15], rules.SUITS[c >> 4]) for c in deck] for deck in decks]
+
+    t0 = time.perf_counter()
+    legacy_totals = []
+    for deck in legacy:
+        deck = list(deck)
+        hand = [deck.pop(), deck.pop()]
+        while getHandValue(hand) < 17:
+            hand.append(deck.pop())
+        legacy_totals.append(getHandValue(hand))
+    t1 = time.perf_counter()
+    new_totals = []
+    for deck in decks:
+        deck = deck[:]
+        hand = rules.Hand((deck.pop(), deck.pop()))
+        while hand.value < 17:
+            hand.add(deck.pop())
+        new_totals.append(hand.value)
+    t2 = time.perf_counter()
+    return {
+        "sequences": sequences,
+        "legacy_us": round((t1 - t0) / sequences * 1e6, 2),
+        "new_us": round((t2 - t1) / sequences * 1e6, 2),
+        "speedup": round((t1 - t0) / (t2 - t1), 1),
+        "match": legacy_totals == new_totals,
+    }
+
+
+def timed_rounds(play_hand, hands, difficulty, strategy_name, seed):
+    rng = Rng(seed)
+    decide = simulator.strategy(strategy_name)
+    counts = dict.fromkeys(simulator.COUNTS, 0)
+    net = net_sq = 0
+    t0 = time.perf_counter()
+    for _ in range(hands):
+        won = play_hand(rng, difficulty, decide, counts)
+        net += won
+        net_sq += won * won
+    elapsed = time.perf_counter() - t0
+    return simulator.summarize(dict(counts, net=net, net_sq=net_sq)), hands / elapsed
+
+
+def rounds_bench(hands, difficulty, strategy_name, seed):
+    legacy, legacy_hps = timed_rounds(legacy_play_hand, hands, difficulty, strategy_name, seed)
+    new, new_hps = timed_rounds(simulator.play_hand, hands, difficulty, strategy_name, seed + 1)
+    se = math.sqrt((legacy["variance"] + new["variance"]) / hands)
+    return {
+        "difficulty": difficulty,
+        "strategy": strategy_name,
+        "hands": hands,
+        "legacy_hands_per_s": round(legacy_hps),
+        "new_hands_per_s": round(new_hps),
+        "speedup": round(new_hps / legacy_hps, 1),
+        "legacy_edge": round(legacy["house_edge"], 5),
+        "new_edge": round(new["house_edge"], 5),
+        "z": round((new["house_edge"] - legacy["house_edge"]) / se, 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Blackjack card encoding microbenchmark.")
+    parser.add_argument("--hands", type=int, default=200_000)
+    parser.add_argument("--difficulty", action="append", choices=rules.DIFFICULTIES)
+    parser.add_argument("--strategy", default="basic")
+    parser.add_argument("--cards", type=int, default=5, help="check every hand up to this many cards")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    bad_values = check_values(args.cards)
+    print(f"hand values up to {args.cards} cards: {'ok' if not bad_values else f'{bad_values} DIFF'}")
+    print(f"deck: {sizeof(legacy_deck()):,} bytes as tuples, {sizeof(rules.DECK):,} as array('B')")
+
+    loop = draw_loop(args.seed)
+    print(f"draw to 17: {loop['legacy_us']} us -> {loop['new_us']} us per hand "
+          f"({loop['speedup']}x, totals {'ok' if loop['match'] else 'DIFF'})")
+
+    rows = [rounds_bench(args.hands, d, args.strategy, args.seed)
+            for d in args.difficulty or rules.DIFFICULTIES]
+    print(f"\n{'difficulty':<10} {'legacy/s':>10} {'new/s':>10} {'speedup':>8} "
+          f"{'legacy edge':>12} {'new edge':>9} {'z':>6}")
+    for row in rows:
+        print(f"{row['difficulty']:<10} {row['legacy_hands_per_s']:>10,} {row['new_hands_per_s']:>10,} "
+              f"{row['speedup']:>7}x {row['legacy_edge']:>+12.2%} {row['new_edge']:>+9.2%} "
+              f"{row['z']:>6}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"bad_values": bad_values, "draw_loop": loop, "rounds": rows}, f, indent=2)
+    bad = bad_values or not loop["match"] or any(abs(r["z"]) > Z_LIMIT for r in rows)
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""Per-game import-time and cold-start benchmark.
+
+Every ``Games._NN_*`` game module is imported in a fresh interpreter so the
+numbers include everything it drags in (streamlit, matplotlib, pandas, ...).
+For each module we record the import wall-clock, the whole process wall-clock
+(cold start), peak RSS and the transitive imports, then write a JSON and/or
+CSV report that can be diffed between releases.
+
+    python -m benchmarks.import_bench --json report.json --csv report.csv
+    python -m benchmarks.import_bench --check            # gate on budgets
+    python -m benchmarks.import_bench --compare old.json
+"""
+
+import argparse
+import csv
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GAMES_DIR = os.path.join(ROOT, "Games")
+BUDGETS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "import_budgets.json")
+
+# Runs inside the child interpreter. Prints one JSON line on stdout.
+PROBE = r"""
+import json, resource, sys, time
+before = set(sys.modules)
+t0 = time.perf_counter()
+if {module!r}:
+    __import__({module!r})
+import_ms = (time.perf_counter() - t0) * 1000
+new = sorted(set(sys.modules) - before)
+print(json.dumps({{
+    "import_ms": import_ms,
+    "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modules": new,
+}}))
+"""
+
+
+# ------------------ DISCOVERY ------------------
+def discover_game_modules():
+    """Return ``Games._NN_Name.main`` for every game package, in order."""
+    modules = []
+    for name in sorted(os.listdir(GAMES_DIR)):
+        if name.startswith("_") and name[1:3].isdigit():
+            if os.path.exists(os.path.join(GAMES_DIR, name, "main.py")):
+                modules.append(f"Games.{name}.main")
+    return modules
+
+
+# ------------------ MEASUREMENT ------------------
+def probe(module):
+    """Import ``module`` in a fresh interpreter and return the raw sample."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        error = proc.stderr.strip().splitlines()
+        return {"error": error[-1] if error else f"exit {proc.returncode}"}
+
+    sample = json.loads(proc.stdout.strip().splitlines()[-1])
+    sample["wall_ms"] = wall_ms
+    return sample
+
+
+def third_party(modules):
+    """Top-level non-stdlib packages among ``modules`` (the "heavy deps")."""
+    stdlib = set(sys.stdlib_module_names) | set(sys.builtin_module_names)
+    tops = {m.split(".")[0] for m in modules}
+    return sorted(t for t in tops if t not in stdlib and not t.startswith("_") and t != "Games")
+
+
+def measure(module, repeat):
+    """Median of ``repeat`` cold imports of ``module``."""
+    samples = [probe(module) for _ in range(repeat)]
+    errors = [s["error"] for s in samples if "error" in s]
+    if errors:
+        return {"module": module or "<interpreter>", "error": errors[0]}
+
+    modules = samples[-1]["modules"]
+    return {
+        "module": module or "<interpreter>",
+        "import_ms": round(statistics.median(s["import_ms"] for s in samples), 2),
+        "cold_start_ms": round(statistics.median(s["wall_ms"] for s in samples), 2),
+        "peak_rss_mb": round(statistics.median(s["peak_rss_kb"] for s in samples) / 1024, 2),
+        "n_imports": len(modules),
+        "third_party": third_party(modules),
+    }
+
+
+def run_suite(modules, repeat=3):
+    # The bare interpreter is the floor every other row should be read against.
+    rows = [measure("", repeat)]
+    for module in modules:
+        rows.append(measure(module, repeat))
+        print(_format_row(rows[-1]), file=sys.stderr)
+    return rows
+
+
+# ------------------ REPORTING ------------------
+def _format_row(row):
+    if "error" in row:
+        return f"{row['module']:<45} ERROR {row['error']}"
+    return (f"{row['module']:<45} import {row['import_ms']:>8.1f} ms  "
+            f"cold {row['cold_start_ms']:>8.1f} ms  rss {row['peak_rss_mb']:>7.1f} MB  "
+            f"{row['n_imports']:>5} modules  {' '.join(row['third_party'])}")
+
+
+def write_json(rows, path):
+    report = {
+        "python": sys.version.split()[0],
+        "generated": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "results": rows,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
+def write_csv(rows, path):
+    fields = ["module", "import_ms", "cold_start_ms", "peak_rss_mb", "n_imports",
+              "third_party", "error"]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for row in rows:
+            row = dict(row)
+            row["third_party"] = " ".join(row.get("third_party", []))
+            writer.writerow(row)
+
+
+def compare(rows, old_path):
+    """Print per-module deltas against a previous JSON report."""
+    with open(old_path, encoding="utf-8") as f:
+        old = {r["module"]: r for r in json.load(f)["results"]}
+    for row in rows:
+        prev = old.get(row["module"])
+        if not prev or "error" in row or "error" in prev:
+            continue
+        d_import = row["import_ms"] - prev["import_ms"]
+        d_rss = row["peak_rss_mb"] - prev["peak_rss_mb"]
+        print(f"{row['module']:<45} import {d_import:+8.1f} ms  rss {d_rss:+7.1f} MB")
+
+
+def check_budgets(rows, budgets_path=BUDGETS_FILE):
+    """Return a list of budget violations (empty when everything fits)."""
+    with open(budgets_path, encoding="utf-8") as f:
+        budgets = json.load(f)
+    default = budgets.get("default", {})
+    failures = []
+    for row in rows:
+        if "error" in row:
+            failures.append(f"{row['module']}: {row['error']}")
+            continue
+        budget = {**default, **budgets.get("modules", {}).get(row["module"], {})}
+        for metric, limit in budget.items():
+            if metric in row and row[metric] > limit:
+                failures.append(f"{row['module']}: {metric} {row[metric]} > budget {limit}")
+    return failures
+
+
+# ------------------ CLI ------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", help="modules to measure (default: every game)")
+    parser.add_argument("--repeat", type=int, default=3, help="cold imports per module (median is kept)")
+    parser.add_argument("--json", help="write the report as JSON")
+    parser.add_argument("--csv", help="write the report as CSV")
+    parser.add_argument("--compare", help="previous JSON report to diff against")
+    parser.add_argument("--check", action="store_true", help="exit non-zero if a budget is exceeded")
+    parser.add_argument("--budgets", default=BUDGETS_FILE, help="budget file used by --check")
+    args = parser.parse_args(argv)
+
+    rows = run_suite(args.modules or discover_game_modules(), repeat=args.repeat)
+
+    if args.json:
+        write_json(rows, args.json)
+    if args.csv:
+        write_csv(rows, args.csv)
+    if args.compare:
+        compare(rows, args.compare)
+    if args.check:
+        failures = check_budgets(rows, args.budgets)
+        for failure in failures:
+            print("OVER BUDGET", failure, file=sys.stderr)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
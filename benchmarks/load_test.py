@@ -0,0 +1,232 @@
+"""Concurrent-session load test for the arcade.
+
+Drives N simulated browser sessions against ``app.py`` in one process with
+Streamlit's ``AppTest`` (no server, no network), each session clicking
+through a scripted scenario. Every script run a session triggers is timed
+as one *rerun*; the report gives p50/p95/p99 rerun latency per scenario,
+reruns/sec across all sessions and the process's peak memory.
+
+    python -m benchmarks.load_test --sessions 8
+    python -m benchmarks.load_test --sessions 16 --scenario birthday --json load.json
+    python -m benchmarks.load_test --sessions 4 --repeat 3 --alloc
+
+Sessions share the process exactly as they would on a real server:
+``st.cache_resource`` entries, imported modules and the GIL.
+"""
+
+import argparse
+import json
+import os
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("STREAMLIT_BROWSER_GATHER_USAGE_STATS", "false")
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+
+
+# ------------------ SESSION DRIVER ------------------
+class Session:
+    """One simulated user. ``run``/``click`` rerun the script and time it."""
+
+    def __init__(self, timeout):
+        self.at = AppTest.from_file(APP, default_timeout=timeout)
+        self.samples = []
+
+    def run(self):
+        start = time.perf_counter()
+        self.at.run()
+        self.samples.append((time.perf_counter() - start) * 1000)
+        if self.at.exception:
+            raise RuntimeError(self.at.exception[0].message)
+        return self
+
+    def widget(self, kind, label, sidebar=False):
+        root = self.at.sidebar if sidebar else self.at
+        for element in getattr(root, kind):
+            if element.label == label:
+                return element
+        raise LookupError(f"no {kind} labelled {label!r}")
+
+    def click(self, label, sidebar=False):
+        self.widget("button", label, sidebar).click()
+        return self.run()
+
+    def open_game(self, game_id):
+        self.at.button(key=f"play_{game_id}").click()
+        return self.run()
+
+
+# ------------------ SCENARIOS ------------------
+def forest(session, ticks=20, interval=0.1):
+    """Start the Forest Fire auto-run and let it animate for ``ticks`` frames.
+
+    AppTest doesn't fire ``run_every`` fragments on its own, so each frame
+    is driven as a rerun after the animation interval has elapsed.
+    """
+    session.open_game("forest")
+    session.widget("selectbox", "Auto-run Speed", sidebar=True).set_value("Fast")
+    session.click("Start", sidebar=True)
+    for _ in range(ticks):
+        time.sleep(interval)
+        session.run()
+    session.click("Stop", sidebar=True)
+
+
+def birthday(session, simulations=100_000, poll=0.5, timeout=120):
+    """Run one 100k-trial Birthday Paradox simulation and wait for its result.
+
+    The trials run in the job pool; like the progress fragment in a browser,
+    the session reruns every ``poll`` seconds until the result is shown.
+    """
+    session.open_game("birthday")
+    session.widget("number_input", "🔁 Simulations to run").set_value(simulations)
+    session.click("▶ Run Simulation")
+    deadline = time.monotonic() + timeout
+    while any(key in session.at.session_state for key in ("simJob", "curveJob")):
+        if time.monotonic() > deadline:
+            raise TimeoutError("birthday job did not finish")
+        time.sleep(poll)
+        session.run()
+
+
+def hexgrid(session, repeats=12):
+    """Build a large HexGrid carpet and render its PNG."""
+    session.open_game("hexgrid")
+    session.widget("slider", "Horizontal Repeat").set_value(repeats)
+    session.widget("slider", "Vertical Repeat").set_value(repeats)
+    session.click("✅ Apply Changes")
+
+
+SCENARIOS = {"forest": forest, "birthday": birthday, "hexgrid": hexgrid}
+
+
+# ------------------ LOAD ------------------
+def percentile(samples, pct):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(samples):
+    return {
+        "reruns": len(samples),
+        "mean_ms": round(statistics.fmean(samples), 1) if samples else None,
+        **{f"p{p}_ms": round(percentile(samples, p), 1) if samples else None for p in (50, 95, 99)},
+        "max_ms": round(max(samples), 1) if samples else None,
+    }
+
+
+def run_session(scenario, repeat, timeout):
+    session = Session(timeout)
+    error = None
+    try:
+        session.run()
+        for _ in range(repeat):
+            SCENARIOS[scenario](session)
+            session.click("⬅ Back to Home")
+    except Exception as exc:  # keep the other sessions going; report it
+        error = f"{type(exc).__name__}: {exc}"
+    return scenario, session.samples, error
+
+
+def rss_mb():
+    """Peak resident set size of this process so far."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_load(sessions, scenarios, repeat=1, timeout=120, alloc=False):
+    """Run ``sessions`` concurrent sessions, assigned round-robin to ``scenarios``."""
+    if alloc:
+        tracemalloc.start()
+
+    # One warm-up session per scenario so imports and caches aren't billed to the
+    # run. A page that breaks here is reported like any other failure.
+    errors = []
+    for scenario in scenarios:
+        _, _, error = run_session(scenario, 1, timeout)
+        if error:
+            errors.append({"scenario": scenario, "phase": "warm-up", "error": error})
+    baseline_rss = rss_mb()
+
+    plan = [scenarios[i % len(scenarios)] for i in range(sessions)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions, thread_name_prefix="session") as pool:
+        results = list(pool.map(lambda s: run_session(s, repeat, timeout), plan))
+    wall = time.perf_counter() - start
+
+    per_scenario = {name: [] for name in scenarios}
+    for scenario, samples, error in results:
+        per_scenario[scenario].extend(samples)
+        if error:
+            errors.append({"scenario": scenario, "phase": "run", "error": error})
+    every = [ms for samples in per_scenario.values() for ms in samples]
+
+    report = {
+        "sessions": sessions,
+        "repeat": repeat,
+        "wall_s": round(wall, 2),
+        "throughput_rps": round(len(every) / wall, 1) if wall else None,
+        "overall": summarize(every),
+        "scenarios": {name: summarize(samples) for name, samples in per_scenario.items()},
+        "baseline_rss_mb": baseline_rss,
+        "peak_rss_mb": rss_mb(),
+        "errors": errors,
+    }
+    if alloc:
+        report["peak_traced_mb"] = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 1)
+        tracemalloc.stop()
+    return report
+
+
+# ------------------ OUTPUT ------------------
+def print_report(report):
+    print(f"{report['sessions']} sessions, {report['overall']['reruns']} reruns in "
+          f"{report['wall_s']}s -> {report['throughput_rps']} reruns/s")
+    print(f"{'scenario':<10} {'reruns':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, row in [*report["scenarios"].items(), ("overall", report["overall"])]:
+        print(f"{name:<10} {row['reruns']:>7} {row['p50_ms']!s:>9} {row['p95_ms']!s:>9} "
+              f"{row['p99_ms']!s:>9} {row['max_ms']!s:>9}")
+    memory = f"peak RSS {report['peak_rss_mb']} MB (after warm-up {report['baseline_rss_mb']} MB)"
+    if "peak_traced_mb" in report:
+        memory += f", peak traced {report['peak_traced_mb']} MB"
+    print(memory)
+    for error in report["errors"]:
+        phase = " warm-up" if error["phase"] == "warm-up" else ""
+        print(f"ERROR [{error['scenario']}{phase}] {error['error']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent-session load test (offline, AppTest).")
+    parser.add_argument("--sessions", type=int, default=4, help="concurrent sessions")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario(s) to run; sessions are spread round-robin (default: all)")
+    parser.add_argument("--repeat", type=int, default=1, help="scenario passes per session")
+    parser.add_argument("--timeout", type=float, default=120, help="per-rerun timeout in seconds")
+    parser.add_argument("--alloc", action="store_true", help="also report tracemalloc peak (slow)")
+    parser.add_argument("--json", help="write the report to this JSON file")
+    args = parser.parse_args(argv)
+
+    report = run_load(args.sessions, args.scenario or sorted(SCENARIOS),
+                      repeat=args.repeat, timeout=args.timeout, alloc=args.alloc)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
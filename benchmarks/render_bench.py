@@ -0,0 +1,200 @@
+"""Text-grid rendering microbenchmark.
+
+Replays a few hundred frames of Langton's Ant, Hungry Robots, Etching
+Drawer, Fish Tank and Hourglass, and times the pre-``TextGrid`` renderers
+(kept below verbatim, cell-by-cell ``+=``) against the current ones. Every
+frame's output is compared, so a speedup can't come from drawing something
+different.
+
+    python -m benchmarks.render_bench
+    python -m benchmarks.render_bench --frames 1000 --json render.json
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from Games.common.rng import Rng
+from Games.common.textgrid import TextGrid
+
+
+# ------------------ LEGACY RENDERERS ------------------
+def legacy_langton(game):
+    grid = game["grid"]
+    ants = game["ants"]
+    size = len(grid)
+    ant_positions = {(a["x"], a["y"]) for a in ants}
+    display = []
+    for y in range(size):
+        row = ""
+        for x in range(size):
+            if (x, y) in ant_positions:
+                row += "🐜"
+            else:
+                row += "⬛" if grid[y][x] else "⬜"
+        display.append(row)
+    return "\n".join(display)
+
+
+def legacy_robots(game, width, height, player_glyph, robot_glyph):
+    grid = ""
+    for y in range(height):
+        for x in range(width):
+            pos = (x, y)
+            if pos == game["player"]:
+                grid += player_glyph
+            elif pos in game["robots"]:
+                grid += robot_glyph
+            else:
+                grid += game["board"][pos]
+        grid += "\n"
+    return grid
+
+
+def legacy_etching(canvas, cx, cy, classify, width, height):
+    canvas_str = ''
+    for row in range(height):
+        for col in range(width):
+            if col == cx and row == cy:
+                canvas_str += '#'
+                continue
+            cell = canvas.get((col, row))
+            if cell is None:
+                canvas_str += ' '
+            else:
+                canvas_str += classify(cell)
+        canvas_str += '\n'
+    return canvas_str
+
+
+def legacy_join(grid):
+    return "\n".join("".join(row) for row in grid)
+
+
+# ------------------ SCENES ------------------
+# Each scene yields (legacy_render, new_render) pairs, one per frame, with the
+# model advanced between frames.
+def langton_frames(frames, rng):
+    from Games._38_Langtons_Ant import engine
+    from Games._38_Langtons_Ant.main import ANT, CELL_GLYPHS
+
+    game = engine.new_game(60, 3, rng)
+    view = TextGrid(CELL_GLYPHS)
+    for _ in range(frames):
+        for _ in range(5):
+            engine.step(game)
+        yield (lambda: legacy_langton(game),
+               lambda: view.render(game["grid"], {(a["x"], a["y"]): ANT for a in game["ants"]}))
+
+
+def robots_frames(frames, rng):
+    from Games._35_Hungry_Robots import engine
+    from Games._35_Hungry_Robots.main import PLAYER, ROBOT
+
+    game = engine.new_game(rng)
+    view = TextGrid()
+
+    def new():
+        board = game["board"]
+        rows = [[board[(x, y)] for x in range(engine.WIDTH)] for y in range(engine.HEIGHT)]
+        marks = dict.fromkeys(game["robots"], ROBOT)
+        marks[game["player"]] = PLAYER
+        return view.render(rows, marks) + "\n"
+
+    for _ in range(frames):
+        if game["over"]:
+            game = engine.new_game(rng)
+        engine.step(game, rng, move=rng.choice(engine.MOVES))
+        yield lambda: legacy_robots(game, engine.WIDTH, engine.HEIGHT, PLAYER, ROBOT), new
+
+
+def etching_frames(frames, rng):
+    from Games._21_Etching_drawer import main as etching
+
+    canvas, cursor = {}, (0, 0)
+    view = TextGrid(etching.MASK_GLYPHS)
+    for _ in range(frames):
+        cursor = etching.apply_move(canvas, *cursor, rng.choice("WASD"))
+        yield (lambda: legacy_etching(canvas, *cursor, etching.classify,
+                                      etching.CANVAS_WIDTH, etching.CANVAS_HEIGHT),
+               lambda: etching.get_canvas_string(canvas, *cursor, view))
+
+
+def fish_frames(frames, rng):
+    from Games._25_Fish_Tank import engine
+
+    tank = engine.new_tank()
+    tank["fishes"] = [engine.generate_fish(rng) for _ in range(10)]
+    tank["crabs"] = [engine.generate_crab(rng) for _ in range(3)]
+    tank["kelps"] = [engine.generate_kelp(rng) for _ in range(6)]
+    view = TextGrid()
+    for _ in range(frames):
+        engine.simulate(tank, rng)
+        yield lambda: engine.draw_frame(tank), lambda: engine.draw_frame(tank, view)
+
+
+def hourglass_frames(frames, rng):
+    from Games._34_HourGlass import main as hourglass
+
+    grid = hourglass.create_hourglass()
+    view = TextGrid()
+    for _ in range(frames):
+        if not hourglass.step(grid, rng):
+            grid = hourglass.create_hourglass()
+        yield lambda: legacy_join(grid), lambda: hourglass.render(grid, view)
+
+
+SCENES = {
+    "langton": langton_frames,
+    "robots": robots_frames,
+    "etching": etching_frames,
+    "fish": fish_frames,
+    "hourglass": hourglass_frames,
+}
+
+
+# ------------------ MEASUREMENT ------------------
+def bench(scene, frames, seed):
+    legacy_s = new_s = 0.0
+    mismatches = 0
+    for legacy, new in SCENES[scene](frames, Rng(seed)):
+        t0 = time.perf_counter()
+        expected = legacy()
+        t1 = time.perf_counter()
+        got = new()
+        t2 = time.perf_counter()
+        legacy_s += t1 - t0
+        new_s += t2 - t1
+        mismatches += expected != got
+    return {
+        "scene": scene,
+        "frames": frames,
+        "legacy_fps": round(frames / legacy_s, 1),
+        "new_fps": round(frames / new_s, 1),
+        "speedup": round(legacy_s / new_s, 2),
+        "mismatches": mismatches,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Text-grid renderer microbenchmark.")
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--scene", action="append", choices=sorted(SCENES))
+    parser.add_argument("--json", help="write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    rows = [bench(scene, args.frames, args.seed) for scene in args.scene or SCENES]
+    print(f"{'scene':<10} {'legacy fps':>11} {'new fps':>11} {'speedup':>8} {'mismatch':>9}")
+    for row in rows:
+        print(f"{row['scene']:<10} {row['legacy_fps']:>11} {row['new_fps']:>11} "
+              f"{row['speedup']:>7}x {row['mismatches']:>9}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+    return 1 if any(row["mismatches"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())